@@ -11,7 +11,7 @@ import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, TYPE_CHECKING, Iterable
+from typing import Dict, List, Optional, TYPE_CHECKING, Iterable, Iterator
 
 from fastapi import HTTPException
 
@@ -286,9 +286,9 @@ class AccountManager:
         # ，
         return True
 
-    def get_cooldown_info(self) -> tuple[int, str | None]:
+    def get_cooldown_info(self, now: Optional[float] = None) -> tuple[int, str | None]:
         """（）"""
-        current_time = time.time()
+        current_time = now if now is not None else time.time()
 
         # （）
         max_quota_remaining = 0
@@ -326,7 +326,18 @@ class AccountManager:
         # ，Normal
         return (0, None)
 
-    def get_quota_status(self) -> Dict[str, any]:
+    def get_status(self) -> str:
+        """Status ringkas akun untuk statistik: active / failed / rate_limited / idle"""
+        cooldown_seconds, cooldown_reason = self.get_cooldown_info()
+        if cooldown_seconds > 0 and cooldown_reason and "cooldown" in cooldown_reason:
+            return "rate_limited"
+        if self.config.is_expired():
+            return "failed"
+        if self.config.disabled:
+            return "idle"
+        return "active"
+
+    def get_quota_status(self, now: Optional[float] = None) -> Dict[str, any]:
         """
         （）
 
@@ -354,7 +365,7 @@ class AccountManager:
                 "is_expired": True
             }
 
-        current_time = time.time()
+        current_time = now if now is not None else time.time()
 
         quotas = {}
         limited_count = 0
@@ -407,6 +418,30 @@ class AccountManager:
             "is_expired": False
         }
 
+    def snapshot(self, now: Optional[float] = None) -> dict:
+        """Ringkasan status akun untuk admin (satu timestamp untuk semua field)"""
+        if now is None:
+            now = time.time()
+        config = self.config
+        remaining_hours = config.get_remaining_hours()
+        status, _, remaining_display = format_account_expiration(remaining_hours)
+        cooldown_seconds, cooldown_reason = self.get_cooldown_info(now)
+        return {
+            "id": config.account_id,
+            "status": status,
+            "expires_at": config.expires_at or "",
+            "remaining_hours": remaining_hours,
+            "remaining_display": remaining_display,
+            "is_available": self.is_available,
+            "failure_count": self.failure_count,
+            "disabled": config.disabled,
+            "cooldown_seconds": cooldown_seconds,
+            "cooldown_reason": cooldown_reason,
+            "conversation_count": self.conversation_count,
+            "session_usage_count": self.session_usage_count,
+            "quota_status": self.get_quota_status(now)
+        }
+
 
 class MultiAccountManager:
     """"""
@@ -540,24 +575,21 @@ class MultiAccountManager:
             2. is_expired() → （）
             3. are_quotas_available() → （）
         """
-        available = []
-
-        for acc in self.accounts.values():
-            # 1. 
-            if acc.config.disabled:
-                continue
+        return [acc for acc in self.accounts.values() if self._is_account_usable(acc, required_quota_types)]
 
-            # 2. 
-            if acc.config.is_expired():
-                continue
-
-            # 3. （）
-            if not acc.are_quotas_available(required_quota_types):
-                continue
+    @staticmethod
+    def _is_account_usable(acc: AccountManager, required_quota_types: Optional[Iterable[str]] = None) -> bool:
+        """Cek lengkap ketersediaan satu akun (disabled, kedaluwarsa, kuota)"""
+        # 1. 
+        if acc.config.disabled:
+            return False
 
-            available.append(acc)
+        # 2. 
+        if acc.config.is_expired():
+            return False
 
-        return available
+        # 3. （）
+        return acc.are_quotas_available(required_quota_types)
 
     async def get_account(
         self,
@@ -599,13 +631,20 @@ class MultiAccountManager:
             raise HTTPException(503, "No available accounts")
 
         # 
+        index = self._next_rotation_index(len(available_accounts))
+        return self._select_account(available_accounts, index, req_tag)
+
+    def _next_rotation_index(self, account_count: int) -> int:
+        """Index round-robin berikutnya untuk daftar akun tersedia sepanjang account_count"""
         with self._counter_lock:
-            if len(available_accounts) != self._last_account_count:
+            if account_count != self._last_account_count:
                 self._request_counter = random.randint(0, 999999)
-                self._last_account_count = len(available_accounts)
-            index = self._request_counter % len(available_accounts)
+                self._last_account_count = account_count
+            index = self._request_counter % account_count
             self._request_counter += 1
+        return index
 
+    def _select_account(self, available_accounts: List[AccountManager], index: int, req_tag: str) -> AccountManager:
         selected = available_accounts[index]
         selected.session_usage_count += 1
 
@@ -613,6 +652,32 @@ class MultiAccountManager:
                     f"(: {index}/{len(available_accounts)}, : {selected.session_usage_count})")
         return selected
 
+    def iter_available_accounts(
+        self,
+        required_quota_types: Optional[Iterable[str]] = None,
+        request_id: str = "",
+        available_accounts: Optional[List[AccountManager]] = None
+    ) -> Iterator[AccountManager]:
+        """Iterasi akun tersedia dalam urutan round-robin untuk Retry satu permintaan
+
+        Daftar akun hanya difilter sekali (atau pakai available_accounts dari pemanggil);
+        setiap akun dikembalikan paling banyak sekali, dan akun yang dinonaktifkan,
+        kedaluwarsa, atau masuk cooldown setelah daftar dibuat akan dilewati.
+        """
+        req_tag = f"[req_{request_id}] " if request_id else ""
+        if available_accounts is None:
+            available_accounts = self.get_available_accounts(required_quota_types)
+        if not available_accounts:
+            return
+
+        count = len(available_accounts)
+        start = self._next_rotation_index(count)
+        for offset in range(count):
+            index = (start + offset) % count
+            if not self._is_account_usable(available_accounts[index], required_quota_types):
+                continue
+            yield self._select_account(available_accounts, index, req_tag)
+
 
 # ----------  ----------
 
@@ -1014,6 +1079,36 @@ def save_account_cooldown_state_sync(account_id: str, account_mgr: AccountManage
         return False
 
 
+async def save_account_cooldown_states(account_ids: List[str], multi_account_mgr: MultiAccountManager) -> int:
+    """Simpan status cooldown beberapa akun dalam satu transaksi (batch)"""
+    if not storage.is_database_enabled():
+        return 0
+
+    updates = []
+    for account_id in account_ids:
+        account_mgr = multi_account_mgr.accounts.get(account_id)
+        if account_mgr is None:
+            continue
+        updates.append((account_id, {
+            "quota_cooldowns": dict(account_mgr.quota_cooldowns),
+            "conversation_count": account_mgr.conversation_count,
+            "failure_count": account_mgr.failure_count,
+        }))
+
+    if not updates:
+        return 0
+
+    try:
+        success_count, missing = await storage.bulk_update_accounts_cooldown(updates)
+    except Exception as e:
+        logger.error(f"[COOLDOWN] Gagal simpan batch cooldown: {e}")
+        return 0
+
+    if missing:
+        logger.warning(f"[COOLDOWN] {len(missing)} akun tidak ditemukan: {missing[:5]}")
+    return success_count
+
+
 async def save_all_cooldown_states(multi_account_mgr: MultiAccountManager) -> int:
     """（：）"""
     if not storage.is_database_enabled():
@@ -32,6 +32,34 @@ class StatsDatabase:
 
         await asyncio.to_thread(_insert)
 
+    async def insert_request_logs_bulk(self, records: list):
+        """Insert banyak record request dalam satu transaksi"""
+        if not records:
+            return
+
+        rows = [
+            (
+                int(record["timestamp"]), record["model"], record.get("ttfb_ms"),
+                record.get("total_ms"), record.get("status", "success"), record.get("status_code")
+            )
+            for record in records
+        ]
+
+        def _insert():
+            conn = _get_sqlite_conn()
+            with _sqlite_lock:
+                conn.executemany(
+                    """
+                    INSERT INTO request_logs
+                    (timestamp, model, ttfb_ms, total_ms, status, status_code)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    rows
+                )
+                conn.commit()
+
+        await asyncio.to_thread(_insert)
+
     async def get_stats_by_time_range(self, time_range: str = "24h") -> Dict:
         """Ambil data statistik berdasarkan rentang waktu"""
         def _query():
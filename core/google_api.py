@@ -22,25 +22,30 @@ logger = logging.getLogger(__name__)
 GEMINI_API_BASE = "https://biz-discoveryengine.googleapis.com/v1alpha"
 
 
+# Header statis, dibangun sekali; per permintaan hanya authorization/user-agent
+_COMMON_HEADERS = {
+    "accept": "*/*",
+    "accept-encoding": "gzip, deflate, br, zstd",
+    "accept-language": "zh-CN,zh;q=0.9,en;q=0.8",
+    "content-type": "application/json",
+    "origin": "https://business.gemini.google",
+    "referer": "https://business.gemini.google/",
+    "x-server-timeout": "1800",
+    "sec-ch-ua": '"Chromium";v="124", "Google Chrome";v="124", "Not-A.Brand";v="99"',
+    "sec-ch-ua-mobile": "?0",
+    "sec-ch-ua-platform": '"Windows"',
+    "sec-fetch-dest": "empty",
+    "sec-fetch-mode": "cors",
+    "sec-fetch-site": "cross-site",
+}
+
+
 def get_common_headers(jwt: str, user_agent: str) -> dict:
     """Generate"""
-    return {
-        "accept": "*/*",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "zh-CN,zh;q=0.9,en;q=0.8",
-        "authorization": f"Bearer {jwt}",
-        "content-type": "application/json",
-        "origin": "https://business.gemini.google",
-        "referer": "https://business.gemini.google/",
-        "user-agent": user_agent,
-        "x-server-timeout": "1800",
-        "sec-ch-ua": '"Chromium";v="124", "Google Chrome";v="124", "Not-A.Brand";v="99"',
-        "sec-ch-ua-mobile": "?0",
-        "sec-ch-ua-platform": '"Windows"',
-        "sec-fetch-dest": "empty",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-site": "cross-site",
-    }
+    headers = _COMMON_HEADERS.copy()
+    headers["authorization"] = f"Bearer {jwt}"
+    headers["user-agent"] = user_agent
+    return headers
 
 
 async def make_request_with_jwt_retry(
@@ -4,12 +4,12 @@ PesanParse、EkstrakdanGenerate
 """
 import asyncio
 import base64
-import hashlib
 import logging
 import re
 from typing import List, TYPE_CHECKING
 
 import httpx
+import xxhash
 
 if TYPE_CHECKING:
     from main import Message
@@ -33,8 +33,13 @@ def get_conversation_key(messages: List[dict], client_identifier: str = "") -> s
     if not messages:
         return f"{client_identifier}:empty" if client_identifier else "empty"
 
+    # xxh3 cukup untuk kunci cache (non-kriptografis), update bertahap tanpa gabung string
+    hasher = xxhash.xxh3_64()
+    if client_identifier:
+        hasher.update(client_identifier.encode())
+        hasher.update(b"\x1e")
+
     # Ekstrak3PesanInfo（+Konten）
-    message_fingerprints = []
     for msg in messages[:3]:  # 3
         role = msg.get("role", "")
         content = msg.get("content", "")
@@ -46,18 +51,13 @@ def get_conversation_key(messages: List[dict], client_identifier: str = "") -> s
         else:
             text = str(content)
 
-        # ：Kosong，
-        text = text.strip().lower()
-
-        # danKonten
-        message_fingerprints.append(f"{role}:{text}")
-
-    # 3Pesan+ClientGenerate
-    conversation_prefix = "|".join(message_fingerprints)
-    if client_identifier:
-        conversation_prefix = f"{client_identifier}|{conversation_prefix}"
+        # ：Kosong，danKonten
+        hasher.update(role.encode())
+        hasher.update(b"\0")
+        hasher.update(text.strip().lower().encode())
+        hasher.update(b"\x1e")
 
-    return hashlib.md5(conversation_prefix.encode()).hexdigest()
+    return hasher.hexdigest()
 
 
 def extract_text_from_content(content) -> str:
@@ -139,7 +139,7 @@ async def parse_last_message(messages: List['Message'], http_client: httpx.Async
 
 def build_full_context_text(messages: List['Message']) -> str:
     """，Saat"""
-    prompt = ""
+    parts = []
     for msg in messages:
         role = "User" if msg.role in ["user", "system"] else "Assistant"
         content_str = extract_text_from_content(msg.content)
@@ -150,5 +150,5 @@ def build_full_context_text(messages: List['Message']) -> str:
             if image_count > 0:
                 content_str += "[]" * image_count
 
-        prompt += f"{role}: {content_str}\n\n"
-    return prompt
+        parts.append(f"{role}: {content_str}\n\n")
+    return "".join(parts)
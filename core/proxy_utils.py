@@ -18,6 +18,7 @@ from urllib.parse import urlparse
 import functools
 
 
+@functools.lru_cache(maxsize=8)
 def parse_proxy_setting(proxy_str: str) -> Tuple[str, str]:
     """
     ParseSetString，Ekstrak URL dan NO_PROXY List
@@ -16,6 +16,7 @@ import threading
 import time
 from typing import Optional
 
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -877,7 +878,7 @@ async def _load_kv(table_name: str, key: str) -> Optional[dict]:
             return None
         value = row["value"]
         if isinstance(value, str):
-            return json.loads(value)
+            return orjson.loads(value)
         return value
 
     if backend == "sqlite":
@@ -891,14 +892,15 @@ async def _load_kv(table_name: str, key: str) -> Optional[dict]:
             return None
         value = row["value"]
         if isinstance(value, str):
-            return json.loads(value)
+            return orjson.loads(value)
         return value
     return None
 
 
 async def _save_kv(table_name: str, key: str, value: dict) -> bool:
     backend = _get_backend()
-    payload = json.dumps(value, ensure_ascii=False)
+    # orjson: bytes UTF-8 langsung (setara ensure_ascii=False), jauh lebih cepat untuk stats besar
+    payload = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
     if backend == "postgres":
         pool = await _get_pool()
         async with pool.acquire() as conn:
@@ -1248,6 +1250,30 @@ async def get_generator_domains(active_only: bool = True) -> list:
     return ["yourdomain.com"]
 
 
+async def get_generator_domains_with_status() -> list[tuple[str, bool]]:
+    """Ambil semua domain generator.email beserta status aktif dalam satu query"""
+    if not is_database_enabled():
+        return [("yourdomain.com", True)]
+
+    backend = _get_backend()
+    try:
+        if backend == "postgres":
+            pool = await _get_pool()
+            async with pool.acquire() as conn:
+                rows = await conn.fetch("SELECT domain, is_active FROM generator_email_domains ORDER BY id")
+            return [(row["domain"], bool(row["is_active"])) for row in rows]
+
+        if backend == "sqlite":
+            conn = _get_sqlite_conn()
+            with _sqlite_lock:
+                rows = conn.execute("SELECT domain, is_active FROM generator_email_domains ORDER BY id").fetchall()
+            return [(row["domain"], bool(row["is_active"])) for row in rows]
+    except Exception as e:
+        logger.error(f"[STORAGE] Get generator domains failed: {e}")
+
+    return [("yourdomain.com", True)]
+
+
 def add_generator_domain_sync(domain: str) -> bool:
     """Sync version - tambah domain"""
     return _run_in_db_loop(add_generator_domain(domain))
@@ -1266,3 +1292,8 @@ def toggle_generator_domain_sync(domain: str, is_active: bool) -> bool:
 def get_generator_domains_sync(active_only: bool = True) -> list:
     """Sync version - ambil list domain"""
     return _run_in_db_loop(get_generator_domains(active_only))
+
+
+def get_generator_domains_with_status_sync() -> list[tuple[str, bool]]:
+    """Sync version - ambil domain beserta status"""
+    return _run_in_db_loop(get_generator_domains_with_status())
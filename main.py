@@ -1,20 +1,25 @@
-import json, time, os, asyncio, uuid, ssl, re, yaml, base64
+import time, os, asyncio, uuid, ssl, re, yaml, base64, functools, heapq
+from operator import itemgetter
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Union, Dict, Any
+from typing import AsyncIterator, Callable, List, Optional, Union, Dict, Any
 from pathlib import Path
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 import logging
 from dotenv import load_dotenv
 
 import httpx
+import certifi
+import orjson
 import aiofiles
-from fastapi import FastAPI, HTTPException, Header, Request, Body, Form
+from fastapi import FastAPI, HTTPException, Header, Request, Body, Form, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, JSONResponse, FileResponse
+from fastapi.responses import StreamingResponse, JSONResponse, FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
-from util.streaming_parser import parse_json_array_stream_async
-from collections import deque
+from util.streaming_parser import parse_json_array_stream_async, buffered_async_iter
+from collections import deque, defaultdict, Counter, OrderedDict
+import itertools
+from itertools import islice
 from threading import Lock
 from core.database import stats_db
 
@@ -57,7 +62,6 @@ from core.account import (
     MultiAccountManager,
     RetryPolicy,
     CooldownConfig,
-    format_account_expiration,
     load_multi_account_config,
     load_accounts_from_source,
     reload_accounts as _reload_accounts,
@@ -86,11 +90,22 @@ MODEL_TO_QUOTA_TYPE = {
 
 # ---------- Konfigurasi Logging ----------
 
-# Buffer log memori (simpan 1000 log terakhir, hapus setelah restart)
-log_buffer = deque(maxlen=1000)
+# Buffer log memori (ring buffer: simpan 1000 log terakhir, hapus setelah restart)
+LOG_BUFFER_MAX = 1000
+log_buffer = deque(maxlen=LOG_BUFFER_MAX)
 log_lock = Lock()
 
+# Statistik log inkremental (diperbarui saat append/evict, dilindungi log_lock)
+LOG_ERROR_LEVELS = ("ERROR", "CRITICAL")
+LOG_CHAT_MARKER = "menerima permintaan"
+log_stats = {
+    "by_level": Counter(),
+    "chat_count": 0,
+    "recent_errors": deque(maxlen=10),
+}
+
 # Persistensi data statistik
+RECENT_CONVERSATIONS_MAX = 60
 stats_lock = asyncio.Lock()  # Async lock
 
 async def load_stats():
@@ -128,6 +143,13 @@ async def load_stats():
         data["failure_timestamps"] = deque(data["failure_timestamps"], maxlen=10000)
     if isinstance(data.get("rate_limit_timestamps"), list):
         data["rate_limit_timestamps"] = deque(data["rate_limit_timestamps"], maxlen=10000)
+    if isinstance(data.get("recent_conversations"), list):
+        data["recent_conversations"] = deque(data["recent_conversations"], maxlen=RECENT_CONVERSATIONS_MAX)
+    if isinstance(data.get("response_times"), list):
+        data["response_times"] = deque(data["response_times"], maxlen=10000)
+    if isinstance(data.get("visitor_ips"), dict):
+        # urut waktu kunjungan agar pembersihan 24 jam cukup pop dari depan
+        data["visitor_ips"] = OrderedDict(sorted(data["visitor_ips"].items(), key=itemgetter(1)))
 
     return data
 
@@ -164,15 +186,31 @@ global_stats = {
     "model_request_timestamps": {},
     "failure_timestamps": deque(maxlen=10000),
     "rate_limit_timestamps": deque(maxlen=10000),
-    "visitor_ips": {},
+    "visitor_ips": OrderedDict(),
     "account_conversations": {},
     "account_failures": {},
-    "recent_conversations": []
+    "recent_conversations": deque(maxlen=RECENT_CONVERSATIONS_MAX),
+    "response_times": deque(maxlen=10000)
 }
 
+# Antrian tulis log request ke database (diproses batch oleh stats_writer_task)
+STATS_WRITE_BATCH = 256
+STATS_WRITE_WINDOW_SECONDS = 0.05
+
+# Simpan statistik digabung (debounce) agar tidak menulis per permintaan
+SAVE_STATS_DEBOUNCE_SECONDS = 0.5
+_save_stats_pending = asyncio.Event()
+stats_write_queue: asyncio.Queue = asyncio.Queue(maxsize=10000)
+
 # Riwayat task (storage memori, hapus setelah restart)
 task_history = deque(maxlen=100)  # Maksimal 100 history
 task_history_lock = Lock()
+_task_history_loaded = False
+
+
+def _preview(text: str, limit: int = 500, suffix: str = "...(terpotong)") -> str:
+    """Potong teks untuk log; teks pendek dikembalikan tanpa alokasi baru"""
+    return text if len(text) <= limit else f"{text[:limit]}{suffix}"
 
 
 def get_beijing_time_str(ts: Optional[float] = None) -> str:
@@ -225,21 +263,32 @@ def _persist_task_history() -> None:
         logger.warning(f"[HISTORY] Persist task history failed: {exc}")
 
 
-def _load_task_history() -> None:
-    """Load riwayat task dari database (mode database saja)."""
+def _load_task_history() -> bool:
+    """Load riwayat task dari database (mode database saja); False jika gagal dibaca."""
     if not storage.is_database_enabled():
-        return
+        return True
     try:
         history = storage.load_task_history_sync(limit=100)
         if not isinstance(history, list):
-            return
+            return False
         with task_history_lock:
             task_history.clear()
             for entry in history:
                 if isinstance(entry, dict):
                     task_history.append(entry)
+        return True
     except Exception as exc:
         logger.warning(f"[HISTORY] Load task history failed: {exc}")
+        return False
+
+
+def _ensure_task_history_loaded() -> None:
+    """Load riwayat task sekali saja; setelah itu memori adalah sumber utama."""
+    global _task_history_loaded
+    if _task_history_loaded:
+        return
+    # gagal load (DB sementara down) → coba lagi di panggilan berikutnya
+    _task_history_loaded = _load_task_history()
 
 
 def build_recent_conversation_entry(
@@ -313,12 +362,41 @@ class MemoryLogHandler(logging.Handler):
         # Konversi ke waktu Jakarta (UTC+7)
         beijing_tz = timezone(timedelta(hours=8))
         beijing_time = datetime.fromtimestamp(record.created, tz=beijing_tz)
+        entry = {
+            "time": beijing_time.strftime("%Y-%m-%d %H:%M:%S"),
+            "level": record.levelname,
+            "message": record.getMessage(),
+            "ts": record.created,  # epoch, untuk sort tanpa strptime
+        }
         with log_lock:
-            log_buffer.append({
-                "time": beijing_time.strftime("%Y-%m-%d %H:%M:%S"),
-                "level": record.levelname,
-                "message": record.getMessage()
-            })
+            if len(log_buffer) == LOG_BUFFER_MAX:
+                _forget_log_stats(log_buffer[0])
+            log_buffer.append(entry)
+            log_stats["by_level"][entry["level"]] += 1
+            if entry["level"] in LOG_ERROR_LEVELS:
+                log_stats["recent_errors"].append(entry)
+            if LOG_CHAT_MARKER in entry["message"]:
+                log_stats["chat_count"] += 1
+
+
+def _forget_log_stats(evicted: dict) -> None:
+    """Kurangi statistik untuk log yang dikeluarkan dari ring buffer (panggil dengan log_lock)"""
+    by_level = log_stats["by_level"]
+    by_level[evicted["level"]] -= 1
+    if by_level[evicted["level"]] <= 0:
+        del by_level[evicted["level"]]
+    recent_errors = log_stats["recent_errors"]
+    if recent_errors and recent_errors[0] is evicted:
+        recent_errors.popleft()
+    if LOG_CHAT_MARKER in evicted["message"]:
+        log_stats["chat_count"] -= 1
+
+
+def _reset_log_stats() -> None:
+    """Reset statistik log (panggil dengan log_lock)"""
+    log_stats["by_level"].clear()
+    log_stats["recent_errors"].clear()
+    log_stats["chat_count"] = 0
 
 # Konfigurasi logging
 logging.basicConfig(
@@ -328,7 +406,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger("gemini")
 
-_load_task_history()
+_ensure_task_history_loaded()
 
 # ---------- Linux zombie process reaper ----------
 # DrissionPage / Chromium may spawn subprocesses that exit without being waited on,
@@ -392,8 +470,8 @@ VIRTUAL_MODELS = {
     "gemini-veo": {"videoGenerationSpec": {}},
 }
 
-def get_tools_spec(model_name: str) -> dict:
-    """Kembalikan konfigurasi tool berdasarkan nama model"""
+def build_tools_spec(model_name: str, image_generation: bool) -> dict:
+    """Kembalikan konfigurasi tool berdasarkan nama model dan status generasi gambar"""
     # Model virtual
     if model_name in VIRTUAL_MODELS:
         return VIRTUAL_MODELS[model_name]
@@ -404,7 +482,7 @@ def get_tools_spec(model_name: str) -> dict:
         "toolRegistry": "default_tool_registry",
     }
     
-    if IMAGE_GENERATION_ENABLED and model_name in IMAGE_GENERATION_MODELS:
+    if image_generation:
         tools_spec["imageGenerationSpec"] = {}
     
     return tools_spec
@@ -415,13 +493,15 @@ MAX_ACCOUNT_SWITCH_TRIES = config.retry.max_account_switch_tries
 SESSION_CACHE_TTL_SECONDS = config.retry.session_cache_ttl_seconds
 AUTO_REFRESH_ACCOUNTS_SECONDS = config.retry.auto_refresh_accounts_seconds
 
+@functools.lru_cache(maxsize=8)
+def _retry_policy_for(text: int, images: int, videos: int) -> RetryPolicy:
+    return RetryPolicy(cooldowns=CooldownConfig(text=text, images=images, videos=videos))
+
 def build_retry_policy() -> RetryPolicy:
-    return RetryPolicy(
-        cooldowns=CooldownConfig(
-            text=config.retry.text_rate_limit_cooldown_seconds,
-            images=config.retry.images_rate_limit_cooldown_seconds,
-            videos=config.retry.videos_rate_limit_cooldown_seconds,
-        ),
+    return _retry_policy_for(
+        config.retry.text_rate_limit_cooldown_seconds,
+        config.retry.images_rate_limit_cooldown_seconds,
+        config.retry.videos_rate_limit_cooldown_seconds,
     )
 
 RETRY_POLICY = build_retry_policy()
@@ -435,48 +515,44 @@ MODEL_MAPPING = {
     "gemini-3-pro-preview": "gemini-3-pro-preview"
 }
 
+# Semua model yang didukung (dihitung sekali saat load)
+ALL_MODEL_IDS = tuple(MODEL_MAPPING) + tuple(VIRTUAL_MODELS)
+_ALL_MODEL_ID_SET = frozenset(ALL_MODEL_IDS)
+
 # ---------- HTTP Client ----------
-# Client untuk operasi chat (dapatkan JWT, buat session, kirim pesan)
-http_client = httpx.AsyncClient(
-    proxy=(PROXY_FOR_CHAT or None),
-    verify=False,
-    http2=False,
-    timeout=httpx.Timeout(TIMEOUT_SECONDS, connect=60.0),
-    limits=httpx.Limits(
-        max_keepalive_connections=100,
-        max_connections=200
+def _make_client(proxy: str) -> httpx.AsyncClient:
+    """Buat httpx.AsyncClient dengan konfigurasi koneksi standar"""
+    return httpx.AsyncClient(
+        proxy=(proxy or None),
+        verify=certifi.where(),
+        http2=True,
+        timeout=httpx.Timeout(TIMEOUT_SECONDS, connect=60.0),
+        limits=httpx.Limits(
+            max_keepalive_connections=100,
+            max_connections=200
+        )
     )
-)
+
+# Client untuk operasi chat (dapatkan JWT, buat session, kirim pesan)
+http_client = _make_client(PROXY_FOR_CHAT)
 
 # Client untuk streaming chat responses
-http_client_chat = httpx.AsyncClient(
-    proxy=(PROXY_FOR_CHAT or None),
-    verify=False,
-    http2=False,
-    timeout=httpx.Timeout(TIMEOUT_SECONDS, connect=60.0),
-    limits=httpx.Limits(
-        max_keepalive_connections=100,
-        max_connections=200
-    )
-)
+http_client_chat = _make_client(PROXY_FOR_CHAT)
 
 # Client untuk operasi akun (registrasi/login/refresh)
-http_client_auth = httpx.AsyncClient(
-    proxy=(PROXY_FOR_AUTH or None),
-    verify=False,
-    http2=False,
-    timeout=httpx.Timeout(TIMEOUT_SECONDS, connect=60.0),
-    limits=httpx.Limits(
-        max_keepalive_connections=100,
-        max_connections=200
-    )
-)
+http_client_auth = _make_client(PROXY_FOR_AUTH)
 
 # Print proxyKonfigurasi logging
 logger.info(f"[PROXY] Account operations (register/login/refresh): {PROXY_FOR_AUTH if PROXY_FOR_AUTH else 'disabled'}")
 logger.info(f"[PROXY] Chat operations (JWT/session/messages): {PROXY_FOR_CHAT if PROXY_FOR_CHAT else 'disabled'}")
 
 # ---------- Fungsi Utility ----------
+# Counter 24-bit untuk ID permintaan log (6 digit hex, cukup untuk korelasi log)
+_req_seq = itertools.count(int(time.time()) & 0xFFFFFF)
+
+def next_request_id() -> str:
+    return format(next(_req_seq) & 0xFFFFFF, "06x")
+
 def get_base_url(request: Request) -> str:
     """Dapatkan base URL lengkap (prioritas ENV, atau auto-detect dari request)"""
     # Prioritas gunakan environment variable
@@ -617,15 +693,17 @@ async def lifespan(app: FastAPI):
     # STARTUP
     # Loading statistik
     global_stats = await load_stats()
-    global_stats.setdefault("request_timestamps", [])
+    global_stats.setdefault("request_timestamps", deque(maxlen=20000))
+    global_stats.setdefault("visitor_ips", OrderedDict())
     global_stats.setdefault("model_request_timestamps", {})
-    global_stats.setdefault("failure_timestamps", [])
-    global_stats.setdefault("rate_limit_timestamps", [])
-    global_stats.setdefault("recent_conversations", [])
+    global_stats.setdefault("failure_timestamps", deque(maxlen=10000))
+    global_stats.setdefault("rate_limit_timestamps", deque(maxlen=10000))
+    global_stats.setdefault("recent_conversations", deque(maxlen=RECENT_CONVERSATIONS_MAX))
     global_stats.setdefault("success_count", 0)
     global_stats.setdefault("failed_count", 0)
     global_stats.setdefault("account_conversations", {})
     global_stats.setdefault("account_failures", {})
+    global_stats.setdefault("response_times", deque(maxlen=10000))
     uptime_tracker.configure_storage(os.path.join(DATA_DIR, "uptime.json"))
     uptime_tracker.load_heartbeats()
     for account_id, account_mgr in multi_account_mgr.accounts.items():
@@ -638,6 +716,10 @@ async def lifespan(app: FastAPI):
     asyncio.create_task(multi_account_mgr.start_background_cleanup())
     logger.info("[SYSTEM] Task pembersihan cache dimulai (interval: 5 menit)")
 
+    stats_writer = asyncio.create_task(stats_writer_task())
+    stats_persister = asyncio.create_task(stats_persist_task())
+    logger.info("[SYSTEM] Task penulis statistik dimulai (batch maks %d)", STATS_WRITE_BATCH)
+
     asyncio.create_task(cleanup_database_task())
     logger.info("[SYSTEM] Task pembersihan database dimulai (harian, simpan 30 hari)")
 
@@ -665,6 +747,15 @@ async def lifespan(app: FastAPI):
     yield  # Aplikasi berjalan
     
     # SHUTDOWN
+    # tunggu kedua task benar-benar berhenti agar tidak ada batch yang ditulis bersamaan dengan flush
+    stats_writer.cancel()
+    stats_persister.cancel()
+    for task in (stats_writer, stats_persister):
+        with suppress(asyncio.CancelledError):
+            await task
+    await _flush_stats_write_queue()
+    await save_stats(global_stats)
+
     if storage.is_database_enabled():
         try:
             success_count = await account.save_all_cooldown_states(multi_account_mgr)
@@ -673,7 +764,7 @@ async def lifespan(app: FastAPI):
             logger.error(f"[SYSTEM] Gagal menyimpan cooldown saat shutdown: {e}")
 
 # ---------- OpenAI kompatibel API ----------
-app = FastAPI(title="Gemini-Business OpenAI Gateway", lifespan=lifespan)
+app = FastAPI(title="Gemini-Business OpenAI Gateway", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 frontend_origin = os.getenv("FRONTEND_ORIGIN", "").strip()
 allow_all_origins = os.getenv("ALLOW_ALL_ORIGINS", "0") == "1"
@@ -823,35 +914,110 @@ async def save_cooldown_states_task():
             logger.error(f"[COOLDOWN] berkalaGagal simpan: {e}")
 
 
+def enqueue_request_log(record: dict) -> None:
+    """Masukkan log request ke antrian tulis (tanpa menunggu I/O)"""
+    try:
+        stats_write_queue.put_nowait(record)
+    except asyncio.QueueFull:
+        logger.warning("[STATS] Antrian tulis statistik penuh, log request dibuang")
+
+
+async def _write_stats_batch(batch: list) -> None:
+    try:
+        await stats_db.insert_request_logs_bulk(batch)
+    except Exception as e:
+        logger.error(f"[STATS] Gagal tulis batch log request: {e}")
+    request_save_stats()
+
+
+async def _flush_stats_write_queue() -> None:
+    """Tulis semua log request yang tersisa di antrian (dipakai saat shutdown)"""
+    batch = []
+    while not stats_write_queue.empty():
+        batch.append(stats_write_queue.get_nowait())
+    if batch:
+        await _write_stats_batch(batch)
+
+
+def request_save_stats() -> None:
+    """Tandai statistik perlu disimpan (digabung oleh stats_persist_task)"""
+    _save_stats_pending.set()
+
+
+async def stats_persist_task():
+    """Simpan statistik paling banyak sekali per SAVE_STATS_DEBOUNCE_SECONDS"""
+    while True:
+        try:
+            await _save_stats_pending.wait()
+            await asyncio.sleep(SAVE_STATS_DEBOUNCE_SECONDS)
+            _save_stats_pending.clear()
+            await save_stats(global_stats)
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.error(f"[STATS] Task simpan statistik error: {e}")
+
+
+async def stats_writer_task():
+    """Tulis log request ke database secara batch dan simpan statistik"""
+    batch = []  # di luar try: log yang sudah diambil dari antrian tidak hilang saat task dibatalkan
+    while True:
+        try:
+            batch.append(await stats_write_queue.get())
+            # kumpulkan log lain dalam jendela singkat agar satu batch = satu round-trip;
+            # satu sleep lalu get_nowait (wait_for di sekitar get() bisa menelan item di Python < 3.12)
+            await asyncio.sleep(STATS_WRITE_WINDOW_SECONDS)
+            while len(batch) < STATS_WRITE_BATCH:
+                try:
+                    batch.append(stats_write_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            pending, batch = batch, []
+            await _write_stats_batch(pending)
+        except asyncio.CancelledError:
+            # shutdown di tengah jendela: tulis dulu log yang sudah dikumpulkan
+            if batch:
+                await _write_stats_batch(batch)
+            break
+        except Exception as e:
+            logger.error(f"[STATS] Task penulis statistik error: {e}")
+
+
 async def cleanup_database_task():
     """bersihkandatabasekedaluwarsajumlah"""
     while True:
         try:
-            await asyncio.sleep(24 * 3600)  # setiapharijalankan satukali
+            # jadwalkan ke batas hari berikutnya (waktu absolut, tidak drift)
+            now = time.time()
+            next_run = (int(now // 86400) + 1) * 86400
+            await asyncio.sleep(next_run - now)
             deleted_count = await stats_db.cleanup_old_data(days=30)
             logger.info(f"[DATABASE] bersihkan {deleted_count} kedaluwarsajumlah（30hari）")
         except Exception as e:
             logger.error(f"[DATABASE] bersihkanjumlahGagal: {e}")
 
 # ---------- loganonimfungsi ----------
+# Regex dikompilasi sekali di level modul
+_REQ_ID_RE = re.compile(r'\[req_([a-z0-9]+)\]')
+_REQ_MODEL_RE = re.compile(r'menerima permintaan: ([^ |]+)')
+_REQ_MSG_COUNT_RE = re.compile(r'(\d+) pesan')
+_REQ_DURATION_RE = re.compile(r'Respons selesai: ([\d.]+)detik')
+
 def get_sanitized_logs(limit: int = 100) -> list:
     """ambilanonimlogdaftar，sesuai permintaanIDekstrakkuncievent"""
     with log_lock:
-        logs = list(log_buffer)
+        logs = log_buffer.copy()
 
     # sesuai permintaanID（format：[req_xxx]dan）
-    request_logs = {}
+    request_logs = defaultdict(list)
     orphan_logs = []  # tidak adarequest_idlog（misalnya pilih akun）
 
     for log in logs:
         message = log["message"]
-        req_match = re.search(r'\[req_([a-z0-9]+)\]', message)
+        req_match = _REQ_ID_RE.search(message) if '[req_' in message else None
 
         if req_match:
-            request_id = req_match.group(1)
-            if request_id not in request_logs:
-                request_logs[request_id] = []
-            request_logs[request_id].append(log)
+            request_logs[req_match.group(1)].append(log)
         else:
             # tidak adarequest_idlog（misalnya pilih akun），
             orphan_logs.append(log)
@@ -878,8 +1044,12 @@ def get_sanitized_logs(limit: int = 100) -> list:
             request_logs[closest_request_id].insert(0, orphan)
 
     # setiappermintaanekstrakkuncievent
+    # log_buffer urut waktu: proses permintaan terbaru lebih dulu dan berhenti setelah limit
     sanitized = []
-    for request_id, req_logs in request_logs.items():
+    for request_id in reversed(request_logs):
+        if len(sanitized) >= limit:
+            break
+        req_logs = request_logs[request_id]
         # kunciInfo
         model = None
         message_count = None
@@ -894,10 +1064,10 @@ def get_sanitized_logs(limit: int = 100) -> list:
 
             # ekstrakmodelnamadanpesanjumlah（mulai percakapan）
             if 'menerima permintaan:' in message and not model:
-                model_match = re.search(r'menerima permintaan: ([^ |]+)', message)
+                model_match = _REQ_MODEL_RE.search(message)
                 if model_match:
                     model = model_match.group(1)
-                count_match = re.search(r'(\d+) pesan', message)
+                count_match = _REQ_MSG_COUNT_RE.search(message)
                 if count_match:
                     message_count = int(count_match.group(1))
 
@@ -911,7 +1081,7 @@ def get_sanitized_logs(limit: int = 100) -> list:
 
             # ekstrakRespons selesai（ - BerhasildiError）
             if 'Respons selesai:' in message:
-                time_match = re.search(r'Respons selesai: ([\d.]+)detik', message)
+                time_match = _REQ_DURATION_RE.search(message)
                 if time_match:
                     duration = time_match.group(1) + 's'
                     final_status = "success"
@@ -1030,13 +1200,14 @@ def get_sanitized_logs(limit: int = 100) -> list:
         sanitized.append({
             "request_id": request_id,
             "start_time": start_time,
+            "start_ts": req_logs[0].get("ts", 0.0),
             "status": final_status,
             "events": events
         })
 
-    # waktubatasjumlah
+    # waktubatasjumlah（sort stabil, input sudah hampir terurut menurun）
     sanitized.sort(key=lambda x: x["start_time"], reverse=True)
-    return sanitized[:limit]
+    return sanitized
 
 class Message(BaseModel):
     role: str
@@ -1059,21 +1230,87 @@ class ImageGenerationRequest(BaseModel):
     quality: Optional[str] = "standard"  # "standard" or "hd"
     style: Optional[str] = "natural"  # "natural" or "vivid"
 
-def create_chunk(id: str, created: int, model: str, delta: dict, finish_reason: Union[str, None]) -> str:
-    chunk = {
-        "id": id,
-        "object": "chat.completion.chunk",
-        "created": created,
-        "model": model,
-        "choices": [{
-            "index": 0,
-            "delta": delta,
-            "logprobs": None,  # OpenAI field standar
-            "finish_reason": finish_reason
-        }],
-        "system_fingerprint": None  # OpenAI field standar（）
-    }
-    return json.dumps(chunk)
+# Frame SSE chunk: envelope (id/created/model) diserialisasi sekali per permintaan,
+# per token hanya delta yang di-dump orjson lalu disambung sebagai bytes
+_CHUNK_TAIL = b',"logprobs":null,"finish_reason":null}],"system_fingerprint":null}\n\n'
+_CHUNK_TAIL_STOP = b',"logprobs":null,"finish_reason":"stop"}],"system_fingerprint":null}\n\n'
+SSE_DONE = b"data: [DONE]\n\n"
+
+def make_chunk_encoder(id: str, created: int, model: str) -> Callable[..., bytes]:
+    """Kembalikan encoder (delta, finish_reason) -> frame SSE bytes untuk satu permintaan"""
+    envelope = orjson.dumps({"id": id, "object": "chat.completion.chunk", "created": int(created), "model": model})
+    prefix = b"data: " + envelope[:-1] + b',"choices":[{"index":0,"delta":'
+    dumps = orjson.dumps
+
+    def encode(delta: dict, finish_reason: Union[str, None] = None) -> bytes:
+        # satu join = satu alokasi frame (tanpa bytes perantara dari rantai +)
+        if finish_reason is None:
+            return b"".join((prefix, dumps(delta), _CHUNK_TAIL))
+        if finish_reason == "stop":
+            return b"".join((prefix, dumps(delta), _CHUNK_TAIL_STOP))
+        return (prefix + dumps(delta) + b',"logprobs":null,"finish_reason":' + dumps(finish_reason)
+                + b'}],"system_fingerprint":null}\n\n')
+
+    return encode
+
+
+def _passthrough_delta(delta: dict, finish_reason: Union[str, None] = None) -> dict:
+    """Mode non-stream: kembalikan delta apa adanya, tanpa encode/parse ulang SSE"""
+    return delta
+
+
+SSE_COALESCE_MAX_BYTES = 8192
+SSE_COALESCE_QUEUE_SIZE = 64
+_SSE_END = object()
+
+
+async def coalesce_sse(frames: AsyncIterator[bytes], max_bytes: int = SSE_COALESCE_MAX_BYTES) -> AsyncIterator[bytes]:
+    """Gabungkan frame SSE yang sudah siap menjadi satu send (tanpa menambah delay)
+
+    Generator sumber dijalankan di satu task pompa; selagi klien sedang menulis,
+    frame yang menumpuk di antrean digabung sampai max_bytes lalu dikirim sekaligus.
+    Frame besar (mis. markdown gambar) langsung lewat karena melampaui batas.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=SSE_COALESCE_QUEUE_SIZE)
+
+    async def pump():
+        try:
+            async for frame in frames:
+                await queue.put(frame)
+            await queue.put(_SSE_END)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.put(e)
+
+    pump_task = asyncio.create_task(pump())
+    try:
+        while True:
+            item = await queue.get()
+            batch = []
+            size = 0
+            while item is not _SSE_END and not isinstance(item, Exception):
+                batch.append(item)
+                size += len(item)
+                if size >= max_bytes or queue.empty():
+                    item = None
+                    break
+                item = queue.get_nowait()
+            if batch:
+                yield b"".join(batch)
+            if item is _SSE_END:
+                return
+            if isinstance(item, Exception):
+                raise item
+    finally:
+        # klien putus / selesai: tunggu pompa berhenti lalu tutup generator upstream di task ini
+        pump_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await pump_task
+        aclose = getattr(frames, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
 # ---------- Auth endpoints (API) ----------
 
 @app.post("/login")
@@ -1106,32 +1343,9 @@ async def admin_stats(request: Request, time_range: str = "24h"):
     Args:
         time_range: waktu "24h", "7d", "30d"
     """
-    now = time.time()
-
-    active_accounts = 0
-    failed_accounts = 0
-    rate_limited_accounts = 0
-    idle_accounts = 0
-
-    for account_manager in multi_account_mgr.accounts.values():
-        config = account_manager.config
-        cooldown_seconds, cooldown_reason = account_manager.get_cooldown_info()
-
-        # akunstatus
-        is_expired = config.is_expired()
-        is_manual_disabled = config.disabled
-        is_rate_limited = cooldown_seconds > 0 and cooldown_reason and "cooldown" in cooldown_reason
-        is_failed = is_expired
-        is_active = (not is_failed) and (not is_manual_disabled) and (not is_rate_limited)
-
-        if is_rate_limited:
-            rate_limited_accounts += 1
-        elif is_failed:
-            failed_accounts += 1
-        elif is_active:
-            active_accounts += 1
-        else:
-            idle_accounts += 1
+    status_counts = Counter(
+        account_manager.get_status() for account_manager in multi_account_mgr.accounts.values()
+    )
 
     total_accounts = len(multi_account_mgr.accounts)
 
@@ -1141,10 +1355,10 @@ async def admin_stats(request: Request, time_range: str = "24h"):
 
     return {
         "total_accounts": total_accounts,
-        "active_accounts": active_accounts,
-        "failed_accounts": failed_accounts,
-        "rate_limited_accounts": rate_limited_accounts,
-        "idle_accounts": idle_accounts,
+        "active_accounts": status_counts["active"],
+        "failed_accounts": status_counts["failed"],
+        "rate_limited_accounts": status_counts["rate_limited"],
+        "idle_accounts": status_counts["idle"],
         "success_count": success_count,
         "failed_count": failed_count,
         "trend": trend_data
@@ -1154,29 +1368,10 @@ async def admin_stats(request: Request, time_range: str = "24h"):
 @require_login()
 async def admin_get_accounts(request: Request):
     """ambilakunstatusInfo"""
-    accounts_info = []
-    for account_id, account_manager in multi_account_mgr.accounts.items():
-        config = account_manager.config
-        remaining_hours = config.get_remaining_hours()
-        status, status_color, remaining_display = format_account_expiration(remaining_hours)
-        cooldown_seconds, cooldown_reason = account_manager.get_cooldown_info()
-        quota_status = account_manager.get_quota_status()
-
-        accounts_info.append({
-            "id": config.account_id,
-            "status": status,
-            "expires_at": config.expires_at or "",
-            "remaining_hours": remaining_hours,
-            "remaining_display": remaining_display,
-            "is_available": account_manager.is_available,
-            "failure_count": account_manager.failure_count,
-            "disabled": config.disabled,
-            "cooldown_seconds": cooldown_seconds,
-            "cooldown_reason": cooldown_reason,
-            "conversation_count": account_manager.conversation_count,
-            "session_usage_count": account_manager.session_usage_count,
-            "quota_status": quota_status  # kuotastatus
-        })
+    now = time.time()
+    accounts_info = [
+        account_manager.snapshot(now) for account_manager in multi_account_mgr.accounts.values()
+    ]
 
     return {"total": len(accounts_info), "accounts": accounts_info}
 
@@ -1399,6 +1594,8 @@ async def admin_bulk_enable_accounts(request: Request, account_ids: list[str]):
         if account_id in multi_account_mgr.accounts:
             account_mgr = multi_account_mgr.accounts[account_id]
             account_mgr.quota_cooldowns = {}
+    # Simpancooldownstatusdatabase（satu transaksi untuk semua akun）
+    await account.save_account_cooldown_states(account_ids, multi_account_mgr)
     return {"status": "success", "success_count": success_count, "errors": errors}
 
 @app.put("/admin/accounts/bulk-disable")
@@ -1409,13 +1606,23 @@ async def admin_bulk_disable_accounts(request: Request, account_ids: list[str]):
     success_count, errors = _bulk_update_account_disabled_status(
         account_ids, True, multi_account_mgr
     )
+    await account.save_account_cooldown_states(account_ids, multi_account_mgr)
     return {"status": "success", "success_count": success_count, "errors": errors}
 
 # ---------- Auth endpoints (API) ----------
+# Cache JSON pengaturan (di-reset saat admin_update_settings)
+_settings_cache_bytes: Optional[bytes] = None
+
 @app.get("/admin/settings")
 @require_login()
 async def admin_get_settings(request: Request):
     """Dapatkan pengaturan sistem"""
+    global _settings_cache_bytes
+    if _settings_cache_bytes is None:
+        _settings_cache_bytes = orjson.dumps(_build_settings_payload())
+    return Response(content=_settings_cache_bytes, media_type="application/json")
+
+def _build_settings_payload() -> dict:
     return {
         "basic": {
             "api_key": config.basic.api_key,
@@ -1464,6 +1671,7 @@ async def admin_update_settings(request: Request, new_settings: dict = Body(...)
     global RETRY_POLICY
     global SESSION_CACHE_TTL_SECONDS, AUTO_REFRESH_ACCOUNTS_SECONDS
     global SESSION_EXPIRE_HOURS, multi_account_mgr, http_client, http_client_chat, http_client_auth
+    global _settings_cache_bytes
 
     try:
         basic = dict(new_settings.get("basic") or {})
@@ -1511,6 +1719,7 @@ async def admin_update_settings(request: Request, new_settings: dict = Body(...)
 
         # perbaruikonfigurasi
         config_manager.reload()
+        _settings_cache_bytes = None
 
         # perbaruivariabel global（）
         API_KEY = config.basic.api_key
@@ -1532,56 +1741,24 @@ async def admin_update_settings(request: Request, new_settings: dict = Body(...)
         AUTO_REFRESH_ACCOUNTS_SECONDS = config.retry.auto_refresh_accounts_seconds
         SESSION_EXPIRE_HOURS = config.session.expire_hours
 
-        # cek HTTP Client（perubahan）
-        if old_proxy_for_auth != PROXY_FOR_AUTH or old_proxy_for_chat != PROXY_FOR_CHAT:
-            logger.info(f"[CONFIG] Proxy configuration changed, rebuilding HTTP clients")
+        # cek HTTP Client（hanya bangun ulang client yang proxy-nya berubah）
+        if old_proxy_for_chat != PROXY_FOR_CHAT:
+            logger.info(f"[CONFIG] Chat proxy changed, rebuilding chat HTTP clients")
             await http_client.aclose()
             await http_client_chat.aclose()
-            await http_client_auth.aclose()
-
-            # ulang
-            http_client = httpx.AsyncClient(
-                proxy=(PROXY_FOR_CHAT or None),
-                verify=False,
-                http2=False,
-                timeout=httpx.Timeout(TIMEOUT_SECONDS, connect=60.0),
-                limits=httpx.Limits(
-                    max_keepalive_connections=100,
-                    max_connections=200
-                )
-            )
-
-            # ulang
-            http_client_chat = httpx.AsyncClient(
-                proxy=(PROXY_FOR_CHAT or None),
-                verify=False,
-                http2=False,
-                timeout=httpx.Timeout(TIMEOUT_SECONDS, connect=60.0),
-                limits=httpx.Limits(
-                    max_keepalive_connections=100,
-                    max_connections=200
-                )
-            )
-
-            # ulangakun
-            http_client_auth = httpx.AsyncClient(
-                proxy=(PROXY_FOR_AUTH or None),
-                verify=False,
-                http2=False,
-                timeout=httpx.Timeout(TIMEOUT_SECONDS, connect=60.0),
-                limits=httpx.Limits(
-                    max_keepalive_connections=100,
-                    max_connections=200
-                )
-            )
-
-            # Konfigurasi proxy
-            logger.info(f"[PROXY] Account operations (register/login/refresh): {PROXY_FOR_AUTH if PROXY_FOR_AUTH else 'disabled'}")
+            http_client = _make_client(PROXY_FOR_CHAT)
+            http_client_chat = _make_client(PROXY_FOR_CHAT)
             logger.info(f"[PROXY] Chat operations (JWT/session/messages): {PROXY_FOR_CHAT if PROXY_FOR_CHAT else 'disabled'}")
 
             # perbaruiakun http_client （）
             multi_account_mgr.update_http_client(http_client)
 
+        if old_proxy_for_auth != PROXY_FOR_AUTH:
+            logger.info(f"[CONFIG] Auth proxy changed, rebuilding account HTTP client")
+            await http_client_auth.aclose()
+            http_client_auth = _make_client(PROXY_FOR_AUTH)
+            logger.info(f"[PROXY] Account operations (register/login/refresh): {PROXY_FOR_AUTH if PROXY_FOR_AUTH else 'disabled'}")
+
             # perbarui/loginlayanan http_client （akun）
             if register_service:
                 register_service.http_client = http_client_auth
@@ -1613,51 +1790,59 @@ async def admin_update_settings(request: Request, new_settings: dict = Body(...)
         logger.error(f"[CONFIG] perbaruiGagal: {str(e)}")
         raise HTTPException(500, f"perbaruiGagal: {str(e)}")
 
+def _log_matches(log: dict, level: Optional[str], search_lower: Optional[str],
+                 start_time: Optional[str], end_time: Optional[str]) -> bool:
+    """Cek apakah satu entri log cocok dengan filter admin"""
+    if level and log["level"] != level:
+        return False
+    if search_lower and search_lower not in log["message"].lower():
+        return False
+    if start_time and log["time"] < start_time:
+        return False
+    if end_time and log["time"] > end_time:
+        return False
+    return True
+
 @app.get("/admin/log")
 @require_login()
 async def admin_get_logs(
     request: Request,
     limit: int = 300,
+    skip: int = 0,
     level: str = None,
     search: str = None,
     start_time: str = None,
     end_time: str = None
 ):
-    with log_lock:
-        logs = list(log_buffer)
-
-    stats_by_level = {}
-    error_logs = []
-    chat_count = 0
-    for log in logs:
-        level_name = log.get("level", "INFO")
-        stats_by_level[level_name] = stats_by_level.get(level_name, 0) + 1
-        if level_name in ["ERROR", "CRITICAL"]:
-            error_logs.append(log)
-        if "menerima permintaan" in log.get("message", ""):
-            chat_count += 1
-
     if level:
         level = level.upper()
-        logs = [log for log in logs if log["level"] == level]
-    if search:
-        logs = [log for log in logs if search.lower() in log["message"].lower()]
-    if start_time:
-        logs = [log for log in logs if log["time"] >= start_time]
-    if end_time:
-        logs = [log for log in logs if log["time"] <= end_time]
+    search_lower = search.lower() if search else None
+    limit = max(min(limit, LOG_BUFFER_MAX), 0)
+    skip = max(skip, 0)
 
-    limit = min(limit, log_buffer.maxlen)
-    filtered_logs = logs[-limit:]
+    with log_lock:
+        # satu pass dari log terbaru, lewati `skip` yang cocok lalu berhenti setelah limit (hanya hasil yang disalin)
+        filtered_logs = list(islice(
+            (log for log in reversed(log_buffer)
+             if _log_matches(log, level, search_lower, start_time, end_time)),
+            skip, skip + limit
+        ))
+        total_logs = len(log_buffer)
+        stats_by_level = {name: count for name, count in log_stats["by_level"].items() if count > 0}
+        error_count = sum(log_stats["by_level"][name] for name in LOG_ERROR_LEVELS)
+        recent_errors = list(log_stats["recent_errors"])
+        chat_count = log_stats["chat_count"]
+    filtered_logs.reverse()
 
     return {
         "total": len(filtered_logs),
         "limit": limit,
+        "skip": skip,
         "filters": {"level": level, "search": search, "start_time": start_time, "end_time": end_time},
         "logs": filtered_logs,
         "stats": {
-            "memory": {"total": len(log_buffer), "by_level": stats_by_level, "capacity": log_buffer.maxlen},
-            "errors": {"count": len(error_logs), "recent": error_logs[-10:]},
+            "memory": {"total": total_logs, "by_level": stats_by_level, "capacity": LOG_BUFFER_MAX},
+            "errors": {"count": error_count, "recent": recent_errors},
             "chat_count": chat_count
         }
     }
@@ -1670,6 +1855,7 @@ async def admin_clear_logs(request: Request, confirm: str = None):
     with log_lock:
         cleared_count = len(log_buffer)
         log_buffer.clear()
+        _reset_log_stats()
     logger.info("[LOG] Log sudah dihapus")
     return {"status": "success", "message": "sudahlog", "cleared_count": cleared_count}
 
@@ -1678,26 +1864,16 @@ async def admin_clear_logs(request: Request, confirm: str = None):
 @require_login()
 async def admin_get_domains(request: Request, active_only: bool = False):
     """Get list generator.email domains"""
-    from core.storage import get_generator_domains
+    from core.storage import get_generator_domains_with_status
     try:
-        domains = await get_generator_domains(active_only=active_only)
-        
-        # Get all domains with status
-        all_domains = await get_generator_domains(active_only=False)
-        active_domains = await get_generator_domains(active_only=True)
-        
-        domain_list = []
-        for domain in all_domains:
-            domain_list.append({
-                "domain": domain,
-                "is_active": domain in active_domains
-            })
-        
+        rows = await get_generator_domains_with_status()
+        domain_list = [{"domain": domain, "is_active": is_active} for domain, is_active in rows]
+
         return {
             "status": "success",
             "domains": domain_list,
             "total": len(domain_list),
-            "active_count": len(active_domains)
+            "active_count": sum(1 for _, is_active in rows if is_active)
         }
     except Exception as e:
         logger.error(f"[ADMIN] Get domains failed: {e}")
@@ -1777,7 +1953,7 @@ async def admin_toggle_domain(request: Request, domain: str):
 @require_login()
 async def admin_get_task_history(request: Request, limit: int = 100):
     """Dapatkan riwayat taskcatat"""
-    _load_task_history()
+    _ensure_task_history_loaded()
     with task_history_lock:
         history = list(task_history)
 
@@ -1794,22 +1970,20 @@ async def admin_get_task_history(request: Request, limit: int = 100):
     except Exception as exc:
         logger.warning(f"[HISTORY] build live entries failed: {exc}")
 
-    merged = {}
-    for entry in live_entries + history:
-        entry_id = entry.get("id") or str(uuid.uuid4())
-        if entry_id not in merged:
-            merged[entry_id] = entry
+    def entry_key(entry: dict) -> str:
+        return entry.get("id") or f"anon-{uuid.uuid4().hex[:8]}"
 
-    # waktu
-    history = list(merged.values())
-    history.sort(key=lambda x: x.get("created_at", 0), reverse=True)
+    merged = {}
+    for entry in itertools.chain(live_entries, history):
+        merged.setdefault(entry_key(entry), entry)
 
-    # bataskembalikanjumlah
+    # waktu（bataskembalikanjumlah）
     limit = min(limit, 100)
+    history = heapq.nlargest(limit, merged.values(), key=lambda x: x.get("created_at", 0))
     return {
-        "total": len(history),
+        "total": len(merged),
         "limit": limit,
-        "history": history[:limit]
+        "history": history
     }
 
 @app.delete("/admin/task-history")
@@ -1826,6 +2000,30 @@ async def admin_clear_task_history(request: Request, confirm: str = None):
     return {"status": "success", "message": "sudahtugasriwayat", "cleared_count": cleared_count}
 
 # ---------- Gallery endpoints ----------
+# Karakter/urutan yang tidak boleh ada di nama file media (separator, NUL, traversal)
+_BAD_FILENAME_RE = re.compile(r'[\\/\x00]|\.\.')
+IMAGE_EXTS = ('.png', '.jpg', '.jpeg', '.gif', '.webp')
+VIDEO_EXTS = ('.mp4', '.webm', '.mov', '.avi')
+
+def _scan_media(dir_path: str, exts: tuple, url_prefix: str, limit: int) -> list:
+    """Scan direktori media, kembalikan `limit` file terbaru (berdasarkan waktu modifikasi)"""
+    if not os.path.exists(dir_path):
+        return []
+    media_files = []
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            if not entry.name.lower().endswith(exts) or not entry.is_file():
+                continue
+            stat = entry.stat()
+            media_files.append({
+                "filename": entry.name,
+                "url": f"{url_prefix}/{entry.name}",
+                "size": stat.st_size,
+                "created_at": stat.st_ctime,
+                "modified_at": stat.st_mtime
+            })
+    # urutkan berdasarkan waktu modifikasi menurun
+    return heapq.nlargest(limit, media_files, key=itemgetter("modified_at"))
 
 @app.get("/admin/gallery")
 @require_login()
@@ -1836,41 +2034,11 @@ async def admin_get_gallery(request: Request, media_type: str = "all", limit: in
         
         # ambilgambar
         if media_type in ("all", "images"):
-            if os.path.exists(IMAGE_DIR):
-                image_files = []
-                for filename in os.listdir(IMAGE_DIR):
-                    if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp')):
-                        file_path = os.path.join(IMAGE_DIR, filename)
-                        stat = os.stat(file_path)
-                        image_files.append({
-                            "filename": filename,
-                            "url": f"/images/{filename}",
-                            "size": stat.st_size,
-                            "created_at": stat.st_ctime,
-                            "modified_at": stat.st_mtime
-                        })
-                # urutkan berdasarkan waktu modifikasi menurun
-                image_files.sort(key=lambda x: x["modified_at"], reverse=True)
-                result["images"] = image_files[:limit]
+            result["images"] = await asyncio.to_thread(_scan_media, IMAGE_DIR, IMAGE_EXTS, "/images", limit)
         
         # ambilvideo
         if media_type in ("all", "videos"):
-            if os.path.exists(VIDEO_DIR):
-                video_files = []
-                for filename in os.listdir(VIDEO_DIR):
-                    if filename.lower().endswith(('.mp4', '.webm', '.mov', '.avi')):
-                        file_path = os.path.join(VIDEO_DIR, filename)
-                        stat = os.stat(file_path)
-                        video_files.append({
-                            "filename": filename,
-                            "url": f"/videos/{filename}",
-                            "size": stat.st_size,
-                            "created_at": stat.st_ctime,
-                            "modified_at": stat.st_mtime
-                        })
-                # urutkan berdasarkan waktu modifikasi menurun
-                video_files.sort(key=lambda x: x["modified_at"], reverse=True)
-                result["videos"] = video_files[:limit]
+            result["videos"] = await asyncio.to_thread(_scan_media, VIDEO_DIR, VIDEO_EXTS, "/videos", limit)
         
         return {
             "status": "success",
@@ -1897,7 +2065,7 @@ async def admin_delete_media(request: Request, media_type: str, filename: str):
             raise HTTPException(400, "media_type  images atau videos")
         
         # cek：pastikanfile
-        if ".." in filename or "/" in filename or "\\" in filename:
+        if not filename or filename == "." or _BAD_FILENAME_RE.search(filename):
             raise HTTPException(400, "file")
         
         if not os.path.exists(file_path):
@@ -1915,15 +2083,19 @@ async def admin_delete_media(request: Request, media_type: str, filename: str):
 
 # ---------- Auth endpoints (API) ----------
 
+# Daftar model statis, diserialisasi sekali (created = waktu startup)
+_MODELS_CREATED = int(time.time())
+_MODELS_JSON = orjson.dumps({
+    "object": "list",
+    "data": [
+        {"id": m, "object": "model", "created": _MODELS_CREATED, "owned_by": "google", "permission": []}
+        for m in ALL_MODEL_IDS
+    ]
+})
+
 @app.get("/v1/models")
 async def list_models(authorization: str = Header(None)):
-    data = []
-    now = int(time.time())
-    for m in MODEL_MAPPING.keys():
-        data.append({"id": m, "object": "model", "created": now, "owned_by": "google", "permission": []})
-    data.append({"id": "gemini-imagen", "object": "model", "created": now, "owned_by": "google", "permission": []})
-    data.append({"id": "gemini-veo", "object": "model", "created": now, "owned_by": "google", "permission": []})
-    return {"object": "list", "data": data}
+    return Response(content=_MODELS_JSON, media_type="application/json")
 
 @app.get("/v1/models/{model_id}")
 async def get_model(model_id: str, authorization: str = Header(None)):
@@ -1949,7 +2121,7 @@ async def chat_impl(
     authorization: Optional[str]
 ):
     # buat permintaanID（，untuklog）
-    request_id = str(uuid.uuid4())[:6]
+    request_id = next_request_id()
 
     start_ts = time.time()
     request.state.first_response_time = None
@@ -1967,98 +2139,81 @@ async def chat_impl(
         if monitor_recorded:
             return
         monitor_recorded = True
-        duration_s = time.time() - start_ts
-        latency_ms = None
+        now = time.time()
+        duration_s = now - start_ts
         first_response_time = getattr(request.state, "first_response_time", None)
         if first_response_time:
             latency_ms = int((first_response_time - start_ts) * 1000)
         else:
             latency_ms = int(duration_s * 1000)
+        is_success = status == "success"
 
-        uptime_tracker.record_request("api_service", status == "success", latency_ms, status_code)
+        uptime_tracker.record_request("api_service", is_success, latency_ms, status_code)
 
+        model_name = req.model if req else None
         entry = build_recent_conversation_entry(
             request_id=request_id,
-            model=req.model if req else None,
+            model=model_name,
             message_count=message_count,
             start_ts=start_ts,
             status=status,
-            duration_s=duration_s if status == "success" else None,
+            duration_s=duration_s if is_success else None,
             error_detail=error_detail,
         )
 
+        model_name = model_name or "unknown"
+        record_timing = is_success and latency_ms is not None
+        if record_timing:
+            # catatwaktu respon pertamadanSelesaiwaktu，model
+            ttfb_ms = latency_ms
+            total_ms = int(duration_s * 1000)
+        else:
+            ttfb_ms = None
+            total_ms = None
+
+        # database（ditulis batch oleh stats_writer_task）; sukses tanpa latency tidak dicatat, sama seperti sebelumnya
+        if record_timing or not is_success:
+            enqueue_request_log({
+                "timestamp": now,
+                "model": model_name,
+                "ttfb_ms": ttfb_ms,
+                "total_ms": total_ms,
+                "status": status,
+                "status_code": status_code
+            })
+
+        stats = global_stats
         async with stats_lock:
-            global_stats.setdefault("failure_timestamps", [])
-            global_stats.setdefault("rate_limit_timestamps", [])
-            global_stats.setdefault("recent_conversations", [])
-            global_stats.setdefault("success_count", 0)
-            global_stats.setdefault("failed_count", 0)
-            global_stats.setdefault("account_conversations", {})
-            global_stats.setdefault("account_failures", {})
-            global_stats.setdefault("response_times", deque(maxlen=10000))
-
-            # catatresponwaktu（catatBerhasilpermintaan）
-            if status == "success" and latency_ms is not None:
-                # catatwaktu respon pertamadanSelesaiwaktu，model
-                ttfb_ms = int((first_response_time - start_ts) * 1000) if first_response_time else latency_ms
-                total_ms = int((time.time() - start_ts) * 1000)
-                model_name = req.model if req else "unknown"
-
-                global_stats["response_times"].append({
-                    "timestamp": time.time(),
+            if record_timing:
+                # catatresponwaktu（catatBerhasilpermintaan）
+                stats["response_times"].append({
+                    "timestamp": now,
                     "ttfb_ms": ttfb_ms,  # waktu respon pertama
                     "total_ms": total_ms,  # Selesaiwaktu
                     "model": model_name  # modelnama
                 })
-
-                # database
-                asyncio.create_task(stats_db.insert_request_log(
-                    timestamp=time.time(),
-                    model=model_name,
-                    ttfb_ms=ttfb_ms,
-                    total_ms=total_ms,
-                    status=status,
-                    status_code=status_code
-                ))
-            elif status != "success":
-                # Gagalpermintaancatatdatabase
-                model_name = req.model if req else "unknown"
-                asyncio.create_task(stats_db.insert_request_log(
-                    timestamp=time.time(),
-                    model=model_name,
-                    ttfb_ms=None,
-                    total_ms=None,
-                    status=status,
-                    status_code=status_code
-                ))
-
-            if status != "success":
-                global_stats["failed_count"] += 1
-                global_stats["failure_timestamps"].append(time.time())
+            if is_success:
+                stats["success_count"] += 1
+                if account_manager:
+                    stats["account_conversations"][account_manager.config.account_id] = account_manager.conversation_count
+            else:
+                stats["failed_count"] += 1
+                stats["failure_timestamps"].append(now)
                 if status_code == 429:
-                    global_stats["rate_limit_timestamps"].append(time.time())
-                failure_account_id = None
+                    stats["rate_limit_timestamps"].append(now)
+                account_failures = stats["account_failures"]
                 if account_manager:
                     account_manager.failure_count += 1
-                    failure_account_id = account_manager.config.account_id
-                    global_stats["account_failures"][failure_account_id] = account_manager.failure_count
+                    account_failures[account_manager.config.account_id] = account_manager.failure_count
                 else:
                     failure_account_id = getattr(request.state, "last_account_id", None)
                     if failure_account_id and failure_account_id in multi_account_mgr.accounts:
                         account_mgr = multi_account_mgr.accounts[failure_account_id]
                         account_mgr.failure_count += 1
-                        global_stats["account_failures"][failure_account_id] = account_mgr.failure_count
+                        account_failures[failure_account_id] = account_mgr.failure_count
                     elif failure_account_id:
-                        global_stats["account_failures"][failure_account_id] = (
-                            global_stats["account_failures"].get(failure_account_id, 0) + 1
-                        )
-            else:
-                global_stats["success_count"] += 1
-                if account_manager:
-                    global_stats["account_conversations"][account_manager.config.account_id] = account_manager.conversation_count
-            global_stats["recent_conversations"].append(entry)
-            global_stats["recent_conversations"] = global_stats["recent_conversations"][-60:]
-            await save_stats(global_stats)
+                        account_failures[failure_account_id] = account_failures.get(failure_account_id, 0) + 1
+            stats["recent_conversations"].append(entry)
 
     def classify_error_status(status_code: Optional[int], error: Exception) -> str:
         if status_code == 504:
@@ -2082,13 +2237,13 @@ async def chat_impl(
         global_stats["request_timestamps"].append(timestamp)
         global_stats.setdefault("model_request_timestamps", {})
         global_stats["model_request_timestamps"].setdefault(req.model, []).append(timestamp)
-        await save_stats(global_stats)
+    request_save_stats()
 
     # 2. model
 
-    if req.model not in MODEL_MAPPING and req.model not in VIRTUAL_MODELS:
+    if req.model not in _ALL_MODEL_ID_SET:
         logger.error(f"[CHAT] [req_{request_id}] model: {req.model}")
-        all_models = list(MODEL_MAPPING.keys()) + list(VIRTUAL_MODELS.keys())
+        all_models = list(ALL_MODEL_IDS)
         await finalize_result("error", 404, f"HTTP 404: Model '{req.model}' not found")
         raise HTTPException(
             status_code=404,
@@ -2101,7 +2256,8 @@ async def chat_impl(
     required_quota_types = get_required_quota_types(req.model)
 
     # 3. sesi，ambilSession（satupermintaan）
-    conv_key = get_conversation_key([m.model_dump() for m in req.messages], client_ip)
+    # get_conversation_key hanya memakai 3 pesan pertama, jadi dump seperlunya
+    conv_key = get_conversation_key([m.model_dump() for m in req.messages[:3]], client_ip)
     session_lock = await multi_account_mgr.acquire_session_lock(conv_key)
 
     # 4. dicekcachedanprosesSession（satupermintaan）
@@ -2128,11 +2284,14 @@ async def chat_impl(
             # ：cobabuat sesi（Erroralih akun）
             available_accounts = multi_account_mgr.get_available_accounts(required_quota_types)
             max_retries = min(MAX_ACCOUNT_SWITCH_TRIES, len(available_accounts))
+            account_iter = multi_account_mgr.iter_available_accounts(required_quota_types, request_id, available_accounts)
             last_error = None
 
             for retry_idx in range(max_retries):
                 try:
-                    account_manager = await multi_account_mgr.get_account(None, request_id, required_quota_types)
+                    account_manager = next(account_iter, None)
+                    if account_manager is None:
+                        raise HTTPException(503, "No available accounts")
                     google_session = await create_google_session(account_manager, http_client, USER_AGENT, request_id)
                     # akun
                     await multi_account_mgr.set_session_cache(
@@ -2177,25 +2336,23 @@ async def chat_impl(
         await finalize_result("error", 503, "No available accounts")
         raise HTTPException(503, "No available accounts")
 
-    # ekstrakisi pesan penggunauntuklog
-    if req.messages:
-        last_content = req.messages[-1].content
-        if isinstance(last_content, str):
-            # pesan，batasdi500karakter
-            if len(last_content) > 500:
-                preview = last_content[:500] + "...(terpotong)"
+    if logger.isEnabledFor(logging.INFO):
+        # ekstrakisi pesan penggunauntuklog
+        if req.messages:
+            last_content = req.messages[-1].content
+            if isinstance(last_content, str):
+                # pesan，batasdi500karakter
+                preview = _preview(last_content)
             else:
-                preview = last_content
+                preview = f"[: {len(last_content)}]"
         else:
-            preview = f"[: {len(last_content)}]"
-    else:
-        preview = "[pesan]"
+            preview = "[pesan]"
 
-    # catatpermintaanInfo
-    logger.info(f"[CHAT] [{account_manager.config.account_id}] [req_{request_id}] menerima permintaan: {req.model} | {len(req.messages)} pesan | stream={req.stream}")
+        # catatpermintaanInfo
+        logger.info(f"[CHAT] [{account_manager.config.account_id}] [req_{request_id}] menerima permintaan: {req.model} | {len(req.messages)} pesan | stream={req.stream}")
 
-    # singlecatatisi pesan pengguna（）
-    logger.info(f"[CHAT] [{account_manager.config.account_id}] [req_{request_id}] pesan: {preview}")
+        # singlecatatisi pesan pengguna（）
+        logger.info(f"[CHAT] [{account_manager.config.account_id}] [req_{request_id}] pesan: {preview}")
 
     # 3. uraipermintaankonten
     try:
@@ -2231,10 +2388,14 @@ async def chat_impl(
         # singleRetry：Erroralih akun
         available_accounts = multi_account_mgr.get_available_accounts(required_quota_types)
         max_retries = min(MAX_ACCOUNT_SWITCH_TRIES, len(available_accounts))
+        # akun saat ini dipakai di percobaan pertama; kandidat failover tanpa akun ini agar tidak ikut "dipilih"
+        failover_accounts = [acc for acc in available_accounts if acc is not account_manager]
+        account_iter = multi_account_mgr.iter_available_accounts(required_quota_types, request_id, failover_accounts)
 
         current_text = text_to_send
         current_retry_mode = is_retry_mode
         current_file_ids = []
+        full_context_text = None  # dibangun sekali, dipakai ulang antar Retry
 
         for retry_idx in range(max_retries):
             try:
@@ -2262,7 +2423,9 @@ async def chat_impl(
 
                 # （Retry）
                 if current_retry_mode:
-                    current_text = build_full_context_text(req.messages)
+                    if full_context_text is None:
+                        full_context_text = build_full_context_text(req.messages)
+                    current_text = full_context_text
 
                 # 
                 async for chunk in stream_chat_generator(
@@ -2316,7 +2479,9 @@ async def chat_impl(
 
                     # cobaakun
                     try:
-                        new_account = await multi_account_mgr.get_account(None, request_id, required_quota_types)
+                        new_account = next(account_iter, None)
+                        if new_account is None:
+                            raise HTTPException(503, "No available accounts")
                         logger.info(f"[CHAT] [req_{request_id}] alih akun: {account_manager.config.account_id} -> {new_account.config.account_id}")
 
                         #  Session
@@ -2346,35 +2511,29 @@ async def chat_impl(
 
                         status = classify_error_status(status_code, create_err)
                         await finalize_result(status, status_code, f"Account Failover Failed: {str(create_err)[:200]}")
-                        if req.stream: yield f"data: {json.dumps({'error': {'message': 'Account Failover Failed'}})}\n\n"
+                        if req.stream: yield b"data: " + orjson.dumps({'error': {'message': 'Account Failover Failed'}}) + b"\n\n"
                         return
                 else:
                     # sudahmencapai maksimumRetrykalijumlah
                     logger.error(f"[CHAT] [req_{request_id}] sudahmencapai maksimumRetrykalijumlah ({max_retries})，Request gagal")
                     status = classify_error_status(status_code, e)
                     await finalize_result(status, status_code, error_detail)
-                    if req.stream: yield f"data: {json.dumps({'error': {'message': f'Max retries ({max_retries}) exceeded: {error_detail}'}})}\n\n"
+                    if req.stream: yield b"data: " + orjson.dumps({'error': {'message': f'Max retries ({max_retries}) exceeded: {error_detail}'}}) + b"\n\n"
                     return
 
     if req.stream:
-        return StreamingResponse(response_wrapper(), media_type="text/event-stream")
+        return StreamingResponse(coalesce_sse(response_wrapper()), media_type="text/event-stream")
     
-    full_content = ""
-    full_reasoning = ""
-    async for chunk_str in response_wrapper():
-        if chunk_str.startswith("data: [DONE]"): break
-        if chunk_str.startswith("data: "):
-            try:
-                data = json.loads(chunk_str[6:])
-                delta = data["choices"][0]["delta"]
-                if "content" in delta:
-                    full_content += delta["content"]
-                if "reasoning_content" in delta:
-                    full_reasoning += delta["reasoning_content"]
-            except json.JSONDecodeError as e:
-                logger.error(f"[CHAT] [{account_manager.config.account_id}] [req_{request_id}] JSONuraiGagal: {str(e)}")
-            except (KeyError, IndexError) as e:
-                logger.error(f"[CHAT] [{account_manager.config.account_id}] [req_{request_id}] responformatError ({type(e).__name__}): {str(e)}")
+    # non-stream: response_wrapper menghasilkan dict delta (bukan frame SSE)
+    content_parts = []
+    reasoning_parts = []
+    async for delta in response_wrapper():
+        if "content" in delta:
+            content_parts.append(delta["content"])
+        if "reasoning_content" in delta:
+            reasoning_parts.append(delta["reasoning_content"])
+    full_content = "".join(content_parts)
+    full_reasoning = "".join(reasoning_parts)
 
     # bangunresponpesan
     message = {"role": "assistant", "content": full_content}
@@ -2385,8 +2544,8 @@ async def chat_impl(
     logger.info(f"[CHAT] [{account_manager.config.account_id}] [req_{request_id}] non-streamRespons selesai")
 
     # catatresponkonten（batas500karakter）
-    response_preview = full_content[:500] + "...(terpotong)" if len(full_content) > 500 else full_content
-    logger.info(f"[CHAT] [{account_manager.config.account_id}] [req_{request_id}] AIrespon: {response_preview}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"[CHAT] [{account_manager.config.account_id}] [req_{request_id}] AIrespon: {_preview(full_content)}")
 
     return {
         "id": chat_id,
@@ -2398,6 +2557,21 @@ async def chat_impl(
     }
 
 # ---------- gambar API (OpenAI ) ----------
+# Gambar markdown di konten chat (dikompilasi sekali)
+_MD_B64_IMAGE_RE = re.compile(r'!\[.*?\]\(data:([^;]+);base64,([^\)]+)\)')
+_MD_URL_IMAGE_RE = re.compile(r'!\[.*?\]\((https?://[^\)]+)\)')
+
+
+def _find_md_images(pattern: re.Pattern, text: str, limit: Optional[int]) -> list:
+    """Ambil paling banyak limit match (berhenti lebih awal, tanpa findall penuh)"""
+    if "![" not in text:
+        return []
+    if limit is not None:
+        # n negatif dari klien: islice menolak stop < 0
+        limit = max(limit, 0)
+    return [m.group(1) if pattern.groups == 1 else m.groups() for m in islice(pattern.finditer(text), limit)]
+
+
 @app.post("/v1/images/generations")
 async def generate_images(
     req: ImageGenerationRequest,
@@ -2413,7 +2587,7 @@ async def generate_images(
     verify_api_key(API_KEY, authorization)
 
     # buat permintaanID
-    request_id = str(uuid.uuid4())[:6]
+    request_id = next_request_id()
 
     # konversi ke ChatRequest format
     chat_req = ChatRequest(
@@ -2434,11 +2608,8 @@ async def generate_images(
         message_content = chat_response["choices"][0]["message"]["content"]
 
         # urai markdown digambar
-        import re
-        b64_pattern = r'!\[.*?\]\(data:([^;]+);base64,([^\)]+)\)'
-        b64_matches = re.findall(b64_pattern, message_content)
-        url_pattern = r'!\[.*?\]\((https?://[^\)]+)\)'
-        url_matches = re.findall(url_pattern, message_content)
+        b64_matches = _find_md_images(_MD_B64_IMAGE_RE, message_content, req.n)
+        url_matches = _find_md_images(_MD_URL_IMAGE_RE, message_content, req.n)
 
         # responformat：sistemkonfigurasi
         system_format = config_manager.image_output_format
@@ -2457,14 +2628,16 @@ async def generate_images(
 
             # tidak ada base64 namun ada URL，unduh
             if not data_list and url_matches:
-                for url in url_matches[:req.n]:
-                    try:
-                        resp = await http_client.get(url)
-                        if resp.status_code == 200:
-                            b64_data = base64.b64encode(resp.content).decode()
-                            data_list.append({"b64_json": b64_data, "revised_prompt": req.prompt})
-                    except Exception as e:
-                        logger.error(f"[IMAGE-GEN] [req_{request_id}] unduhgambarGagal: {url}, {str(e)}")
+                fallback_urls = url_matches[:req.n]
+                responses = await asyncio.gather(*[http_client.get(url) for url in fallback_urls], return_exceptions=True)
+                for url, resp in zip(fallback_urls, responses):
+                    if isinstance(resp, Exception):
+                        logger.error(f"[IMAGE-GEN] [req_{request_id}] unduhgambarGagal: {url}, {str(resp)}")
+                        continue
+                    if resp.status_code == 200:
+                        # encode gambar besar di thread agar tidak memblokir event loop
+                        b64_data = (await asyncio.to_thread(base64.b64encode, resp.content)).decode("ascii")
+                        data_list.append({"b64_json": b64_data, "revised_prompt": req.prompt})
         else:
             # kembalikan URL format
             for url in url_matches[:req.n]:
@@ -2476,7 +2649,7 @@ async def generate_images(
                 chat_id = f"img-{uuid.uuid4()}"
                 for idx, (mime, b64_data) in enumerate(b64_matches[:req.n], 1):
                     try:
-                        img_data = base64.b64decode(b64_data)
+                        img_data = await asyncio.to_thread(base64.b64decode, b64_data)
                         file_id = f"gen-{uuid.uuid4()}"
                         url = save_image_to_hf(img_data, chat_id, file_id, mime, base_url, IMAGE_DIR)
                         data_list.append({"url": url, "revised_prompt": req.prompt})
@@ -2528,7 +2701,7 @@ def parse_images_from_response(data_list: list) -> tuple[list, str]:
                 seen_file_ids.add(file_id)
 
                 mime_type = file_info.get("mimeType", "image/png")
-                logger.debug(f"[PARSE] uraifile: fileId={file_id}, mimeType={mime_type}")
+                logger.debug("[PARSE] uraifile: fileId=%s, mimeType=%s", file_id, mime_type)
                 file_ids.append({
                     "fileId": file_id,
                     "mimeType": mime_type
@@ -2537,35 +2710,65 @@ def parse_images_from_response(data_list: list) -> tuple[list, str]:
     return file_ids, session_name
 
 
-async def stream_chat_generator(session: str, text_content: str, file_ids: List[str], model_name: str, chat_id: str, created_time: int, account_manager: AccountManager, is_stream: bool = True, request_id: str = "", request: Request = None):
-    start_time = time.time()
-    full_content = ""
-    first_response_time = None
-
-    # catatAPIkonten
-    text_preview = text_content[:500] + "...(terpotong)" if len(text_content) > 500 else text_content
-    logger.info(f"[API] [{account_manager.config.account_id}] [req_{request_id}] konten: {text_preview}")
-    if file_ids:
-        logger.info(f"[API] [{account_manager.config.account_id}] [req_{request_id}] file: {len(file_ids)}")
+def _truncate_json(obj, limit: Optional[int] = None) -> str:
+    """Dump JSON untuk log (orjson, UTF-8 langsung); potong ke limit byte"""
+    try:
+        data = orjson.dumps(obj)
+    except TypeError:
+        return repr(obj)[:limit]
+    return data[:limit].decode("utf-8", "ignore")
+
+
+async def _download_stream_image(account_manager: AccountManager, metadata_task: asyncio.Task, session_name: str, file_info: dict, request_id: str) -> tuple:
+    """Unduh satu gambar begitu fileId terlihat di stream; kembalikan (mime, data)"""
+    file_metadata = await metadata_task
+    fid = file_info["fileId"]
+    meta = file_metadata.get(fid, {})
+    #  metadata di MIME 
+    mime = meta.get("mimeType", file_info["mimeType"])
+    correct_session = meta.get("session") or session_name
+    data = await download_image_with_jwt(account_manager, correct_session, fid, http_client, USER_AGENT, request_id)
+    return mime, data
+
+
+# Batas body error upstream yang dibaca (halaman HTML error bisa berukuran MB)
+UPSTREAM_ERROR_BODY_LIMIT = 16384
+
+
+async def _read_error_body(response: httpx.Response, limit: int = UPSTREAM_ERROR_BODY_LIMIT) -> str:
+    """Baca paling banyak limit byte dari body error lalu decode (karakter rusak diganti)"""
+    buf = bytearray()
+    async for part in response.aiter_bytes():
+        buf += part
+        if len(buf) >= limit:
+            break
+    return bytes(buf[:limit]).decode("utf-8", "replace")
 
-    jwt = await account_manager.get_jwt(request_id)
-    headers = get_common_headers(jwt, USER_AGENT)
 
+# Sub-objek statis body widgetStreamAssist (hanya dibaca, dibagi antar permintaan)
+_ASSIST_ADDITIONAL_PARAMS = {"token": "-"}
+_ASSIST_USER_METADATA = {"timeZone": "Asia/Shanghai"}
+# Slot di template body (string JSON lengkap dengan kutip, diganti nilai hasil orjson)
+_ASSIST_SESSION_SLOT = b'"__ASSIST_SESSION__"'
+_ASSIST_FILE_IDS_SLOT = b'"__ASSIST_FILE_IDS__"'
+_ASSIST_QUERY_SLOT = b'"__ASSIST_QUERY__"'
 
-    tools_spec = get_tools_spec(model_name)
 
+@functools.lru_cache(maxsize=256)
+def _assist_body_template(config_id: str, model_name: str, image_generation: bool) -> bytes:
+    """Body widgetStreamAssist ter-serialisasi per (config, model, status generasi gambar)"""
     body = {
-        "configId": account_manager.config.config_id,
-        "additionalParams": {"token": "-"},
+        "configId": config_id,
+        "additionalParams": _ASSIST_ADDITIONAL_PARAMS,
         "streamAssistRequest": {
-            "session": session,
-            "query": {"parts": [{"text": text_content}]},
+            "session": "__ASSIST_SESSION__",
+            "query": {"parts": [{"text": "__ASSIST_QUERY__"}]},
             "filter": "",
-            "fileIds": file_ids, # file ID
+            "fileIds": "__ASSIST_FILE_IDS__", # file ID
             "answerGenerationMode": "NORMAL",
-            "toolsSpec": tools_spec,
+            "toolsSpec": build_tools_spec(model_name, image_generation),
             "languageCode": "zh-CN",
-            "userMetadata": {"timeZone": "Asia/Shanghai"},
+            "userMetadata": _ASSIST_USER_METADATA,
             "assistSkippingMode": "REQUEST_ASSIST"
         }
     }
@@ -2575,244 +2778,292 @@ async def stream_chat_generator(session: str, text_content: str, file_ids: List[
         body["streamAssistRequest"]["assistGenerationConfig"] = {
             "modelId": target_model_id
         }
+    return orjson.dumps(body)
 
-    if is_stream:
-        chunk = create_chunk(chat_id, created_time, model_name, {"role": "assistant"}, None)
-        yield f"data: {chunk}\n\n"
 
-    # permintaan
-    json_objects = []  # responobjekuntukgambarurai
-    file_ids_info = None  # SimpangambarInfo
-
-    async with http_client.stream(
-        "POST",
-        "https://biz-discoveryengine.googleapis.com/v1alpha/locations/global/widgetStreamAssist",
-        headers=headers,
-        json=body,
-    ) as r:
-        if r.status_code != 200:
-            error_text = await r.aread()
-            uptime_tracker.record_request(model_name, False, status_code=r.status_code)
-            raise HTTPException(status_code=r.status_code, detail=f"Upstream Error {error_text.decode()}")
-
-        # uraiproses JSON jumlah
-        try:
-            response_count = 0
-            async for json_obj in parse_json_array_stream_async(r.aiter_lines()):
-                response_count += 1
-                json_objects.append(json_obj)  # respon
-
-                # catatresponstruktur（untukDebugrespon）
-                logger.debug(f"[API] [{account_manager.config.account_id}] [req_{request_id}] diterimarespon#{response_count}: {json.dumps(json_obj, ensure_ascii=False)[:1000]}")
-
-                # cekErroratauInfo
-                if "error" in json_obj:
-                    logger.warning(f"[API] [{account_manager.config.account_id}] [req_{request_id}] kembalikanError: {json.dumps(json_obj.get('error'), ensure_ascii=False)}")
-
-                stream_response = json_obj.get("streamAssistResponse", {})
-                answer = stream_response.get("answer", {})
-
-                # cek
-                answer_state = answer.get("state", "")
-                if answer_state == "SKIPPED":
-                    skip_reasons = answer.get("assistSkippedReasons", [])
-                    policy_result = answer.get("customerPolicyEnforcementResult", {})
-
-                    if "CUSTOMER_POLICY_VIOLATION" in skip_reasons:
-                        # ekstrakInfo（untuklog）
-                        policy_results = policy_result.get("policyResults", [])
-                        violation_detail = ""
-
-                        for policy in policy_results:
-                            armor_result = policy.get("modelArmorEnforcementResult", {})
-                            if armor_result:
-                                violation_detail = armor_result.get("modelArmorViolation", "")
-                                if violation_detail:
-                                    break
-
-                        logger.warning(f"[API] [{account_manager.config.account_id}] [req_{request_id}] konten: {violation_detail or 'CUSTOMER_POLICY_VIOLATION'}")
-
-                        # kembalikanErrorInfo
-                        error_text = "\n⚠️ \n\n Google ， Gemini tidak ada。\n\n。\n"
-
-                        if first_response_time is None:
-                            first_response_time = time.time()
-                            if request is not None:
-                                request.state.first_response_time = first_response_time
-
-                        full_content += error_text
-                        chunk = create_chunk(chat_id, created_time, model_name, {"content": error_text}, None)
-                        yield f"data: {chunk}\n\n"
-                        continue
-                    elif skip_reasons:
-                        # prosesSkipalasan
-                        reason_text = ", ".join(skip_reasons)
-                        logger.warning(f"[API] [{account_manager.config.account_id}] [req_{request_id}] responSkip: {reason_text}")
+async def stream_chat_generator(session: str, text_content: str, file_ids: List[str], model_name: str, chat_id: str, created_time: int, account_manager: AccountManager, is_stream: bool = True, request_id: str = "", request: Request = None):
+    # durasi diukur dengan monotonic; waktu wall hanya untuk request.state (dipakai finalize_result)
+    start_mono = time.monotonic()
+    full_content = ""
+    first_response_mono = None
+
+    def mark_first_response() -> bool:
+        """Catat waktu respon pertama sekali; True jika ini yang pertama"""
+        nonlocal first_response_mono
+        if first_response_mono is not None:
+            return False
+        first_response_mono = time.monotonic()
+        if request is not None:
+            request.state.first_response_time = time.time()
+        return True
 
-                        error_text = f"\n⚠️ ，tidak adarespon。\n\nalasan：{reason_text}\n\nRetryatauManajemen。\n"
+    # catatAPIkonten
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"[API] [{account_manager.config.account_id}] [req_{request_id}] konten: {_preview(text_content)}")
+    if file_ids:
+        logger.info(f"[API] [{account_manager.config.account_id}] [req_{request_id}] file: {len(file_ids)}")
 
-                        if first_response_time is None:
-                            first_response_time = time.time()
-                            if request is not None:
-                                request.state.first_response_time = first_response_time
+    jwt = await account_manager.get_jwt(request_id)
+    headers = get_common_headers(jwt, USER_AGENT)
 
-                        full_content += error_text
-                        chunk = create_chunk(chat_id, created_time, model_name, {"content": error_text}, None)
-                        yield f"data: {chunk}\n\n"
-                        continue
+    # non-stream: yield dict delta langsung ke agregator chat_impl
+    encode_chunk = make_chunk_encoder(chat_id, created_time, model_name) if is_stream else _passthrough_delta
+
+    # body dari template per (config, model): hanya session/fileIds/query yang disisipkan
+    image_generation = IMAGE_GENERATION_ENABLED and model_name in IMAGE_GENERATION_MODELS
+    body_template = _assist_body_template(account_manager.config.config_id, model_name, image_generation)
+    body = (
+        body_template
+        .replace(_ASSIST_SESSION_SLOT, orjson.dumps(session), 1)
+        .replace(_ASSIST_FILE_IDS_SLOT, orjson.dumps(file_ids), 1)
+        .replace(_ASSIST_QUERY_SLOT, orjson.dumps(text_content), 1)  # teks user terakhir
+    )
 
-                replies = answer.get("replies", [])
+    if is_stream:
+        yield encode_chunk({"role": "assistant"})
 
-                # catatrepliesjumlah
-                if not replies:
-                    logger.debug(f"[API] [{account_manager.config.account_id}] [req_{request_id}] respon#{response_count}tidak adareplies，answerstruktur: {json.dumps(answer, ensure_ascii=False)[:500]}")
-                else:
-                    logger.debug(f"[API] [{account_manager.config.account_id}] [req_{request_id}] respon#{response_count}{len(replies)}replies")
+    # permintaan
+    first_json_obj = None  # responpertama untukDebug
+    # gambar diunduh paralel dengan stream: mulai begitu fileId muncul
+    image_files = []  # [{"fileId", "mimeType"}] urutan ditemukan
+    image_tasks = {}  # fileId -> Task (mime, data)
+    image_session = ""
+    tasks_session = ""  # session yang dipakai task unduhan yang sedang berjalan
+    metadata_task = None
+
+    def start_image_downloads():
+        nonlocal metadata_task, tasks_session
+        if not image_session or not image_files:
+            return
+        if tasks_session != image_session:
+            # session berubah di tengah stream: unduhan selalu terikat ke session terakhir, mulai ulang
+            cancel_image_downloads()
+            image_tasks.clear()
+            tasks_session = image_session
+            metadata_task = asyncio.create_task(get_session_file_metadata(account_manager, image_session, http_client, USER_AGENT, request_id))
+        for file_info in image_files:
+            if file_info["fileId"] not in image_tasks:
+                image_tasks[file_info["fileId"]] = asyncio.create_task(
+                    _download_stream_image(account_manager, metadata_task, image_session, file_info, request_id)
+                )
 
-                # ekstrakkonten teks
-                for idx, reply in enumerate(replies):
-                    content_obj = reply.get("groundedContent", {}).get("content", {})
-                    text = content_obj.get("text", "")
+    def cancel_image_downloads():
+        for task in image_tasks.values():
+            task.cancel()
+        if metadata_task is not None:
+            metadata_task.cancel()
 
-                    if not text:
-                        # catattidak adatext
-                        logger.debug(f"[API] [{account_manager.config.account_id}] [req_{request_id}] Reply#{idx}tidak adatext，content_objstruktur: {json.dumps(content_obj, ensure_ascii=False)[:300]}")
+    try:
+        async with http_client.stream(
+            "POST",
+            "https://biz-discoveryengine.googleapis.com/v1alpha/locations/global/widgetStreamAssist",
+            headers=headers,
+            content=body,  # content-type sudah di header umum
+        ) as r:
+            if r.status_code != 200:
+                error_text = await _read_error_body(r)
+                uptime_tracker.record_request(model_name, False, status_code=r.status_code)
+                raise HTTPException(status_code=r.status_code, detail=f"Upstream Error {error_text}")
+
+            # uraiproses JSON jumlah
+            upstream_frames = None
+            try:
+                response_count = 0
+                # dump struktur respon mahal untuk frame besar, hanya jalan jika level DEBUG aktif
+                debug_enabled = logger.isEnabledFor(logging.DEBUG)
+                # baca socket + parse di task producer, tumpang tindih dengan emit SSE di bawah
+                upstream_frames = buffered_async_iter(parse_json_array_stream_async(r.aiter_lines()), size=16)
+                async for json_obj in upstream_frames:
+                    response_count += 1
+                    if first_json_obj is None:
+                        first_json_obj = json_obj
+
+                    # gambarbaru → langsung mulai unduh di background
+                    frame_files, frame_session = parse_images_from_response([json_obj])
+                    if frame_session:
+                        image_session = frame_session
+                    if frame_files:
+                        known = {f["fileId"] for f in image_files}
+                        image_files.extend(f for f in frame_files if f["fileId"] not in known)
+                    if image_files:
+                        start_image_downloads()
+
+                    # catatresponstruktur（untukDebugrespon）
+                    if debug_enabled:
+                        logger.debug("[API] [%s] [req_%s] diterimarespon#%s: %s", account_manager.config.account_id, request_id, response_count, _truncate_json(json_obj, 1000))
+
+                    # cekErroratauInfo
+                    if "error" in json_obj:
+                        logger.warning("[API] [%s] [req_%s] kembalikanError: %s", account_manager.config.account_id, request_id, _truncate_json(json_obj.get('error')))
+
+                    stream_response = json_obj.get("streamAssistResponse", {})
+                    answer = stream_response.get("answer", {})
+
+                    # cek
+                    answer_state = answer.get("state", "")
+                    if answer_state == "SKIPPED":
+                        skip_reasons = answer.get("assistSkippedReasons", [])
+                        policy_result = answer.get("customerPolicyEnforcementResult", {})
+
+                        if "CUSTOMER_POLICY_VIOLATION" in skip_reasons:
+                            # ekstrakInfo（untuklog）
+                            policy_results = policy_result.get("policyResults", [])
+                            violation_detail = ""
+
+                            for policy in policy_results:
+                                armor_result = policy.get("modelArmorEnforcementResult", {})
+                                if armor_result:
+                                    violation_detail = armor_result.get("modelArmorViolation", "")
+                                    if violation_detail:
+                                        break
+
+                            logger.warning("[API] [%s] [req_%s] konten: %s", account_manager.config.account_id, request_id, violation_detail or 'CUSTOMER_POLICY_VIOLATION')
+
+                            # kembalikanErrorInfo
+                            error_text = "\n⚠️ \n\n Google ， Gemini tidak ada。\n\n。\n"
+
+                            mark_first_response()
+
+                            full_content += error_text
+                            yield encode_chunk({"content": error_text})
+                            continue
+                        elif skip_reasons:
+                            # prosesSkipalasan
+                            reason_text = ", ".join(skip_reasons)
+                            logger.warning("[API] [%s] [req_%s] responSkip: %s", account_manager.config.account_id, request_id, reason_text)
+
+                            error_text = f"\n⚠️ ，tidak adarespon。\n\nalasan：{reason_text}\n\nRetryatauManajemen。\n"
+
+                            mark_first_response()
+
+                            full_content += error_text
+                            yield encode_chunk({"content": error_text})
+                            continue
+
+                    replies = answer.get("replies", [])
+
+                    # catatrepliesjumlah
+                    if debug_enabled:
+                        if not replies:
+                            logger.debug("[API] [%s] [req_%s] respon#%stidak adareplies，answerstruktur: %s", account_manager.config.account_id, request_id, response_count, _truncate_json(answer, 500))
+                        else:
+                            logger.debug("[API] [%s] [req_%s] respon#%s%sreplies", account_manager.config.account_id, request_id, response_count, len(replies))
+
+                    # ekstrakkonten teks
+                    for idx, reply in enumerate(replies):
+                        content_obj = reply.get("groundedContent", {}).get("content", {})
+                        text = content_obj.get("text", "")
+
+                        if not text:
+                            # catattidak adatext
+                            if debug_enabled:
+                                logger.debug("[API] [%s] [req_%s] Reply#%stidak adatext，content_objstruktur: %s", account_manager.config.account_id, request_id, idx, _truncate_json(content_obj, 300))
+                            continue
+
+                        # danNormalkonten
+                        if content_obj.get("thought"):
+                            #  reasoning_content field（ OpenAI o1）
+                            mark_first_response()
+                            yield encode_chunk({"reasoning_content": text})
+                        else:
+                            if mark_first_response():
+                                # pertamakaliresponstatistikBerhasilkalijumlah
+                                account_manager.conversation_count += 1
+                            # Normalkonten content field
+                            full_content += text
+                            yield encode_chunk({"content": text})
+
+                # gambarInfo（unduhan sudah berjalan sejak fileId terlihat）
+                if image_tasks:
+                    logger.info(f"[IMAGE] [{account_manager.config.account_id}] [req_{request_id}] cek{len(image_files)}gambar")
+
+                # catatproses
+                logger.info(f"[API] [{account_manager.config.account_id}] [req_{request_id}] prosesSelesai: diterima{response_count}responobjek, konten{len(full_content)}karakter")
+                if response_count > 0 and len(full_content) == 0:
+                    logger.warning(f"[API] [{account_manager.config.account_id}] [req_{request_id}] ⚠️ responWarning: diterima{response_count}respontidak adakonten teks，atauError")
+                    # pertamaresponobjekstrukturuntukDebug
+                    if first_json_obj is not None:
+                        logger.warning(f"[API] [{account_manager.config.account_id}] [req_{request_id}] pertamaresponstruktur: {_truncate_json(first_json_obj)}")
+
+
+            except ValueError as e:
+                uptime_tracker.record_request(model_name, False)
+                logger.error(f"[API] [{account_manager.config.account_id}] [req_{request_id}] JSONuraiGagal: {str(e)}")
+            except Exception as e:
+                error_type = type(e).__name__
+                uptime_tracker.record_request(model_name, False)
+                logger.error(f"[API] [{account_manager.config.account_id}] [req_{request_id}] prosesError ({error_type}): {str(e)}")
+                raise
+            finally:
+                if upstream_frames is not None:
+                    await upstream_frames.aclose()
+
+        # di async with Proses gambarunduh（）
+        if image_tasks:
+            file_ids = [f for f in image_files if f["fileId"] in image_tasks]
+            try:
+                base_url = get_base_url(request) if request else ""
+
+                # tunggu unduhan yang sudah berjalan; hasil dibaca langsung dari task
+                await asyncio.wait(image_tasks.values())
+
+                # prosesunduhhasil
+                success_count = 0
+                for idx, file_info in enumerate(file_ids, 1):
+                    fid = file_info["fileId"]
+                    task = image_tasks[fid]
+                    error = asyncio.CancelledError() if task.cancelled() else task.exception()
+                    if error is not None:
+                        logger.error(f"[IMAGE] [{account_manager.config.account_id}] [req_{request_id}] gambar{idx}Gagal download: {type(error).__name__}: {str(error)[:100]}")
+                        # turunkanproses：kembalikanErrorGagal
+                        error_msg = f"\n\n⚠️ gambar {idx} Gagal download\n\n"
+                        mark_first_response()
+                        yield encode_chunk({"content": error_msg})
                         continue
 
-                    # danNormalkonten
-                    if content_obj.get("thought"):
-                        #  reasoning_content field（ OpenAI o1）
-                        if first_response_time is None:
-                            first_response_time = time.time()
-                            if request is not None:
-                                request.state.first_response_time = first_response_time
-                        chunk = create_chunk(chat_id, created_time, model_name, {"reasoning_content": text}, None)
-                        yield f"data: {chunk}\n\n"
-                    else:
-                        if first_response_time is None:
-                            first_response_time = time.time()
-                            if request is not None:
-                                request.state.first_response_time = first_response_time
-                            # pertamakaliresponstatistikBerhasilkalijumlah
-                            account_manager.conversation_count += 1
-                        # Normalkonten content field
-                        full_content += text
-                        chunk = create_chunk(chat_id, created_time, model_name, {"content": text}, None)
-                        yield f"data: {chunk}\n\n"
-
-            # ekstrakgambarInfo（di async with ）
-            if json_objects:
-                file_ids, session_name = parse_images_from_response(json_objects)
-                if file_ids and session_name:
-                    file_ids_info = (file_ids, session_name)
-                    logger.info(f"[IMAGE] [{account_manager.config.account_id}] [req_{request_id}] cek{len(file_ids)}gambar")
-
-            # catatproses
-            logger.info(f"[API] [{account_manager.config.account_id}] [req_{request_id}] prosesSelesai: diterima{response_count}responobjek, konten{len(full_content)}karakter")
-            if response_count > 0 and len(full_content) == 0:
-                logger.warning(f"[API] [{account_manager.config.account_id}] [req_{request_id}] ⚠️ responWarning: diterima{response_count}respontidak adakonten teks，atauError")
-                # pertamaresponobjekstrukturuntukDebug
-                if json_objects:
-                    logger.warning(f"[API] [{account_manager.config.account_id}] [req_{request_id}] pertamaresponstruktur: {json.dumps(json_objects[0], ensure_ascii=False)}")
-
-
-        except ValueError as e:
-            uptime_tracker.record_request(model_name, False)
-            logger.error(f"[API] [{account_manager.config.account_id}] [req_{request_id}] JSONuraiGagal: {str(e)}")
-        except Exception as e:
-            error_type = type(e).__name__
-            uptime_tracker.record_request(model_name, False)
-            logger.error(f"[API] [{account_manager.config.account_id}] [req_{request_id}] prosesError ({error_type}): {str(e)}")
-            raise
-
-    # di async with Proses gambarunduh（）
-    if file_ids_info:
-        file_ids, session_name = file_ids_info
-        try:
-            base_url = get_base_url(request) if request else ""
-            file_metadata = await get_session_file_metadata(account_manager, session_name, http_client, USER_AGENT, request_id)
-
-            # unduhgambar
-            download_tasks = []
-            for file_info in file_ids:
-                fid = file_info["fileId"]
-                mime = file_info["mimeType"]
-                meta = file_metadata.get(fid, {})
-                #  metadata di MIME 
-                mime = meta.get("mimeType", mime)
-                correct_session = meta.get("session") or session_name
-                task = download_image_with_jwt(account_manager, correct_session, fid, http_client, USER_AGENT, request_id)
-                download_tasks.append((fid, mime, task))
-
-            results = await asyncio.gather(*[task for _, _, task in download_tasks], return_exceptions=True)
-
-            # prosesunduhhasil
-            success_count = 0
-            for idx, ((fid, mime, _), result) in enumerate(zip(download_tasks, results), 1):
-                if isinstance(result, Exception):
-                    logger.error(f"[IMAGE] [{account_manager.config.account_id}] [req_{request_id}] gambar{idx}Gagal download: {type(result).__name__}: {str(result)[:100]}")
-                    # turunkanproses：kembalikanErrorGagal
-                    error_msg = f"\n\n⚠️ gambar {idx} Gagal download\n\n"
-                    if first_response_time is None:
-                        first_response_time = time.time()
-                        if request is not None:
-                            request.state.first_response_time = first_response_time
-                    chunk = create_chunk(chat_id, created_time, model_name, {"content": error_msg}, None)
-                    yield f"data: {chunk}\n\n"
-                    continue
-
-                try:
-                    markdown = process_media(result, mime, chat_id, fid, base_url, idx, request_id, account_manager.config.account_id)
-                    success_count += 1
-                    if first_response_time is None:
-                        first_response_time = time.time()
-                        if request is not None:
-                            request.state.first_response_time = first_response_time
-                    chunk = create_chunk(chat_id, created_time, model_name, {"content": markdown}, None)
-                    yield f"data: {chunk}\n\n"
-                except Exception as save_error:
-                    logger.error(f"[MEDIA] [{account_manager.config.account_id}] [req_{request_id}] media{idx}prosesGagal: {str(save_error)[:100]}")
-                    error_msg = f"\n\n⚠️ media {idx} prosesGagal\n\n"
-                    if first_response_time is None:
-                        first_response_time = time.time()
-                        if request is not None:
-                            request.state.first_response_time = first_response_time
-                    chunk = create_chunk(chat_id, created_time, model_name, {"content": error_msg}, None)
-                    yield f"data: {chunk}\n\n"
-
-            logger.info(f"[IMAGE] [{account_manager.config.account_id}] [req_{request_id}] gambarprosesSelesai: {success_count}/{len(file_ids)} Berhasil")
-
-        except Exception as e:
-            logger.error(f"[IMAGE] [{account_manager.config.account_id}] [req_{request_id}] gambarprosesGagal: {type(e).__name__}: {str(e)[:100]}")
-            # turunkanproses：gambarprosesGagal
-            error_msg = f"\n\n⚠️ gambarprosesGagal: {type(e).__name__}\n\n"
-            if first_response_time is None:
-                first_response_time = time.time()
-                if request is not None:
-                    request.state.first_response_time = first_response_time
-            chunk = create_chunk(chat_id, created_time, model_name, {"content": error_msg}, None)
-            yield f"data: {chunk}\n\n"
+                    mime, data = task.result()
+                    try:
+                        markdown = process_media(data, mime, chat_id, fid, base_url, idx, request_id, account_manager.config.account_id)
+                        success_count += 1
+                        mark_first_response()
+                        yield encode_chunk({"content": markdown})
+                    except Exception as save_error:
+                        logger.error(f"[MEDIA] [{account_manager.config.account_id}] [req_{request_id}] media{idx}prosesGagal: {str(save_error)[:100]}")
+                        error_msg = f"\n\n⚠️ media {idx} prosesGagal\n\n"
+                        mark_first_response()
+                        yield encode_chunk({"content": error_msg})
+
+                logger.info(f"[IMAGE] [{account_manager.config.account_id}] [req_{request_id}] gambarprosesSelesai: {success_count}/{len(file_ids)} Berhasil")
+
+            except Exception as e:
+                logger.error(f"[IMAGE] [{account_manager.config.account_id}] [req_{request_id}] gambarprosesGagal: {type(e).__name__}: {str(e)[:100]}")
+                # turunkanproses：gambarprosesGagal
+                error_msg = f"\n\n⚠️ gambarprosesGagal: {type(e).__name__}\n\n"
+                mark_first_response()
+                yield encode_chunk({"content": error_msg})
+    finally:
+        # klien putus / error / selesai: jangan biarkan unduhan gambar berjalan tanpa pemilik
+        cancel_image_downloads()
 
     if full_content:
-        response_preview = full_content[:500] + "...(terpotong)" if len(full_content) > 500 else full_content
-        logger.info(f"[CHAT] [{account_manager.config.account_id}] [req_{request_id}] AIrespon: {response_preview}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"[CHAT] [{account_manager.config.account_id}] [req_{request_id}] AIrespon: {_preview(full_content)}")
     else:
         logger.warning(f"[CHAT] [{account_manager.config.account_id}] [req_{request_id}] ⚠️ respon，ceklog")
 
 
-    if first_response_time:
-        latency_ms = int((first_response_time - start_time) * 1000)
+    if first_response_mono is not None:
+        latency_ms = int((first_response_mono - start_mono) * 1000)
         uptime_tracker.record_request(model_name, True, latency_ms)
     else:
         uptime_tracker.record_request(model_name, True)
 
-    total_time = time.time() - start_time
+    total_time = time.monotonic() - start_mono
     logger.info(f"[API] [{account_manager.config.account_id}] [req_{request_id}] Respons selesai: {total_time:.2f}detik")
     
     if is_stream:
-        final_chunk = create_chunk(chat_id, created_time, model_name, {}, "stop")
-        yield f"data: {final_chunk}\n\n"
-        yield "data: [DONE]\n\n"
+        yield encode_chunk({}, "stop")
+        yield SSE_DONE
 
 # ---------- publikendpoint（Tidak perlu autentikasi） ----------
 @app.get("/public/uptime")
@@ -2829,17 +3080,14 @@ async def get_public_stats():
     async with stats_lock:
         # bersihkan1jamsebelumpermintaantimestamp
         current_time = time.time()
-        recent_requests = [
-            ts for ts in global_stats["request_timestamps"]
-            if current_time - ts < 3600
-        ]
 
-        # setiapmenitpermintaanjumlah
-        recent_minute = [
-            ts for ts in recent_requests
-            if current_time - ts < 60
-        ]
-        requests_per_minute = len(recent_minute)
+        # setiapmenitpermintaanjumlah: timestamp terurut naik, hitung dari kanan sampai lewat 60 detik
+        cutoff = current_time - 60
+        requests_per_minute = 0
+        for ts in reversed(global_stats["request_timestamps"]):
+            if ts <= cutoff:
+                break
+            requests_per_minute += 1
 
         # status
         if requests_per_minute < 10:
@@ -2868,6 +3116,10 @@ async def get_public_display():
         "chat_url": CHAT_URL
     }
 
+def _start_ts_key(log: dict) -> float:
+    return log.get("start_ts", 0.0)
+
+
 @app.get("/public/log")
 async def get_public_logs(request: Request, limit: int = 100):
     try:
@@ -2877,46 +3129,44 @@ async def get_public_logs(request: Request, limit: int = 100):
 
         async with stats_lock:
             # bersihkan24jamsebelumIPcatat
-            if "visitor_ips" not in global_stats:
-                global_stats["visitor_ips"] = {}
-            global_stats["visitor_ips"] = {
-                ip: timestamp for ip, timestamp in global_stats["visitor_ips"].items()
-                if current_time - timestamp <= 86400
-            }
+            visitor_ips = global_stats.get("visitor_ips")
+            if not isinstance(visitor_ips, OrderedDict):
+                visitor_ips = global_stats["visitor_ips"] = OrderedDict(
+                    sorted((visitor_ips or {}).items(), key=itemgetter(1))
+                )
+            # urut waktu masuk: pop dari depan hanya yang kedaluwarsa, O(expired)
+            cutoff = current_time - 86400
+            visitors_changed = False
+            while visitor_ips and next(iter(visitor_ips.values())) < cutoff:
+                visitor_ips.popitem(last=False)
+                visitors_changed = True
 
             # catatakses（24jamsatuIPjumlahsatukali）
-            if client_ip not in global_stats["visitor_ips"]:
-                global_stats["visitor_ips"][client_ip] = current_time
+            if client_ip not in visitor_ips:
+                visitor_ips[client_ip] = current_time
                 global_stats["total_visitors"] = global_stats.get("total_visitors", 0) + 1
+                visitors_changed = True
 
-            global_stats.setdefault("recent_conversations", [])
-            await save_stats(global_stats)
+            stored_logs = list(global_stats.setdefault("recent_conversations", deque(maxlen=RECENT_CONVERSATIONS_MAX)))
 
-            stored_logs = list(global_stats.get("recent_conversations", []))
+        # hanya tandai dirty jika ada perubahan; penulisan dilakukan stats_persist_task
+        if visitors_changed:
+            request_save_stats()
 
         sanitized_logs = get_sanitized_logs(limit=min(limit, 1000))
 
-        log_map = {log.get("request_id"): log for log in sanitized_logs}
-        for log in stored_logs:
-            request_id = log.get("request_id")
-            if request_id and request_id not in log_map:
-                log_map[request_id] = log
-
-        def get_log_ts(item: dict) -> float:
-            if "start_ts" in item:
-                return float(item["start_ts"])
-            try:
-                return datetime.strptime(item.get("start_time", ""), "%Y-%m-%d %H:%M:%S").timestamp()
-            except Exception:
-                return 0.0
-
-        merged_logs = sorted(log_map.values(), key=get_log_ts, reverse=True)[:min(limit, 1000)]
-        output_logs = []
-        for log in merged_logs:
-            if "start_ts" in log:
-                log = dict(log)
-                log.pop("start_ts", None)
-            output_logs.append(log)
+        # gabung: log buffer diutamakan, recent_conversations hanya yang belum ada
+        # (start_ts selalu diisi saat ingest, jadi sort tanpa parsing waktu)
+        seen_ids = {log["request_id"] for log in sanitized_logs}
+        merged_logs = sanitized_logs + [
+            log for log in stored_logs
+            if log.get("request_id") and log["request_id"] not in seen_ids
+        ]
+        merged_logs.sort(key=_start_ts_key, reverse=True)
+        output_logs = [
+            {k: v for k, v in log.items() if k != "start_ts"}
+            for log in merged_logs[:min(limit, 1000)]
+        ]
 
         return {
             "total": len(output_logs),
@@ -2925,9 +3175,6 @@ async def get_public_logs(request: Request, limit: int = 100):
     except Exception as e:
         logger.error(f"[LOG] ambilpubliklogGagal: {e}")
         return {"total": 0, "logs": [], "error": str(e)}
-    except Exception as e:
-        logger.error(f"[LOG] ambilpubliklogGagal: {e}")
-        return {"total": 0, "logs": [], "error": str(e)}
 
 # ---------- global 404 proses（di） ----------
 
@@ -9,6 +9,7 @@ import json
 import base64
 import threading
 import os
+import hashlib
 import re
 import time
 from datetime import datetime, timedelta
@@ -17,14 +18,33 @@ from io import BytesIO
 import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog, messagebox
 import webbrowser
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
 import cv2
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional: stdlib fallback
+    orjson = None
+    _json_loads = json.loads
 
 # Konfigurasi
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
-# Modern Color Scheme
-COLORS = {
+# Max lines kept in append-only text widgets (older lines are dropped)
+MAX_TEXT_LINES = 2000
+
+# Logs tab page size (newest first; older pages are prefetched in the background)
+LOG_PAGE_SIZE = 200
+
+# Modern Color Scheme (read-only)
+COLORS = MappingProxyType({
     'primary': '#3B82F6',      # Modern blue
     'secondary': '#8B5CF6',    # Purple
     'success': '#10B981',      # Green
@@ -37,41 +57,10 @@ COLORS = {
     'border': '#334155',       # Border gray
     'text': '#E2E8F0',         # Text light
     'text_muted': '#94A3B8',   # Muted text
-}
-
-# Modern Icons (Unicode)
-ICONS = {
-    'dashboard': '◼',
-    'chat': '◐',
-    'image': '◈',
-    'video': '▶',
-    'gallery': '⊞',
-    'accounts': '◉',
-    'settings': '◎',
-    'monitor': '◬',
-    'logs': '≡',
-    'logout': '◁',
-    'refresh': '↻',
-    'play': '▶',
-    'pause': '▮▮',
-    'stop': '■',
-    'download': '⇩',
-    'upload': '⇧',
-    'open': '◫',
-    'folder': '▤',
-    'close': '✕',
-    'add': '+',
-    'edit': '✎',
-    'delete': '✕',
-    'save': '✓',
-    'check': '✓',
-    'error': '!',
-    'info': 'i',
-    'warning': '⚠',
-}
+})
 
 # Modern Icons (Unicode)
-ICONS = {
+ICONS = MappingProxyType({
     'dashboard': '■',
     'chat': '◐',
     'image': '◈',
@@ -99,7 +88,107 @@ ICONS = {
     'error': '!',
     'info': 'i',
     'warning': '⚠',
-}
+})
+
+# Icon + text labels for buttons/nav, formatted once at import
+LABELS = MappingProxyType({
+    'accounts': f"{ICONS['accounts']}  Accounts",
+    'chat': f"{ICONS['chat']}  Chat",
+    'close': f"{ICONS['close']}  Close",
+    'dashboard': f"{ICONS['dashboard']}  Dashboard",
+    'folder': f"{ICONS['folder']}  Folder",
+    'gallery': f"{ICONS['gallery']}  Gallery",
+    'generate_image': f"{ICONS['image']}  Generate Image",
+    'generate_video': f"{ICONS['video']}  Generate Video",
+    'load_settings': f"{ICONS['refresh']}  Load Settings",
+    'logout': f"{ICONS['logout']}  Logout",
+    'logs': f"{ICONS['logs']}  Logs",
+    'monitor': f"{ICONS['monitor']}  Monitor",
+    'older': f"{ICONS['upload']}  Older",
+    'open': f"{ICONS['open']}  Open",
+    'pause': f"{ICONS['pause']}  Pause",
+    'play': f"{ICONS['play']}  Play",
+    'refresh': f"{ICONS['refresh']}  Refresh",
+    'save': f"{ICONS['save']}  Save",
+    'save_settings': f"{ICONS['save']}  Save Settings",
+    'settings': f"{ICONS['settings']}  Settings",
+})
+
+THUMBNAIL_SIZE = (280, 200)
+THUMB_WIDGET_CACHE_SIZE = 200  # CTkImages kept for tiles that scroll back into view
+THUMB_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "g2pi", "thumbs")
+VIDEO_EXTENSIONS = ('.mp4', '.webm', '.mov', '.avi')
+
+# Gallery grid: only rows near the viewport get real cards (fixed row height keeps scroll geometry stable)
+GALLERY_COLUMNS = 3
+GALLERY_ROW_HEIGHT = 340
+GALLERY_ROW_BUFFER = 1
+
+
+@lru_cache(maxsize=64)
+def _font(size=13, weight="normal", family=None):
+    """Shared CTkFont per (size, weight, family); cleared when the root window is recreated"""
+    return ctk.CTkFont(family=family, size=size, weight=weight)
+
+
+def _thumb_cache_path(filepath, mtime, size):
+    """~/.cache/g2pi/thumbs/<sha1(path:mtime:size)>.jpg"""
+    key = f"{os.path.abspath(filepath)}:{mtime}:{size[0]}x{size[1]}"
+    return os.path.join(THUMB_CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + ".jpg")
+
+
+def _render_thumbnail(filepath, size):
+    """Full decode of the source (image, or one frame ~0.5s into a video), shrunk to size"""
+    if filepath.lower().endswith(VIDEO_EXTENSIONS):
+        cap = cv2.VideoCapture(filepath)
+        try:
+            cap.set(cv2.CAP_PROP_POS_MSEC, 500)
+            ret, frame = cap.read()
+            if not ret:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                ret, frame = cap.read()
+        finally:
+            cap.release()
+        if not ret:
+            raise ValueError(f"No frame in {filepath}")
+        img = Image.fromarray(frame[:, :, ::-1])
+        img.thumbnail(size, Image.Resampling.LANCZOS)
+        return img
+    with Image.open(filepath) as img:
+        img.draft("RGB", size)  # JPEG: decode at reduced scale
+        img.thumbnail(size, Image.Resampling.LANCZOS)
+        return img.convert("RGB")
+
+
+@lru_cache(maxsize=256)
+def load_thumbnail(filepath, mtime, size=THUMBNAIL_SIZE):
+    """Thumbnail from memory, then the on-disk JPEG cache, then a full decode (written back atomically)"""
+    cache_path = _thumb_cache_path(filepath, mtime, size)
+    try:
+        with Image.open(cache_path) as cached:
+            cached.load()
+            return cached.copy()
+    except (OSError, ValueError):
+        pass
+    
+    img = _render_thumbnail(filepath, size)
+    try:
+        os.makedirs(THUMB_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        img.save(tmp_path, "JPEG", quality=82)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # cache is best-effort
+    return img
+
+
+# SSE "data:" field prefix (optional space per spec), matched on raw bytes
+_SSE_DATA = re.compile(rb"data:\s?")
+
+
+def _decode(response):
+    """Decode a JSON response straight from bytes (orjson when available)"""
+    return _json_loads(response.content)
 
 
 class APIClient:
@@ -108,7 +197,107 @@ class APIClient:
     def __init__(self, base_url):
         self.base_url = base_url
         self.session = requests.Session()
+        # Pool koneksi keep-alive: satu host; 4 worker IO + beberapa thread chat/generate
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+                              allowed_methods=["GET"]),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Connection": "keep-alive",
+            "Accept-Encoding": "gzip, deflate",
+        })
         self.logged_in = False
+        # TTL cache for slow-changing GETs: key -> (timestamp, data)
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        # Invalidation counters: prefix -> count (None counts full invalidations)
+        self._invalidations = {}
+        # Conditional GET state: (path, params) -> (etag, data)
+        self._etags = {}
+        # Single-flight: key -> Future of the request currently running for it
+        self._inflight = {}
+    
+    def _shared(self, key, fetch):
+        """Run fetch once for concurrent callers of the same key; the others wait for its result"""
+        with self._cache_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+        try:
+            result = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._cache_lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+    
+    def _cached(self, key, ttl, fetch):
+        """Return cached result for key if younger than ttl seconds, else fetch and store"""
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry and now - entry[0] < ttl:
+            return entry[1]
+        with self._cache_lock:
+            generation = self._invalidation_count(key[0])
+        data = self._shared(key, fetch)
+        with self._cache_lock:
+            # A write invalidated this key while we fetched: the result may predate it, do not cache
+            if self._invalidation_count(key[0]) == generation:
+                self._cache[key] = (now, data)
+        return data
+    
+    def _invalidation_count(self, prefix):
+        """Invalidations so far covering prefix (caller holds _cache_lock)"""
+        return (self._invalidations.get(None, 0), self._invalidations.get(prefix, 0))
+    
+    def invalidate(self, prefix=None):
+        """Drop cached entries whose key starts with prefix (all entries if None)"""
+        with self._cache_lock:
+            self._invalidations[prefix] = self._invalidations.get(prefix, 0) + 1
+            if prefix is None:
+                self._cache.clear()
+                self._inflight.clear()
+            else:
+                for key in [k for k in self._cache if k[0] == prefix]:
+                    del self._cache[key]
+                # Callers after a write must not join a fetch that started before it
+                for key in [k for k in self._inflight if k[0] == prefix]:
+                    del self._inflight[key]
+    
+    def _get_json_conditional(self, path, params=None):
+        """GET with If-None-Match; on 304 reuse the last decoded body (no-op if server sends no ETag)"""
+        key = (path, tuple(sorted((params or {}).items())))
+        with self._cache_lock:
+            cached = self._etags.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self.session.get(f"{self.base_url}{path}", params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached[1]
+        response.raise_for_status()
+        data = _decode(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._cache_lock:
+                self._etags[key] = (etag, data)
+        return data
+    
+    def _get_json(self, path, **kwargs):
+        response = self.session.get(f"{self.base_url}{path}", **kwargs)
+        response.raise_for_status()
+        return _decode(response)
         
     def login(self, admin_key):
         """Login dengan ADMIN_KEY"""
@@ -116,7 +305,8 @@ class APIClient:
             response = self.session.post(
                 f"{self.base_url}/login",
                 data={"admin_key": admin_key},
-                timeout=10
+                # Short (connect, read); connect failures are retried by the pooled adapter's Retry
+                timeout=(3, 5)
             )
             response.raise_for_status()
             self.logged_in = True
@@ -132,13 +322,14 @@ class APIClient:
         except:
             pass
         self.logged_in = False
+        self.invalidate()
+        with self._cache_lock:
+            self._etags.clear()
     
     # Account Management
     def get_accounts(self):
-        """Get all accounts"""
-        response = self.session.get(f"{self.base_url}/admin/accounts")
-        response.raise_for_status()
-        return response.json()
+        """Get all accounts (concurrent callers share one request)"""
+        return self._shared(("accounts",), lambda: self._get_json_conditional("/admin/accounts"))
     
     def add_account(self, account_data):
         """Add new account"""
@@ -147,7 +338,10 @@ class APIClient:
             json=account_data
         )
         response.raise_for_status()
-        return response.json()
+        self.invalidate("stats")
+        self.invalidate("health")
+        self.invalidate("accounts")
+        return _decode(response)
     
     def update_account(self, account_id, account_data):
         """Update account"""
@@ -156,7 +350,10 @@ class APIClient:
             json=account_data
         )
         response.raise_for_status()
-        return response.json()
+        self.invalidate("stats")
+        self.invalidate("health")
+        self.invalidate("accounts")
+        return _decode(response)
     
     def delete_account(self, account_id):
         """Delete account"""
@@ -164,14 +361,15 @@ class APIClient:
             f"{self.base_url}/admin/accounts/{account_id}"
         )
         response.raise_for_status()
-        return response.json()
+        self.invalidate("stats")
+        self.invalidate("health")
+        self.invalidate("accounts")
+        return _decode(response)
     
     # Settings Management
     def get_settings(self):
-        """Get system settings"""
-        response = self.session.get(f"{self.base_url}/admin/settings")
-        response.raise_for_status()
-        return response.json()
+        """Get system settings (cached 60s)"""
+        return self._cached(("settings",), 60, lambda: self._get_json("/admin/settings"))
     
     def update_settings(self, settings_data):
         """Update system settings"""
@@ -180,7 +378,8 @@ class APIClient:
             json=settings_data
         )
         response.raise_for_status()
-        return response.json()
+        self.invalidate("settings")
+        return _decode(response)
     
     # Auto-Register
     def start_auto_register(self, count):
@@ -194,13 +393,13 @@ class APIClient:
             json=data
         )
         response.raise_for_status()
-        return response.json()
+        return _decode(response)
     
     def get_register_status(self):
         """Get current register task status"""
         response = self.session.get(f"{self.base_url}/admin/register/current")
         response.raise_for_status()
-        return response.json()
+        return _decode(response)
     
     def cancel_register_task(self, task_id, reason="cancelled"):
         """Cancel register task"""
@@ -209,33 +408,24 @@ class APIClient:
             json={"reason": reason}
         )
         response.raise_for_status()
-        return response.json()
+        return _decode(response)
     
     # Monitoring
     def get_stats(self, time_range="24h"):
-        """Get statistics"""
-        response = self.session.get(
-            f"{self.base_url}/admin/stats",
-            params={"time_range": time_range}
+        """Get statistics (cached 5s per time range)"""
+        return self._cached(
+            ("stats", time_range), 5,
+            lambda: self._get_json("/admin/stats", params={"time_range": time_range})
         )
-        response.raise_for_status()
-        return response.json()
     
     def get_health(self):
-        """Get system health"""
-        response = self.session.get(f"{self.base_url}/admin/health")
-        response.raise_for_status()
-        return response.json()
+        """Get system health (cached 5s)"""
+        return self._cached(("health",), 5, lambda: self._get_json("/admin/health"))
     
     # Logs
-    def get_logs(self, limit=100, skip=0):
+    def get_logs(self, limit=LOG_PAGE_SIZE, skip=0):
         """Get logs"""
-        response = self.session.get(
-            f"{self.base_url}/admin/log",
-            params={"limit": limit, "skip": skip}
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._get_json_conditional("/admin/log", params={"limit": limit, "skip": skip})
     
     # AI Operations
     def chat_completion(self, model, messages, stream=False):
@@ -250,7 +440,36 @@ class APIClient:
             timeout=120
         )
         response.raise_for_status()
-        return response.json()
+        return _decode(response)
+    
+    def stream_chat_completion(self, model, messages):
+        """Streaming chat completion, yields content deltas as they arrive (SSE)"""
+        with self.session.post(
+            f"{self.base_url}/v1/chat/completions",
+            json={
+                "model": model,
+                "messages": messages,
+                "stream": True
+            },
+            stream=True,
+            timeout=(10, 120)
+        ) as response:
+            response.raise_for_status()
+            # Raw bytes straight into the JSON parser (no per-line str decode)
+            for line in response.iter_lines():
+                match = _SSE_DATA.match(line)
+                if not match:
+                    continue
+                payload = line[match.end():]
+                if payload == b"[DONE]":
+                    break
+                chunk = _json_loads(payload)
+                if "error" in chunk:
+                    raise RuntimeError(chunk["error"].get("message", "Stream error"))
+                choices = chunk.get("choices") or [{}]
+                text = choices[0].get("delta", {}).get("content")
+                if text:
+                    yield text
 
 
 class LoginWindow(ctk.CTkToplevel):
@@ -284,14 +503,14 @@ class LoginWindow(ctk.CTkToplevel):
         title = ctk.CTkLabel(
             self,
             text="🤖 Msverify",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=_font(24, "bold")
         )
         title.pack(pady=(40, 10))
         
         subtitle = ctk.CTkLabel(
             self,
             text="Management Console Login",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             text_color="gray"
         )
         subtitle.pack(pady=(0, 30))
@@ -300,7 +519,7 @@ class LoginWindow(ctk.CTkToplevel):
         ctk.CTkLabel(
             self,
             text="Admin Key:",
-            font=ctk.CTkFont(size=13)
+            font=_font(13)
         ).pack(pady=(0, 5))
         
         self.admin_key_entry = ctk.CTkEntry(
@@ -319,7 +538,7 @@ class LoginWindow(ctk.CTkToplevel):
             text="Login",
             width=300,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             command=self.do_login
         )
         self.login_btn.pack(pady=(0, 10))
@@ -328,7 +547,7 @@ class LoginWindow(ctk.CTkToplevel):
         self.status_label = ctk.CTkLabel(
             self,
             text="",
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             text_color="red"
         )
         self.status_label.pack(pady=(10, 0))
@@ -381,6 +600,11 @@ class VideoPlayerWindow(ctk.CTkToplevel):
         self.total_frames = 0
         self.fps = 30
         self.play_thread = None
+        self._cap_lock = threading.Lock()
+        self._closed = False
+        self._display_size = None
+        self._seek_pending = None
+        self._seek_after = None
         
         # Window config
         self.title(f"Video Player - {self.video_name}")
@@ -402,7 +626,7 @@ class VideoPlayerWindow(ctk.CTkToplevel):
         self.video_label = ctk.CTkLabel(
             self,
             text="Loading video...",
-            font=ctk.CTkFont(size=14)
+            font=_font(14)
         )
         self.video_label.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
         
@@ -414,10 +638,10 @@ class VideoPlayerWindow(ctk.CTkToplevel):
         # Play/Pause button
         self.play_btn = ctk.CTkButton(
             controls,
-            text=f"{ICONS['play']}  Play",
+            text=LABELS['play'],
             width=100,
             command=self.toggle_play,
-            font=ctk.CTkFont(size=16)
+            font=_font(16)
         )
         self.play_btn.grid(row=0, column=0, padx=5, pady=10)
         
@@ -435,14 +659,14 @@ class VideoPlayerWindow(ctk.CTkToplevel):
         self.time_label = ctk.CTkLabel(
             controls,
             text="00:00 / 00:00",
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         self.time_label.grid(row=0, column=2, padx=10, pady=10)
         
         # Close button
         close_btn = ctk.CTkButton(
             controls,
-            text=f"{ICONS['close']}  Close",
+            text=LABELS['close'],
             width=80,
             command=self.close_player,
             fg_color="red"
@@ -460,49 +684,59 @@ class VideoPlayerWindow(ctk.CTkToplevel):
             self.total_frames = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
             self.fps = self.cap.get(cv2.CAP_PROP_FPS)
             
+            # Display size fitted once (max 860x500) instead of per frame
+            w = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            h = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            max_w, max_h = 860, 500
+            if w > 0 and h > 0 and (w > max_w or h > max_h):
+                scale = min(max_w/w, max_h/h)
+                self._display_size = (int(w*scale), int(h*scale))
+            
             # Update progress bar
             self.progress.configure(to=self.total_frames)
             
             # Show first frame
-            self.show_frame(0)
+            self._show_frame_seek(0)
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load video: {e}")
             self.destroy()
     
-    def show_frame(self, frame_number):
-        """Show specific frame"""
+    def _show_frame_seek(self, frame_number):
+        """Seek to a specific frame and show it (scrub / initial frame)"""
         try:
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-            ret, frame = self.cap.read()
-            
+            with self._cap_lock:
+                if self.cap is None:
+                    return
+                self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+                ret, frame = self.cap.read()
             if ret:
-                # Convert BGR to RGB
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                
-                # Resize to fit display (max 860x500)
-                h, w = frame.shape[:2]
-                max_w, max_h = 860, 500
-                
-                if w > max_w or h > max_h:
-                    scale = min(max_w/w, max_h/h)
-                    new_w, new_h = int(w*scale), int(h*scale)
-                    frame = cv2.resize(frame, (new_w, new_h))
-                
-                # Convert to PhotoImage
-                img = Image.fromarray(frame)
-                photo = ctk.CTkImage(light_image=img, dark_image=img, size=(img.width, img.height))
-                
-                self.video_label.configure(image=photo, text="")
-                self.video_label.image = photo
-                
-                self.current_frame = frame_number
-                self.update_time_label()
-                self.progress.set(frame_number)
-                
+                self._apply_frame(self._prepare_frame(frame), frame_number)
         except Exception as e:
             print(f"Error showing frame: {e}")
     
+    def _prepare_frame(self, frame):
+        """Convert a decoded BGR frame into a display image (safe to run off the Tk thread)"""
+        # Resize to fit display first (target size computed once per video) so later work is on the small frame
+        if self._display_size:
+            # INTER_AREA: cheaper and cleaner than the default bilinear for downscaling
+            frame = cv2.resize(frame, self._display_size, interpolation=cv2.INTER_AREA)
+        
+        # BGR -> RGB as a reversed-channel view (no cvtColor pass)
+        img = Image.fromarray(frame[:, :, ::-1])
+        return ctk.CTkImage(light_image=img, dark_image=img, size=(img.width, img.height))
+    
+    def _apply_frame(self, photo, frame_number):
+        """Show a prepared frame (Tk thread only, cheap)"""
+        if not self.winfo_exists():
+            return
+        self.video_label.configure(image=photo, text="")
+        self.video_label.image = photo
+        
+        self.current_frame = frame_number
+        self.update_time_label()
+        self.progress.set(frame_number)
+    
     def toggle_play(self):
         """Toggle play/pause"""
         if self.is_playing:
@@ -515,7 +749,7 @@ class VideoPlayerWindow(ctk.CTkToplevel):
         if not self.is_playing:
             self.is_playing = True
             self.is_paused = False
-            self.play_btn.configure(text=f"{ICONS['pause']}  Pause")
+            self.play_btn.configure(text=LABELS['pause'])
             
             # Start play thread
             self.play_thread = threading.Thread(target=self._play_loop, daemon=True)
@@ -525,26 +759,76 @@ class VideoPlayerWindow(ctk.CTkToplevel):
         """Pause video"""
         self.is_playing = False
         self.is_paused = True
-        self.play_btn.configure(text=f"{ICONS['play']}  Play")
+        self.play_btn.configure(text=LABELS['play'])
     
     def _play_loop(self):
-        """Play loop in background thread"""
-        while self.is_playing and self.current_frame < self.total_frames - 1:
-            frame_delay = 1.0 / self.fps if self.fps > 0 else 0.033
+        """Play loop in background thread: decode + convert here, Tk thread only swaps the image"""
+        frame_delay = 1.0 / max(self.fps, 1) if self.fps > 0 else 0.033
+        frame_number = self.current_frame
+        next_due = time.monotonic()
+        while self.is_playing and frame_number < self.total_frames - 1:
+            try:
+                with self._cap_lock:
+                    if self.cap is None:
+                        # Player closed while this thread was decoding
+                        break
+                    ret, frame = self.cap.read()
+                if not ret:
+                    # Stream ended earlier than CAP_PROP_FRAME_COUNT claimed
+                    frame_number = self.total_frames - 1
+                    break
+                frame_number += 1
+                photo = self._prepare_frame(frame)
+            except Exception as e:
+                print(f"Error showing frame: {e}")
+                break
+            if not self._post_to_ui(self._apply_frame, photo, frame_number):
+                break
             
-            self.after(0, lambda: self.show_frame(self.current_frame + 1))
-            time.sleep(frame_delay)
+            # Pace against a deadline so decode time is not added on top of the frame delay
+            next_due += frame_delay
+            delay = next_due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -frame_delay:
+                # Behind schedule: drop frames with grab() (demux only, no full decode)
+                skipped = min(int(-delay / frame_delay), self.total_frames - 1 - frame_number)
+                with self._cap_lock:
+                    for _ in range(skipped):
+                        if self.cap is None or not self.cap.grab():
+                            break
+                        frame_number += 1
+                next_due += skipped * frame_delay
         
         # End of video
-        if self.current_frame >= self.total_frames - 1:
-            self.after(0, lambda: self.play_btn.configure(text="▶ Replay"))
+        if frame_number >= self.total_frames - 1:
+            self._post_to_ui(lambda: self.play_btn.configure(text="▶ Replay"))
             self.is_playing = False
     
+    def _post_to_ui(self, callback, *args):
+        """Schedule a callback on the Tk thread from the play thread; False once the window is gone"""
+        if self._closed:
+            return False
+        try:
+            self.after(0, callback, *args)
+        except (tk.TclError, RuntimeError):
+            # Window destroyed between the check and the call
+            return False
+        return True
+    
     def on_progress_change(self, value):
         """Handle progress bar change"""
         if not self.is_playing:
-            frame_num = int(value)
-            self.show_frame(frame_num)
+            # Debounce: while dragging only the last position within 80ms actually seeks + decodes
+            self._seek_pending = int(value)
+            if self._seek_after is None:
+                self._seek_after = self.after(80, self._do_seek)
+    
+    def _do_seek(self):
+        """Run the pending debounced seek"""
+        frame_num, self._seek_pending, self._seek_after = self._seek_pending, None, None
+        if frame_num is not None and not self.is_playing:
+            self._show_frame_seek(frame_num)
     
     def update_time_label(self):
         """Update time label"""
@@ -557,18 +841,25 @@ class VideoPlayerWindow(ctk.CTkToplevel):
             
             self.time_label.configure(text=f"{current_str} / {total_str}")
     
+    def _release_cap(self):
+        """Stop playback and release the capture; the lock waits out a read in progress on the play thread"""
+        self.is_playing = False
+        self._closed = True
+        with self._cap_lock:
+            if self.cap is not None:
+                self.cap.release()
+                self.cap = None
+    
     def close_player(self):
         """Close player"""
-        self.is_playing = False
-        if self.cap:
-            self.cap.release()
         self.destroy()
     
     def destroy(self):
         """Override destroy to cleanup"""
-        self.is_playing = False
-        if self.cap:
-            self.cap.release()
+        if self._seek_after is not None:
+            self.after_cancel(self._seek_after)
+            self._seek_after = None
+        self._release_cap()
         super().destroy()
 
 
@@ -589,9 +880,25 @@ class GeminiManagementApp(ctk.CTk):
         self.current_image = None
         self.current_video_url = None
         self.chat_history = []
+        self._chat_buf = []  # streamed deltas waiting for the next batched insert
+        self._chat_flush_job = None
         self.accounts_data = []
+        self._logs_generation = 0  # bumped on refresh so stale prefetches are dropped
+        self._logs_next_skip = 0
+        self._logs_prefetched = None  # (skip, logs) of the next older page
+        self._logs_has_more = False
         self.settings_data = {}
         self.stats_data = {}
+        self._pending_refresh = {}  # tab -> after() id of the debounced refresh
+        self._refresh_gen = {}  # tab -> generation of the latest refresh (older results are dropped)
+        self._refresh_inflight = set()  # single-flight tabs with a fetch running
+        self._last_values = {}  # widget key -> last value written (skip no-op UI updates)
+        self._auto_refresh = False  # monitor auto-refresh, driven by after() on the Tk loop
+        self._auto_interval_ms = 5000
+        self._auto_after = None
+        self._thumb_pool = ThreadPoolExecutor(max_workers=2)  # thumbnail decode off the Tk thread
+        self._thumb_cache = OrderedDict()  # (path, mtime) -> CTkImage, LRU
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="g2pi-io")  # short API calls
         
         # Setup UI
         self.setup_ui()
@@ -599,6 +906,12 @@ class GeminiManagementApp(ctk.CTk):
         # Show login
         self.after(100, self.show_login)
         
+    def destroy(self):
+        """Stop background pools (queued work is dropped) before tearing down Tk"""
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._thumb_pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+        
     def show_login(self):
         """Show login window"""
         login_window = LoginWindow(self, self.api_client, self.on_login_success)
@@ -609,21 +922,23 @@ class GeminiManagementApp(ctk.CTk):
         
     def load_initial_data(self):
         """Load initial data after login"""
-        threading.Thread(target=self._load_initial_data_thread, daemon=True).start()
-        
-    def _load_initial_data_thread(self):
-        """Load data in background"""
+        # Load accounts & stats concurrently on the IO pool (shared keep-alive pool), render each as it lands
+        loaders = {
+            self.api_client.get_accounts: self.update_accounts_list,
+            self.api_client.get_stats: self.update_dashboard_stats,
+        }
+        for fetch, render in loaders.items():
+            future = self._io_pool.submit(fetch)
+            future.add_done_callback(lambda f, render=render: self._on_initial_data(f, render))
+    
+    def _on_initial_data(self, future, render):
+        """Pool thread: hand a loaded payload to the Tk thread"""
         try:
-            # Load accounts
-            accounts = self.api_client.get_accounts()
-            self.after(0, lambda: self.update_accounts_list(accounts))
-            
-            # Load stats
-            stats = self.api_client.get_stats()
-            self.after(0, lambda: self.update_dashboard_stats(stats))
-            
+            data = future.result()
         except Exception as e:
             print(f"Error loading data: {e}")
+            return
+        self.after(0, render, data)
     
     def setup_ui(self):
         """Setup main UI"""
@@ -650,7 +965,7 @@ class GeminiManagementApp(ctk.CTk):
         title = ctk.CTkLabel(
             logo_frame,
             text="▲ Msverify AI",
-            font=ctk.CTkFont(size=26, weight="bold"),
+            font=_font(26, "bold"),
             text_color=COLORS['primary']
         )
         title.pack()
@@ -658,7 +973,7 @@ class GeminiManagementApp(ctk.CTk):
         subtitle = ctk.CTkLabel(
             logo_frame,
             text="Management Console",
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             text_color=COLORS['text_muted']
         )
         subtitle.pack(pady=(5, 0))
@@ -669,15 +984,15 @@ class GeminiManagementApp(ctk.CTk):
         
         # Navigation buttons
         nav_buttons = [
-            (f"{ICONS['dashboard']}  Dashboard", "dashboard"),
-            (f"{ICONS['chat']}  Chat", "chat"),
-            (f"{ICONS['image']}  Generate Image", "image"),
-            (f"{ICONS['video']}  Generate Video", "video"),
-            (f"{ICONS['gallery']}  Gallery", "gallery"),
-            (f"{ICONS['accounts']}  Accounts", "accounts"),
-            (f"{ICONS['settings']}  Settings", "settings"),
-            (f"{ICONS['monitor']}  Monitor", "monitor"),
-            (f"{ICONS['logs']}  Logs", "logs"),
+            (LABELS['dashboard'], "dashboard"),
+            (LABELS['chat'], "chat"),
+            (LABELS['generate_image'], "image"),
+            (LABELS['generate_video'], "video"),
+            (LABELS['gallery'], "gallery"),
+            (LABELS['accounts'], "accounts"),
+            (LABELS['settings'], "settings"),
+            (LABELS['monitor'], "monitor"),
+            (LABELS['logs'], "logs"),
         ]
         
         self.nav_buttons = {}
@@ -687,7 +1002,7 @@ class GeminiManagementApp(ctk.CTk):
                 text=text,
                 command=lambda t=tab_id: self.show_tab(t),
                 height=44,
-                font=ctk.CTkFont(size=13, weight="normal"),
+                font=_font(13),
                 anchor="w",
                 fg_color="transparent",
                 hover_color=COLORS['dark'],
@@ -700,10 +1015,10 @@ class GeminiManagementApp(ctk.CTk):
         # Logout button with modern styling
         logout_btn = ctk.CTkButton(
             sidebar,
-            text=f"{ICONS['logout']}  Logout",
+            text=LABELS['logout'],
             command=self.do_logout,
             height=42,
-            font=ctk.CTkFont(size=13),
+            font=_font(13),
             fg_color="transparent",
             hover_color=COLORS['danger'],
             border_width=1,
@@ -720,20 +1035,55 @@ class GeminiManagementApp(ctk.CTk):
         self.main_container.grid_rowconfigure(0, weight=1)
         self.main_container.grid_columnconfigure(0, weight=1)
         
-        # Create all tabs
-        self.dashboard_frame = self.create_dashboard_tab()
-        self.chat_frame = self.create_chat_tab()
-        self.image_frame = self.create_image_tab()
-        self.video_frame = self.create_video_tab()
-        self.gallery_frame = self.create_gallery_tab()
-        self.accounts_frame = self.create_accounts_tab()
-        self.settings_frame = self.create_settings_tab()
-        self.monitor_frame = self.create_monitor_tab()
-        self.logs_frame = self.create_logs_tab()
+        # Tabs are built on first show_tab() (only pay widget/paint cost for tabs actually visited)
+        self._tab_factories = {
+            "dashboard": self.create_dashboard_tab,
+            "chat": self.create_chat_tab,
+            "image": self.create_image_tab,
+            "video": self.create_video_tab,
+            "gallery": self.create_gallery_tab,
+            "accounts": self.create_accounts_tab,
+            "settings": self.create_settings_tab,
+            "monitor": self.create_monitor_tab,
+            "logs": self.create_logs_tab,
+        }
+        self._tabs = {}
+        self._active_tab = None
         
         # Show dashboard by default
         self.show_tab("dashboard")
         
+    # Outline button style shared by tab header strips
+    OUTLINE_BUTTON = MappingProxyType({"fg_color": "transparent", "border_width": 2})
+    
+    def create_tab_frame(self, title, buttons=()):
+        """Common tab scaffold: frame + header (title, right-aligned button strip). Returns (frame, buttons)"""
+        frame = ctk.CTkFrame(self.main_container)
+        frame.grid_rowconfigure(1, weight=1)
+        frame.grid_columnconfigure(0, weight=1)
+        
+        # Header
+        header = ctk.CTkFrame(frame, height=60, corner_radius=0, fg_color="transparent")
+        header.grid(row=0, column=0, sticky="ew")
+        header.grid_columnconfigure(0, weight=1)
+        
+        ctk.CTkLabel(
+            header,
+            text=title,
+            font=_font(24, "bold")
+        ).grid(row=0, column=0, padx=30, pady=15, sticky="w")
+        
+        created = []
+        if buttons:
+            button_frame = ctk.CTkFrame(header, fg_color="transparent")
+            button_frame.grid(row=0, column=1, padx=30, pady=15)
+            for spec in buttons:
+                btn = ctk.CTkButton(button_frame, **spec)
+                btn.pack(side="left", padx=5)
+                created.append(btn)
+        
+        return frame, created
+    
     def create_dashboard_tab(self):
         """Create dashboard tab"""
         frame = ctk.CTkFrame(self.main_container)
@@ -748,13 +1098,13 @@ class GeminiManagementApp(ctk.CTk):
         title = ctk.CTkLabel(
             header,
             text="📊 Dashboard",
-            font=ctk.CTkFont(size=28, weight="bold")
+            font=_font(28, "bold")
         )
         title.grid(row=0, column=0, padx=30, pady=20, sticky="w")
         
         refresh_btn = ctk.CTkButton(
             header,
-            text=f"{ICONS['refresh']}  Refresh",
+            text=LABELS['refresh'],
             width=120,
             height=35,
             command=self.refresh_dashboard,
@@ -787,20 +1137,51 @@ class GeminiManagementApp(ctk.CTk):
         activity_label = ctk.CTkLabel(
             stats_container,
             text="📈 Recent Activity",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=_font(18, "bold"),
             anchor="w"
         )
         activity_label.grid(row=1, column=0, columnspan=4, padx=10, pady=(20, 10), sticky="w")
         
-        self.activity_text = ctk.CTkTextbox(
-            stats_container,
-            height=300,
-            font=ctk.CTkFont(size=12)
-        )
-        self.activity_text.grid(row=2, column=0, columnspan=4, padx=10, pady=10, sticky="nsew")
+        activity_box, self.activity_text = self.create_plain_text(stats_container, height=15, font_size=12)
+        activity_box.grid(row=2, column=0, columnspan=4, padx=10, pady=10, sticky="nsew")
         
         return frame
     
+    def create_plain_text(self, parent, wrap="word", height=None, font_size=11):
+        """Native tk.Text + CTkScrollbar inside a CTkFrame (no canvas redraw per insert)"""
+        container = ctk.CTkFrame(parent, fg_color=COLORS['darker'])
+        container.grid_rowconfigure(0, weight=1)
+        container.grid_columnconfigure(0, weight=1)
+        
+        text = tk.Text(
+            container,
+            bg=COLORS['darker'],
+            fg=COLORS['text'],
+            insertbackground=COLORS['text'],
+            selectbackground=COLORS['primary'],
+            relief="flat",
+            borderwidth=0,
+            highlightthickness=0,
+            font=("Consolas", font_size),
+            wrap=wrap,
+        )
+        if height:
+            text.configure(height=height)
+        text.grid(row=0, column=0, sticky="nsew", padx=(8, 0), pady=8)
+        
+        scrollbar = ctk.CTkScrollbar(container, command=text.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns", pady=8)
+        text.configure(yscrollcommand=scrollbar.set)
+        
+        if wrap == "none":
+            # Unwrapped long lines are otherwise only reachable with the keyboard
+            text.grid_configure(pady=(8, 0))
+            h_scrollbar = ctk.CTkScrollbar(container, orientation="horizontal", command=text.xview)
+            h_scrollbar.grid(row=1, column=0, sticky="ew", padx=(8, 0), pady=(0, 8))
+            text.configure(xscrollcommand=h_scrollbar.set)
+        
+        return container, text
+    
     def create_stat_card(self, parent, emoji, title, value, color):
         """Create a stat card"""
         card = ctk.CTkFrame(parent, fg_color=color, corner_radius=10)
@@ -809,25 +1190,28 @@ class GeminiManagementApp(ctk.CTk):
         emoji_label = ctk.CTkLabel(
             card,
             text=emoji,
-            font=ctk.CTkFont(size=40)
+            font=_font(40)
         )
         emoji_label.grid(row=0, column=0, padx=20, pady=(20, 5))
         
+        # Bound once; refreshes only set the variable instead of reconfiguring the label
+        value_var = tk.StringVar(value=value)
         value_label = ctk.CTkLabel(
             card,
-            text=value,
-            font=ctk.CTkFont(size=32, weight="bold")
+            textvariable=value_var,
+            font=_font(32, "bold")
         )
         value_label.grid(row=1, column=0, padx=20, pady=5)
         
         title_label = ctk.CTkLabel(
             card,
             text=title,
-            font=ctk.CTkFont(size=13)
+            font=_font(13)
         )
         title_label.grid(row=2, column=0, padx=20, pady=(5, 20))
         
         card.value_label = value_label
+        card.var = value_var
         return card
         
     def create_chat_tab(self):
@@ -844,7 +1228,7 @@ class GeminiManagementApp(ctk.CTk):
         title = ctk.CTkLabel(
             header,
             text="💬 AI Chat",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=_font(24, "bold")
         )
         title.grid(row=0, column=0, padx=30, pady=15, sticky="w")
         
@@ -866,7 +1250,7 @@ class GeminiManagementApp(ctk.CTk):
         
         self.chat_display = ctk.CTkTextbox(
             chat_container,
-            font=ctk.CTkFont(size=13),
+            font=_font(13),
             wrap="word"
         )
         self.chat_display.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
@@ -879,7 +1263,7 @@ class GeminiManagementApp(ctk.CTk):
         self.chat_input = ctk.CTkTextbox(
             input_frame,
             height=80,
-            font=ctk.CTkFont(size=13)
+            font=_font(13)
         )
         self.chat_input.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
         self.chat_input.bind("<Control-Return>", lambda e: self.send_chat())
@@ -890,7 +1274,7 @@ class GeminiManagementApp(ctk.CTk):
             command=self.send_chat,
             height=80,
             width=150,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         send_btn.grid(row=0, column=1, padx=10, pady=10)
         
@@ -898,20 +1282,7 @@ class GeminiManagementApp(ctk.CTk):
     
     def create_image_tab(self):
         """Create image generation tab"""
-        frame = ctk.CTkFrame(self.main_container)
-        frame.grid_rowconfigure(1, weight=1)
-        frame.grid_columnconfigure(0, weight=1)
-        
-        # Header
-        header = ctk.CTkFrame(frame, height=60, corner_radius=0, fg_color="transparent")
-        header.grid(row=0, column=0, sticky="ew")
-        
-        title = ctk.CTkLabel(
-            header,
-            text="🎨 Image Generation",
-            font=ctk.CTkFont(size=24, weight="bold")
-        )
-        title.grid(row=0, column=0, padx=30, pady=15, sticky="w")
+        frame, _ = self.create_tab_frame("🎨 Image Generation")
         
         # Content
         content = ctk.CTkFrame(frame)
@@ -927,22 +1298,22 @@ class GeminiManagementApp(ctk.CTk):
         ctk.CTkLabel(
             left_panel,
             text="Enter your prompt:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         ).pack(padx=20, pady=(20, 10), anchor="w")
         
         self.image_prompt = ctk.CTkTextbox(
             left_panel,
             height=200,
-            font=ctk.CTkFont(size=13)
+            font=_font(13)
         )
         self.image_prompt.pack(padx=20, pady=10, fill="both", expand=True)
         
         self.image_generate_btn = ctk.CTkButton(
             left_panel,
-            text=f"{ICONS['image']}  Generate Image",
+            text=LABELS['generate_image'],
             command=self.generate_image,
             height=50,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=_font(16, "bold"),
             fg_color=COLORS['primary']
         )
         self.image_generate_btn.pack(padx=20, pady=20, fill="x")
@@ -950,7 +1321,7 @@ class GeminiManagementApp(ctk.CTk):
         self.image_loading_label = ctk.CTkLabel(
             left_panel,
             text="",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color="gray"
         )
         self.image_loading_label.pack(padx=20, pady=(0, 10))
@@ -968,12 +1339,12 @@ class GeminiManagementApp(ctk.CTk):
         ctk.CTkLabel(
             preview_header,
             text="Preview:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         ).grid(row=0, column=0, sticky="w")
         
         save_btn = ctk.CTkButton(
             preview_header,
-            text=f"{ICONS['save']}  Save",
+            text=LABELS['save'],
             width=100,
             command=self.save_image,
             fg_color="transparent",
@@ -983,7 +1354,7 @@ class GeminiManagementApp(ctk.CTk):
         
         folder_btn = ctk.CTkButton(
             preview_header,
-            text=f"{ICONS['folder']}  Folder",
+            text=LABELS['folder'],
             width=100,
             command=self.open_images_folder,
             fg_color="transparent",
@@ -994,7 +1365,7 @@ class GeminiManagementApp(ctk.CTk):
         self.image_preview = ctk.CTkLabel(
             right_panel,
             text="Generated image will appear here",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             text_color="gray"
         )
         self.image_preview.grid(row=1, column=0, sticky="nsew", padx=20, pady=(0, 20))
@@ -1003,20 +1374,7 @@ class GeminiManagementApp(ctk.CTk):
     
     def create_video_tab(self):
         """Create video generation tab"""
-        frame = ctk.CTkFrame(self.main_container)
-        frame.grid_rowconfigure(1, weight=1)
-        frame.grid_columnconfigure(0, weight=1)
-        
-        # Header
-        header = ctk.CTkFrame(frame, height=60, corner_radius=0, fg_color="transparent")
-        header.grid(row=0, column=0, sticky="ew")
-        
-        title = ctk.CTkLabel(
-            header,
-            text="🎬 Video Generation",
-            font=ctk.CTkFont(size=24, weight="bold")
-        )
-        title.grid(row=0, column=0, padx=30, pady=15, sticky="w")
+        frame, _ = self.create_tab_frame("🎬 Video Generation")
         
         # Content
         content = ctk.CTkFrame(frame)
@@ -1032,29 +1390,29 @@ class GeminiManagementApp(ctk.CTk):
         ctk.CTkLabel(
             left_panel,
             text="Enter your prompt:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         ).pack(padx=20, pady=(20, 10), anchor="w")
         
         self.video_prompt = ctk.CTkTextbox(
             left_panel,
             height=200,
-            font=ctk.CTkFont(size=13)
+            font=_font(13)
         )
         self.video_prompt.pack(padx=20, pady=10, fill="both", expand=True)
         
         self.video_generate_btn = ctk.CTkButton(
             left_panel,
-            text=f"{ICONS['video']}  Generate Video",
+            text=LABELS['generate_video'],
             command=self.generate_video,
             height=50,
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         )
         self.video_generate_btn.pack(padx=20, pady=20, fill="x")
         
         self.video_loading_label = ctk.CTkLabel(
             left_panel,
             text="",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color="gray"
         )
         self.video_loading_label.pack(padx=20, pady=(0, 10))
@@ -1072,12 +1430,12 @@ class GeminiManagementApp(ctk.CTk):
         ctk.CTkLabel(
             preview_header,
             text="Video Preview:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         ).grid(row=0, column=0, sticky="w")
         
         open_btn = ctk.CTkButton(
             preview_header,
-            text=f"{ICONS['play']}  Play",
+            text=LABELS['play'],
             width=100,
             command=self.open_video,
             fg_color="transparent",
@@ -1087,7 +1445,7 @@ class GeminiManagementApp(ctk.CTk):
         
         folder_btn = ctk.CTkButton(
             preview_header,
-            text=f"{ICONS['folder']}  Folder",
+            text=LABELS['folder'],
             width=120,
             command=self.open_videos_folder,
             fg_color="transparent",
@@ -1103,21 +1461,22 @@ class GeminiManagementApp(ctk.CTk):
         self.video_thumbnail = ctk.CTkLabel(
             video_preview_container,
             text="🎬 Video preview will appear here",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             text_color="gray"
         )
         self.video_thumbnail.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
         self.video_thumbnail.bind("<Button-1>", lambda e: self.open_video())
         
-        self.video_info = ctk.CTkTextbox(
+        # Display-only: a wrapped label instead of a disabled textbox
+        self.video_info = ctk.CTkLabel(
             video_preview_container,
-            height=100,
-            font=ctk.CTkFont(size=11),
-            wrap="word"
+            text="Video info will appear here",
+            font=_font(11),
+            wraplength=500,
+            justify="left",
+            anchor="nw"
         )
         self.video_info.grid(row=1, column=0, sticky="ew", padx=10, pady=(0, 10))
-        self.video_info.insert("1.0", "Video info will appear here")
-        self.video_info.configure(state="disabled")
         
         return frame
     
@@ -1135,21 +1494,21 @@ class GeminiManagementApp(ctk.CTk):
         title = ctk.CTkLabel(
             header,
             text="🖼️ Media Gallery",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=_font(24, "bold")
         )
         title.grid(row=0, column=0, sticky="w", padx=30, pady=(20, 0))
         
         subtitle = ctk.CTkLabel(
             header,
             text="Browse generated images and videos",
-            font=ctk.CTkFont(size=13),
+            font=_font(13),
             text_color="gray"
         )
         subtitle.grid(row=1, column=0, sticky="w", padx=30, pady=(5, 10))
         
         refresh_btn = ctk.CTkButton(
             header,
-            text=f"{ICONS['refresh']}  Refresh",
+            text=LABELS['refresh'],
             width=120,
             command=self.refresh_gallery,
             fg_color="transparent",
@@ -1180,14 +1539,23 @@ class GeminiManagementApp(ctk.CTk):
         # Gallery container with scrollable frame
         gallery_container = ctk.CTkScrollableFrame(content, fg_color="transparent")
         gallery_container.grid(row=1, column=0, sticky="nsew", padx=20, pady=20)
+        gallery_container.grid_columnconfigure(0, weight=1)
         
         self.gallery_grid = gallery_container
+        self._gallery_media = []
+        self._gallery_media_type = "images"
+        self._gallery_rows = []  # one fixed-height placeholder frame per grid row
+        self._gallery_built = {}  # row index -> cards currently materialized in that row
+        self._gallery_viewport_job = None
+        
+        # Chain the canvas scroll callback: fires on wheel, scrollbar drag and resize alike
+        gallery_container._parent_canvas.configure(yscrollcommand=self._on_gallery_scroll)
         
         # Status label
         self.gallery_status = ctk.CTkLabel(
             content,
             text="Loading media files...",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color="gray"
         )
         self.gallery_status.grid(row=2, column=0, padx=30, pady=(0, 20))
@@ -1199,43 +1567,10 @@ class GeminiManagementApp(ctk.CTk):
     
     def create_accounts_tab(self):
         """Create accounts management tab"""
-        frame = ctk.CTkFrame(self.main_container)
-        frame.grid_rowconfigure(1, weight=1)
-        frame.grid_columnconfigure(0, weight=1)
-        
-        # Header
-        header = ctk.CTkFrame(frame, height=60, corner_radius=0, fg_color="transparent")
-        header.grid(row=0, column=0, sticky="ew")
-        header.grid_columnconfigure(0, weight=1)
-        
-        title = ctk.CTkLabel(
-            header,
-            text="👥 Account Management",
-            font=ctk.CTkFont(size=24, weight="bold")
-        )
-        title.grid(row=0, column=0, padx=30, pady=15, sticky="w")
-        
-        button_frame = ctk.CTkFrame(header, fg_color="transparent")
-        button_frame.grid(row=0, column=1, padx=30, pady=15)
-        
-        add_btn = ctk.CTkButton(
-            button_frame,
-            text="➕ Add Account",
-            width=140,
-            command=self.show_add_account_dialog,
-            fg_color="#4CAF50"
-        )
-        add_btn.pack(side="left", padx=5)
-        
-        refresh_btn = ctk.CTkButton(
-            button_frame,
-            text=f"{ICONS['refresh']}  Refresh",
-            width=100,
-            command=self.refresh_accounts,
-            fg_color="transparent",
-            border_width=2
-        )
-        refresh_btn.pack(side="left", padx=5)
+        frame, _ = self.create_tab_frame("👥 Account Management", [
+            dict(text="➕ Add Account", width=140, command=self.show_add_account_dialog, fg_color="#4CAF50"),
+            dict(text=LABELS['refresh'], width=100, command=self.refresh_accounts, **self.OUTLINE_BUTTON),
+        ])
         
         # Accounts list container
         list_container = ctk.CTkFrame(frame)
@@ -1257,7 +1592,7 @@ class GeminiManagementApp(ctk.CTk):
             lbl = ctk.CTkLabel(
                 header_frame,
                 text=text,
-                font=ctk.CTkFont(size=13, weight="bold")
+                font=_font(13, "bold")
             )
             lbl.grid(row=0, column=idx, padx=10, pady=10, sticky="w")
             if weight:
@@ -1267,43 +1602,10 @@ class GeminiManagementApp(ctk.CTk):
     
     def create_settings_tab(self):
         """Create settings tab"""
-        frame = ctk.CTkFrame(self.main_container)
-        frame.grid_rowconfigure(1, weight=1)
-        frame.grid_columnconfigure(0, weight=1)
-        
-        # Header
-        header = ctk.CTkFrame(frame, height=60, corner_radius=0, fg_color="transparent")
-        header.grid(row=0, column=0, sticky="ew")
-        header.grid_columnconfigure(0, weight=1)
-        
-        title = ctk.CTkLabel(
-            header,
-            text="⚙️ Settings",
-            font=ctk.CTkFont(size=24, weight="bold")
-        )
-        title.grid(row=0, column=0, padx=30, pady=15, sticky="w")
-        
-        button_frame = ctk.CTkFrame(header, fg_color="transparent")
-        button_frame.grid(row=0, column=1, padx=30, pady=15)
-        
-        load_btn = ctk.CTkButton(
-            button_frame,
-            text=f"{ICONS['refresh']}  Load Settings",
-            width=140,
-            command=self.load_settings,
-            fg_color="transparent",
-            border_width=2
-        )
-        load_btn.pack(side="left", padx=5)
-        
-        save_btn = ctk.CTkButton(
-            button_frame,
-            text=f"{ICONS['save']}  Save Settings",
-            width=140,
-            command=self.save_settings,
-            fg_color="#4CAF50"
-        )
-        save_btn.pack(side="left", padx=5)
+        frame, _ = self.create_tab_frame("⚙️ Settings", [
+            dict(text=LABELS['load_settings'], width=140, command=self.load_settings, **self.OUTLINE_BUTTON),
+            dict(text=LABELS['save_settings'], width=140, command=self.save_settings, fg_color="#4CAF50"),
+        ])
         
         # Settings container
         settings_container = ctk.CTkScrollableFrame(frame)
@@ -1405,16 +1707,18 @@ class GeminiManagementApp(ctk.CTk):
     
     def create_settings_section(self, parent, title, fields, row):
         """Create a settings section"""
+        # Build every widget first and place them in one pass at the end; the section is attached
+        # to the (scrollable) parent last, so the container is laid out once instead of per child
         section_frame = ctk.CTkFrame(parent)
-        section_frame.grid(row=row, column=0, sticky="ew", padx=10, pady=10)
         section_frame.grid_columnconfigure(1, weight=1)
+        placements = []
         
         title_label = ctk.CTkLabel(
             section_frame,
             text=title,
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         )
-        title_label.grid(row=0, column=0, columnspan=2, padx=20, pady=(15, 10), sticky="w")
+        placements.append((title_label, dict(row=0, column=0, columnspan=2, padx=20, pady=(15, 10), sticky="w")))
         
         for idx, field_info in enumerate(fields):
             if len(field_info) == 4:
@@ -1428,18 +1732,17 @@ class GeminiManagementApp(ctk.CTk):
                 info_label = ctk.CTkLabel(
                     section_frame,
                     text="ℹ️ " + label,
-                    font=ctk.CTkFont(size=12),
+                    font=_font(12),
                     text_color="gray"
                 )
-                info_label.grid(row=idx+1, column=0, columnspan=2, padx=20, pady=8, sticky="w")
+                placements.append((info_label, dict(row=idx+1, column=0, columnspan=2, padx=20, pady=8, sticky="w")))
                 continue
             
             lbl = ctk.CTkLabel(
                 section_frame,
                 text=label + ":",
-                font=ctk.CTkFont(size=13)
+                font=_font(13)
             )
-            lbl.grid(row=idx+1, column=0, padx=20, pady=8, sticky="nw")
             
             if field_type == "entry":
                 widget = ctk.CTkEntry(section_frame, width=400)
@@ -1455,10 +1758,16 @@ class GeminiManagementApp(ctk.CTk):
                 widget.insert("1.0", str(default))
             else:
                 # Unknown field type, skip
+                lbl.destroy()
                 continue
             
-            widget.grid(row=idx+1, column=1, padx=20, pady=8, sticky="w")
+            placements.append((lbl, dict(row=idx+1, column=0, padx=20, pady=8, sticky="nw")))
+            placements.append((widget, dict(row=idx+1, column=1, padx=20, pady=8, sticky="w")))
             self.settings_widgets[key] = (widget, field_type)
+        
+        for widget, grid_kwargs in placements:
+            widget.grid(**grid_kwargs)
+        section_frame.grid(row=row, column=0, sticky="ew", padx=10, pady=10)
     
     def create_generator_email_section(self, parent, row):
         """Create Generator.Email domain management section"""
@@ -1470,7 +1779,7 @@ class GeminiManagementApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             section_frame,
             text="📧 GENERATOR.EMAIL - Domain Management",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         )
         title_label.grid(row=0, column=0, columnspan=2, padx=20, pady=(15, 10), sticky="w")
         
@@ -1478,16 +1787,20 @@ class GeminiManagementApp(ctk.CTk):
         info_label = ctk.CTkLabel(
             section_frame,
             text="Manage generator.email domains for account registration",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color="gray"
         )
         info_label.grid(row=1, column=0, columnspan=2, padx=20, pady=(0, 10), sticky="w")
         
-        # Domains list (readonly textbox)
-        self.domains_textbox = ctk.CTkTextbox(section_frame, width=500, height=120)
-        self.domains_textbox.grid(row=2, column=0, columnspan=2, padx=20, pady=10, sticky="ew")
-        self.domains_textbox.insert("1.0", "Loading domains...")
-        self.domains_textbox.configure(state="disabled")
+        # Domains list (display-only label)
+        self.domains_label = ctk.CTkLabel(
+            section_frame,
+            text="Loading domains...",
+            wraplength=480,
+            justify="left",
+            anchor="nw"
+        )
+        self.domains_label.grid(row=2, column=0, columnspan=2, padx=20, pady=10, sticky="ew")
         
         # Buttons frame
         buttons_frame = ctk.CTkFrame(section_frame, fg_color="transparent")
@@ -1538,7 +1851,7 @@ class GeminiManagementApp(ctk.CTk):
         title = ctk.CTkLabel(
             header,
             text="📈 System Monitor",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=_font(24, "bold")
         )
         title.grid(row=0, column=0, padx=30, pady=15, sticky="w")
         
@@ -1553,7 +1866,7 @@ class GeminiManagementApp(ctk.CTk):
         
         refresh_btn = ctk.CTkButton(
             header,
-            text=f"{ICONS['refresh']}  Refresh",
+            text=LABELS['refresh'],
             width=100,
             command=self.refresh_monitor,
             fg_color="transparent",
@@ -1574,13 +1887,14 @@ class GeminiManagementApp(ctk.CTk):
         ctk.CTkLabel(
             health_frame,
             text="🏥 System Health",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         ).grid(row=0, column=0, columnspan=2, padx=20, pady=(15, 10), sticky="w")
         
+        self.health_status_var = tk.StringVar(value="Status: Checking...")
         self.health_status_label = ctk.CTkLabel(
             health_frame,
-            text="Status: Checking...",
-            font=ctk.CTkFont(size=14)
+            textvariable=self.health_status_var,
+            font=_font(14)
         )
         self.health_status_label.grid(row=1, column=0, columnspan=2, padx=20, pady=10, sticky="w")
         
@@ -1592,13 +1906,13 @@ class GeminiManagementApp(ctk.CTk):
         ctk.CTkLabel(
             accounts_health_frame,
             text="👥 Accounts Health",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         ).grid(row=0, column=0, padx=20, pady=(15, 10), sticky="w")
         
         self.accounts_health_list = ctk.CTkTextbox(
             accounts_health_frame,
             height=300,
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         self.accounts_health_list.grid(row=1, column=0, padx=20, pady=(0, 15), sticky="ew")
         
@@ -1606,44 +1920,12 @@ class GeminiManagementApp(ctk.CTk):
     
     def create_logs_tab(self):
         """Create logs viewer tab"""
-        frame = ctk.CTkFrame(self.main_container)
-        frame.grid_rowconfigure(1, weight=1)
-        frame.grid_columnconfigure(0, weight=1)
-        
-        # Header
-        header = ctk.CTkFrame(frame, height=60, corner_radius=0, fg_color="transparent")
-        header.grid(row=0, column=0, sticky="ew")
-        header.grid_columnconfigure(0, weight=1)
-        
-        title = ctk.CTkLabel(
-            header,
-            text="📝 Logs",
-            font=ctk.CTkFont(size=24, weight="bold")
-        )
-        title.grid(row=0, column=0, padx=30, pady=15, sticky="w")
-        
-        button_frame = ctk.CTkFrame(header, fg_color="transparent")
-        button_frame.grid(row=0, column=1, padx=30, pady=15)
-        
-        refresh_btn = ctk.CTkButton(
-            button_frame,
-            text=f"{ICONS['refresh']}  Refresh",
-            width=100,
-            command=self.refresh_logs,
-            fg_color="transparent",
-            border_width=2
-        )
-        refresh_btn.pack(side="left", padx=5)
-        
-        clear_btn = ctk.CTkButton(
-            button_frame,
-            text="🗑️ Clear",
-            width=100,
-            command=self.clear_logs_display,
-            fg_color="transparent",
-            border_width=2
-        )
-        clear_btn.pack(side="left", padx=5)
+        frame, (_, self.logs_older_btn, _) = self.create_tab_frame("📝 Logs", [
+            dict(text=LABELS['refresh'], width=100, command=self.refresh_logs, **self.OUTLINE_BUTTON),
+            dict(text=LABELS['older'], width=100, command=self.load_older_logs,
+                 state="disabled", **self.OUTLINE_BUTTON),
+            dict(text="🗑️ Clear", width=100, command=self.clear_logs_display, **self.OUTLINE_BUTTON),
+        ])
         
         # Logs display
         logs_container = ctk.CTkFrame(frame)
@@ -1651,21 +1933,19 @@ class GeminiManagementApp(ctk.CTk):
         logs_container.grid_rowconfigure(0, weight=1)
         logs_container.grid_columnconfigure(0, weight=1)
         
-        self.logs_display = ctk.CTkTextbox(
-            logs_container,
-            font=ctk.CTkFont(family="Courier", size=11),
-            wrap="none"
-        )
-        self.logs_display.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+        logs_box, self.logs_display = self.create_plain_text(logs_container, wrap="none")
+        logs_box.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
         
         return frame
     
     def show_tab(self, tab_name):
         """Switch tabs"""
-        # Hide all tabs
-        for frame in [self.dashboard_frame, self.chat_frame, self.image_frame, 
-                     self.video_frame, self.gallery_frame, self.accounts_frame, 
-                     self.settings_frame, self.monitor_frame, self.logs_frame]:
+        if tab_name not in self._tab_factories:
+            return
+        self._active_tab = tab_name
+        
+        # Hide all tabs built so far
+        for frame in self._tabs.values():
             frame.grid_forget()
         
         # Update button colors
@@ -1675,48 +1955,67 @@ class GeminiManagementApp(ctk.CTk):
             else:
                 btn.configure(fg_color="transparent")
         
-        # Show selected tab
-        tab_map = {
-            "dashboard": self.dashboard_frame,
-            "chat": self.chat_frame,
-            "image": self.image_frame,
-            "video": self.video_frame,
-            "gallery": self.gallery_frame,
-            "accounts": self.accounts_frame,
-            "settings": self.settings_frame,
-            "monitor": self.monitor_frame,
-            "logs": self.logs_frame,
-        }
-        
-        if tab_name in tab_map:
-            tab_map[tab_name].grid(row=0, column=0, sticky="nsew")
-            
-            # Load data when switching to certain tabs
-            if tab_name == "accounts":
-                self.refresh_accounts()
-            elif tab_name == "settings":
-                self.load_settings()
-            elif tab_name == "monitor":
-                self.refresh_monitor()
-            elif tab_name == "logs":
-                self.refresh_logs()
-            elif tab_name == "gallery":
-                self.refresh_gallery()
-            elif tab_name == "dashboard":
-                self.refresh_dashboard()
+        # Show selected tab (build it on first visit)
+        if tab_name not in self._tabs:
+            self._tabs[tab_name] = self._tab_factories[tab_name]()
+        self._tabs[tab_name].grid(row=0, column=0, sticky="nsew")
+        
+        # Load data when switching to certain tabs
+        if tab_name == "accounts":
+            self.refresh_accounts()
+        elif tab_name == "settings":
+            self.load_settings()
+        elif tab_name == "monitor":
+            self.refresh_monitor()
+        elif tab_name == "logs":
+            self.refresh_logs()
+        elif tab_name == "gallery":
+            self.refresh_gallery()
+        elif tab_name == "dashboard":
+            self.refresh_dashboard()
     
     # Dashboard methods
+    # Refresh scheduling
+    def _schedule_refresh(self, name, worker, single_flight=False):
+        """Coalesce triggers within 50ms into one run; a newer run supersedes older ones"""
+        prev = self._pending_refresh.pop(name, None)
+        if prev is not None:
+            self.after_cancel(prev)
+        self._pending_refresh[name] = self.after(50, self._start_refresh, name, worker, single_flight)
+    
+    def _start_refresh(self, name, worker, single_flight):
+        self._pending_refresh.pop(name, None)
+        if single_flight:
+            if name in self._refresh_inflight:
+                return
+            self._refresh_inflight.add(name)
+        generation = self._refresh_gen.get(name, 0) + 1
+        self._refresh_gen[name] = generation
+        self._io_pool.submit(self._run_refresh, name, worker, generation)
+    
+    def _run_refresh(self, name, worker, generation):
+        try:
+            worker(generation)
+        finally:
+            # Reset on the Tk thread, after the worker's UI update has been queued
+            self.after(0, self._refresh_inflight.discard, name)
+    
+    def _apply_refresh(self, name, generation, update, *args):
+        """Tk thread: apply a refresh result only if no newer refresh has started since"""
+        if self._refresh_gen.get(name) == generation:
+            update(*args)
+    
     def refresh_dashboard(self):
         """Refresh dashboard data"""
         if not self.api_client.logged_in:
             return
-        threading.Thread(target=self._refresh_dashboard_thread, daemon=True).start()
+        self._schedule_refresh("dashboard", self._refresh_dashboard_thread, single_flight=True)
     
-    def _refresh_dashboard_thread(self):
+    def _refresh_dashboard_thread(self, generation):
         """Refresh dashboard in background"""
         try:
             stats = self.api_client.get_stats()
-            self.after(0, lambda: self.update_dashboard_stats(stats))
+            self.after(0, self._apply_refresh, "dashboard", generation, self.update_dashboard_stats, stats)
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 401:
                 print("Not authenticated. Please login first.")
@@ -1725,6 +2024,18 @@ class GeminiManagementApp(ctk.CTk):
         except Exception as e:
             print(f"Error refreshing dashboard: {e}")
     
+    def _changed(self, key, value):
+        """True (and remember value) if it differs from what was last written for key"""
+        if self._last_values.get(key) == value:
+            return False
+        self._last_values[key] = value
+        return True
+    
+    def _set_var(self, key, var, value):
+        """Set a StringVar only when the value actually changed"""
+        if self._changed(key, value):
+            var.set(value)
+    
     def update_dashboard_stats(self, stats):
         """Update dashboard stats"""
         # Update stat cards
@@ -1738,15 +2049,9 @@ class GeminiManagementApp(ctk.CTk):
             active_accounts = stats.get("active_accounts", 0)
             failed_accounts = stats.get("failed_accounts", 0)
 
-        self.stats_cards["total_accounts"].value_label.configure(
-            text=str(total_accounts)
-        )
-        self.stats_cards["active_accounts"].value_label.configure(
-            text=str(active_accounts)
-        )
-        self.stats_cards["failed_accounts"].value_label.configure(
-            text=str(failed_accounts)
-        )
+        self._set_var("card:total_accounts", self.stats_cards["total_accounts"].var, str(total_accounts))
+        self._set_var("card:active_accounts", self.stats_cards["active_accounts"].var, str(active_accounts))
+        self._set_var("card:failed_accounts", self.stats_cards["failed_accounts"].var, str(failed_accounts))
 
         if "requests" in stats:
             req_stats = stats["requests"]
@@ -1754,9 +2059,7 @@ class GeminiManagementApp(ctk.CTk):
         else:
             total_requests = stats.get("success_count", 0) + stats.get("failed_count", 0)
 
-        self.stats_cards["total_requests"].value_label.configure(
-            text=str(total_requests)
-        )
+        self._set_var("card:total_requests", self.stats_cards["total_requests"].var, str(total_requests))
         
         # Update activity
         activity_text = "Recent Activity:\n\n"
@@ -1769,8 +2072,10 @@ class GeminiManagementApp(ctk.CTk):
         else:
             activity_text += "No recent activity"
         
-        self.activity_text.delete("1.0", "end")
-        self.activity_text.insert("1.0", activity_text)
+        if self._changed("activity", activity_text):
+            self.activity_text.delete("1.0", "end")
+            self.activity_text.insert("1.0", activity_text)
+            self._trim_text(self.activity_text)
     
     # Chat methods
     def send_chat(self):
@@ -1786,26 +2091,99 @@ class GeminiManagementApp(ctk.CTk):
         self.chat_display.insert("end", "🤖 AI: Thinking...\n")
         
         def process():
+            started = False
             try:
-                response = self.api_client.chat_completion(
+                # Stream deltas: first token shows up after one RTT instead of full generation
+                for text in self.api_client.stream_chat_completion(
                     "gemini-2.0-flash-exp",
                     [{"role": "user", "content": message}]
-                )
-                content = response['choices'][0]['message']['content']
-                self.after(0, lambda: self._update_chat_response(content))
+                ):
+                    if not started:
+                        started = True
+                        self.after(0, self._begin_chat_stream)
+                    self._chat_buf.append(text)
+                if started:
+                    self.after(0, self._finish_chat_response, "")
+                else:
+                    self.after(0, self._update_chat_response, "❌ Error: Empty response")
             except Exception as e:
-                self.after(0, lambda: self._update_chat_response(f"❌ Error: {str(e)}"))
+                error_text = f"❌ Error: {str(e)}"
+                if started:
+                    self.after(0, self._finish_chat_response, f"\n{error_text}")
+                else:
+                    self.after(0, self._update_chat_response, error_text)
         
         threading.Thread(target=process, daemon=True).start()
     
-    def _update_chat_response(self, content):
-        """Update chat with response"""
+    def _clear_thinking_line(self):
+        """Remove the 'Thinking...' placeholder if it is still the last line"""
         current = self.chat_display.get("1.0", "end")
         lines = current.split('\n')
-        if lines and "Thinking..." in lines[-2]:
+        if len(lines) >= 2 and "Thinking..." in lines[-2]:
             self.chat_display.delete("end-2l", "end")
-        
+    
+    def _begin_chat_stream(self):
+        """Drop the placeholder and start the periodic chat flusher"""
+        self._clear_thinking_line()
+        if self._chat_flush_job is None:
+            self._chat_flush_job = self.after(80, self._flush_chat)
+    
+    def _write_chat_buf(self):
+        """Insert all buffered deltas in one go (one redraw per tick instead of per token)"""
+        n = len(self._chat_buf)
+        if n:
+            self.chat_display.insert("end", "".join(self._chat_buf[:n]))
+            del self._chat_buf[:n]
+            self._trim_text(self.chat_display)
+            self.chat_display.see("end")
+    
+    def _bulk_update(self, container, build):
+        """Run build() with the (scrollable) container detached from layout, then re-attach it once"""
+        outer = getattr(container, "_parent_frame", container)  # CTkScrollableFrame's outer frame
+        grid_info = outer.grid_info() if outer.winfo_manager() == "grid" else None
+        if grid_info:
+            grid_info.pop("in", None)
+            outer.grid_forget()
+        try:
+            build()
+        finally:
+            if grid_info:
+                # Plain Tk grid: grid_info() is already DPI-scaled, CTk's grid() would scale it again
+                tk.Grid.grid_configure(outer, **grid_info)
+    
+    def _trim_text(self, widget, max_lines=MAX_TEXT_LINES):
+        """Drop the oldest lines so a text widget never grows past max_lines"""
+        n = int(widget.index("end-1c").split(".")[0])
+        if n > max_lines:
+            read_only = widget.cget("state") == "disabled"
+            if read_only:
+                widget.configure(state="normal")
+            widget.delete("1.0", f"{n - max_lines + 1}.0")
+            if read_only:
+                widget.configure(state="disabled")
+    
+    def _flush_chat(self):
+        """Periodic flusher while a reply is streaming"""
+        self._write_chat_buf()
+        self._chat_flush_job = self.after(80, self._flush_chat)
+    
+    def _stop_chat_flush(self):
+        """Cancel the flusher and write out whatever is still buffered"""
+        if self._chat_flush_job is not None:
+            self.after_cancel(self._chat_flush_job)
+            self._chat_flush_job = None
+        self._write_chat_buf()
+    
+    def _update_chat_response(self, content):
+        """Update chat with response"""
+        self._clear_thinking_line()
+        self._finish_chat_response(content)
+    
+    def _finish_chat_response(self, content):
+        """Close the current answer and re-enable input"""
+        self._stop_chat_flush()
         self.chat_display.insert("end", f"{content}\n\n")
+        self._trim_text(self.chat_display)
         self.chat_display.see("end")
         self.chat_input.configure(state="normal")
         self.chat_input.focus()
@@ -1862,7 +2240,7 @@ class GeminiManagementApp(ctk.CTk):
     
     def _update_image_preview(self, photo, text):
         """Update image preview"""
-        self.image_generate_btn.configure(state="normal", text=f"{ICONS['image']}  Generate Image")
+        self.image_generate_btn.configure(state="normal", text=LABELS['generate_image'])
         self.image_loading_label.configure(text="")
         
         if photo:
@@ -1915,10 +2293,7 @@ class GeminiManagementApp(ctk.CTk):
         self.video_generate_btn.configure(state="disabled", text="⏳ Generating...")
         self.video_loading_label.configure(text="⏳ Please wait (3-5 minutes)...")
         self.video_thumbnail.configure(text="⏳ Generating...", image=None)
-        self.video_info.configure(state="normal")
-        self.video_info.delete("1.0", "end")
-        self.video_info.insert("1.0", "Processing...")
-        self.video_info.configure(state="disabled")
+        self._set_info(self.video_info, "Processing...")
         
         def process():
             try:
@@ -1961,7 +2336,7 @@ class GeminiManagementApp(ctk.CTk):
     
     def _update_video_preview(self, content):
         """Update video preview"""
-        self.video_generate_btn.configure(state="normal", text=f"{ICONS['video']}  Generate Video")
+        self.video_generate_btn.configure(state="normal", text=LABELS['generate_video'])
         self.video_loading_label.configure(text="✅ Generated!")
         
         video_url = None
@@ -1986,15 +2361,12 @@ class GeminiManagementApp(ctk.CTk):
         else:
             self.video_thumbnail.configure(text="✅ Generated\n(No preview)", image=None)
         
-        self.video_info.configure(state="normal")
-        self.video_info.delete("1.0", "end")
-        
         if video_url:
-            self.video_info.insert("1.0", f"✅ Video Generated!\n\n🔗 URL: {video_url}\n\n💡 Click thumbnail to play")
+            self._set_info(self.video_info, f"✅ Video Generated!\n\n🔗 URL: {video_url}\n\n💡 Click thumbnail to play")
         else:
-            self.video_info.insert("1.0", f"Response:\n\n{content}")
-        
-        self.video_info.configure(state="disabled")
+            # Label does not scroll: keep long raw responses to a readable preview
+            preview = content if len(content) <= 500 else content[:500] + "..."
+            self._set_info(self.video_info, f"Response:\n\n{preview}")
     
     def open_video(self):
         """Open video di pemutar default atau browser"""
@@ -2059,29 +2431,37 @@ class GeminiManagementApp(ctk.CTk):
     # Account management methods
     def refresh_accounts(self):
         """Refresh accounts list"""
-        threading.Thread(target=self._refresh_accounts_thread, daemon=True).start()
+        self._schedule_refresh("accounts", self._refresh_accounts_thread)
     
-    def _refresh_accounts_thread(self):
+    def _refresh_accounts_thread(self, generation):
         """Refresh accounts in background"""
         try:
             accounts = self.api_client.get_accounts()
-            self.after(0, lambda: self.update_accounts_list(accounts))
+            self.after(0, self._apply_refresh, "accounts", generation, self.update_accounts_list, accounts)
         except Exception as e:
             self.after(0, lambda: messagebox.showerror("Error", f"Failed to load accounts: {e}"))
     
     def update_accounts_list(self, accounts):
         """Update accounts list"""
+        self.accounts_data = accounts if isinstance(accounts, list) else accounts.get("accounts", [])
+        
+        # Tab not built yet: keep the data, it is rendered on first visit
+        if "accounts" not in self._tabs:
+            return
+        
+        self._bulk_update(self.accounts_list, self._build_accounts_rows)
+    
+    def _build_accounts_rows(self):
+        """(Re)create one row per account below the table header"""
         # Clear current list (except header)
         for widget in self.accounts_list.winfo_children()[1:]:
             widget.destroy()
         
-        self.accounts_data = accounts if isinstance(accounts, list) else accounts.get("accounts", [])
-        
         if not self.accounts_data:
             empty_label = ctk.CTkLabel(
                 self.accounts_list,
                 text="No accounts found. Click 'Add Account' to get started.",
-                font=ctk.CTkFont(size=13),
+                font=_font(13),
                 text_color="gray"
             )
             empty_label.grid(row=1, column=0, pady=50)
@@ -2097,7 +2477,7 @@ class GeminiManagementApp(ctk.CTk):
             email_label = ctk.CTkLabel(
                 account_frame,
                 text=email,
-                font=ctk.CTkFont(size=12),
+                font=_font(12),
                 anchor="w"
             )
             email_label.grid(row=0, column=1, padx=10, pady=8, sticky="w")
@@ -2109,7 +2489,7 @@ class GeminiManagementApp(ctk.CTk):
             status_label = ctk.CTkLabel(
                 account_frame,
                 text=status_text,
-                font=ctk.CTkFont(size=11),
+                font=_font(11),
                 text_color=status_color
             )
             status_label.grid(row=0, column=0, padx=10, pady=8)
@@ -2119,7 +2499,7 @@ class GeminiManagementApp(ctk.CTk):
             type_label = ctk.CTkLabel(
                 account_frame,
                 text=acc_type,
-                font=ctk.CTkFont(size=11),
+                font=_font(11),
                 text_color="gray"
             )
             type_label.grid(row=0, column=2, padx=10, pady=8)
@@ -2170,7 +2550,7 @@ class GeminiManagementApp(ctk.CTk):
         ctk.CTkLabel(
             title_frame,
             text="Add New Account",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_font(20, "bold")
         ).pack()
         
         # Tabview for Manual and Auto-Register
@@ -2184,7 +2564,7 @@ class GeminiManagementApp(ctk.CTk):
         ctk.CTkLabel(
             tab_manual,
             text="Add account manually",
-            font=ctk.CTkFont(size=13),
+            font=_font(13),
             text_color="gray"
         ).pack(pady=(10, 20))
         
@@ -2233,7 +2613,7 @@ class GeminiManagementApp(ctk.CTk):
             width=200,
             height=40,
             command=save_manual_account,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         manual_btn.pack(pady=20)
         
@@ -2243,7 +2623,7 @@ class GeminiManagementApp(ctk.CTk):
         ctk.CTkLabel(
             tab_auto,
             text="Automatically create accounts with temporary email",
-            font=ctk.CTkFont(size=13),
+            font=_font(13),
             text_color="gray"
         ).pack(pady=(10, 20))
         
@@ -2259,14 +2639,14 @@ class GeminiManagementApp(ctk.CTk):
             text="📧 Using: Generator.Email (domains managed via API)",
             anchor="w",
             text_color="gray",
-            font=ctk.CTkFont(size=11)
+            font=_font(11)
         ).pack(anchor="w", padx=30, pady=(10, 5))
         
         # Status label
         auto_status_label = ctk.CTkLabel(
             tab_auto,
             text="",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color="gray"
         )
         auto_status_label.pack(pady=(10, 0))
@@ -2346,7 +2726,7 @@ class GeminiManagementApp(ctk.CTk):
             width=200,
             height=40,
             command=start_auto_register,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             fg_color="#FF6B35"
         )
         auto_btn.pack(pady=(10, 20))
@@ -2383,7 +2763,7 @@ class GeminiManagementApp(ctk.CTk):
     # Settings methods
     def load_settings(self):
         """Load settings"""
-        threading.Thread(target=self._load_settings_thread, daemon=True).start()
+        self._io_pool.submit(self._load_settings_thread)
     
     def _load_settings_thread(self):
         """Load settings in background"""
@@ -2555,7 +2935,7 @@ class GeminiManagementApp(ctk.CTk):
             }
             
             # Save via API
-            threading.Thread(target=self._save_settings_thread, args=(settings,), daemon=True).start()
+            self._io_pool.submit(self._save_settings_thread, settings)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to prepare settings: {e}")
             print(f"Error saving settings: {e}")
@@ -2575,7 +2955,7 @@ class GeminiManagementApp(ctk.CTk):
         if not self.api_client.logged_in:
             self._update_domains_display("Please login first to manage domains.")
             return
-        threading.Thread(target=self._load_domains_thread, daemon=True).start()
+        self._io_pool.submit(self._load_domains_thread)
     
     def _load_domains_thread(self):
         """Load domains in background"""
@@ -2603,11 +2983,12 @@ class GeminiManagementApp(ctk.CTk):
             self.after(0, lambda: self._update_domains_display(f"Error: {error_msg}"))
     
     def _update_domains_display(self, text):
-        """Update domains textbox"""
-        self.domains_textbox.configure(state="normal")
-        self.domains_textbox.delete("1.0", "end")
-        self.domains_textbox.insert("1.0", text)
-        self.domains_textbox.configure(state="disabled")
+        """Update domains list"""
+        self._set_info(self.domains_label, text)
+    
+    def _set_info(self, label, text):
+        """Set the text of a display-only info label"""
+        label.configure(text=text)
     
     def add_domain_dialog(self):
         """Show dialog to add new domain"""
@@ -2626,7 +3007,7 @@ class GeminiManagementApp(ctk.CTk):
     
     def add_domain(self, domain):
         """Add domain via API"""
-        threading.Thread(target=self._add_domain_thread, args=(domain,), daemon=True).start()
+        self._io_pool.submit(self._add_domain_thread, domain)
     
     def _add_domain_thread(self, domain):
         """Add domain in background"""
@@ -2669,7 +3050,7 @@ class GeminiManagementApp(ctk.CTk):
     
     def remove_domain(self, domain):
         """Remove domain via API"""
-        threading.Thread(target=self._remove_domain_thread, args=(domain,), daemon=True).start()
+        self._io_pool.submit(self._remove_domain_thread, domain)
     
     def _remove_domain_thread(self, domain):
         """Remove domain in background"""
@@ -2691,28 +3072,35 @@ class GeminiManagementApp(ctk.CTk):
     # Monitor methods
     def toggle_auto_refresh(self, enabled):
         """Toggle auto-refresh for monitor"""
+        self._auto_refresh = enabled
+        # Always drop the pending tick first so toggling never stacks two timer chains
+        if self._auto_after is not None:
+            self.after_cancel(self._auto_after)
+            self._auto_after = None
         if enabled:
-            self.auto_refresh_monitor()
-        else:
-            if hasattr(self, 'auto_refresh_job'):
-                self.after_cancel(self.auto_refresh_job)
+            self._tick_monitor()
     
-    def auto_refresh_monitor(self):
-        """Auto-refresh monitor every 5 seconds"""
-        self.refresh_monitor()
-        self.auto_refresh_job = self.after(5000, self.auto_refresh_monitor)
+    def _tick_monitor(self):
+        """Auto-refresh monitor every _auto_interval_ms (Tk timer, no sleeper thread)"""
+        self._auto_after = None
+        if not self._auto_refresh:
+            return
+        # Hidden tab: keep the timer but skip the fetch (show_tab refreshes it on return)
+        if self._active_tab == "monitor":
+            self.refresh_monitor()
+        self._auto_after = self.after(self._auto_interval_ms, self._tick_monitor)
     
     def refresh_monitor(self):
         """Refresh monitor data"""
-        threading.Thread(target=self._refresh_monitor_thread, daemon=True).start()
+        self._schedule_refresh("monitor", self._refresh_monitor_thread)
     
-    def _refresh_monitor_thread(self):
+    def _refresh_monitor_thread(self, generation):
         """Refresh monitor in background"""
         try:
             health = self.api_client.get_health()
             accounts = self.api_client.get_accounts()
             
-            self.after(0, lambda: self.update_monitor_display(health, accounts))
+            self.after(0, self._apply_refresh, "monitor", generation, self.update_monitor_display, health, accounts)
         except Exception as e:
             print(f"Error refreshing monitor: {e}")
     
@@ -2722,60 +3110,150 @@ class GeminiManagementApp(ctk.CTk):
         status = health.get("status", "unknown")
         status_text = f"Status: {status.upper()}"
         status_color = "green" if status == "healthy" else "red"
-        self.health_status_label.configure(text=status_text, text_color=status_color)
-        
-        # Update accounts health
-        self.accounts_health_list.delete("1.0", "end")
+        self._set_var("health_status", self.health_status_var, status_text)
+        if self._changed("health_color", status_color):
+            self.health_status_label.configure(text_color=status_color)
         
+        # Update accounts health (rewrite only when the list actually changed)
         accounts_list = accounts if isinstance(accounts, list) else accounts.get("accounts", [])
         
+        lines = []
         for account in accounts_list:
             email = account.get("email", "Unknown")
             is_active = account.get("is_active", False)
             status = "✅ Active" if is_active else "❌ Inactive"
             
-            self.accounts_health_list.insert("end", f"{status} - {email}\n")
+            lines.append(f"{status} - {email}\n")
+        health_text = "".join(lines)
+        if self._changed("accounts_health", health_text):
+            self.accounts_health_list.delete("1.0", "end")
+            self.accounts_health_list.insert("end", health_text)
     
     # Logs methods
     def refresh_logs(self):
         """Refresh logs"""
-        threading.Thread(target=self._refresh_logs_thread, daemon=True).start()
+        self._logs_generation += 1
+        self._logs_prefetched = None
+        self._io_pool.submit(self._refresh_logs_thread, self._logs_generation)
     
-    def _refresh_logs_thread(self):
+    def _refresh_logs_thread(self, generation):
         """Refresh logs in background"""
         try:
-            logs = self.api_client.get_logs(limit=100)
-            self.after(0, lambda: self.update_logs_display(logs))
+            logs = self.api_client.get_logs(limit=LOG_PAGE_SIZE)
+            self.after(0, self.update_logs_display, logs, generation)
         except Exception as e:
-            self.after(0, lambda: self.logs_display.insert("end", f"Error loading logs: {e}\n"))
+            self.after(0, self._append_log_line, f"Error loading logs: {e}\n")
+            return
+        if len(self._logs_list(logs)) >= LOG_PAGE_SIZE:
+            self._prefetch_logs_page(generation, LOG_PAGE_SIZE)
     
-    def update_logs_display(self, logs):
+    def _prefetch_logs_page(self, generation, skip):
+        """Fetch the next older page (worker thread) so 'Older' shows it instantly"""
+        try:
+            logs = self.api_client.get_logs(limit=LOG_PAGE_SIZE, skip=skip)
+        except Exception:
+            return
+        if generation == self._logs_generation:
+            self._logs_prefetched = (skip, logs)
+    
+    @staticmethod
+    def _logs_list(logs):
+        return logs if isinstance(logs, list) else logs.get("logs", [])
+    
+    @staticmethod
+    def _format_log_lines(logs_list):
+        """Build the whole block first, then a single insert (one redraw instead of one per line)"""
+        lines = []
+        for log in logs_list:
+            timestamp = log.get("timestamp", "")
+            level = log.get("level", "INFO")
+            message = log.get("message", "")
+            
+            lines.append(f"[{timestamp}] {level}: {message}\n")
+        return "".join(lines)
+    
+    def update_logs_display(self, logs, generation=None):
         """Update logs display"""
+        if generation is None:
+            generation = self._logs_generation
+        elif generation != self._logs_generation:
+            return
         self.logs_display.delete("1.0", "end")
         
-        logs_list = logs if isinstance(logs, list) else logs.get("logs", [])
+        logs_list = self._logs_list(logs)
+        self._logs_next_skip = len(logs_list)
+        self._logs_has_more = len(logs_list) >= LOG_PAGE_SIZE
+        self.logs_older_btn.configure(state="normal" if self._logs_has_more else "disabled")
         
         if not logs_list:
             self.logs_display.insert("1.0", "No logs available")
             return
         
-        for log in logs_list:
-            timestamp = log.get("timestamp", "")
-            level = log.get("level", "INFO")
-            message = log.get("message", "")
-            
-            self.logs_display.insert("end", f"[{timestamp}] {level}: {message}\n")
+        # Responses are bounded by LOG_PAGE_SIZE, so one insert is cheap; still keep only what the cap retains
+        self.logs_display.insert("end", self._format_log_lines(logs_list[-MAX_TEXT_LINES:]))
+        self._trim_text(self.logs_display)
+        self.logs_display.see("end")
+    
+    def load_older_logs(self):
+        """Prepend the next older page (prefetched when possible), then prefetch the one after"""
+        if not self._logs_has_more:
+            return
+        skip = self._logs_next_skip
+        generation = self._logs_generation
+        prefetched = self._logs_prefetched
+        self._logs_prefetched = None
+        if prefetched and prefetched[0] == skip:
+            self._prepend_logs_page(generation, skip, prefetched[1])
+            return
+        
+        def fetch():
+            try:
+                logs = self.api_client.get_logs(limit=LOG_PAGE_SIZE, skip=skip)
+            except Exception as e:
+                self.after(0, self._append_log_line, f"Error loading logs: {e}\n")
+                return
+            self.after(0, self._prepend_logs_page, generation, skip, logs)
+        
+        self.logs_older_btn.configure(state="disabled")
+        self._io_pool.submit(fetch)
+    
+    def _prepend_logs_page(self, generation, skip, logs):
+        """Insert an older page above the current view"""
+        if generation != self._logs_generation or skip != self._logs_next_skip:
+            return
+        logs_list = self._logs_list(logs)
+        self._logs_next_skip = skip + len(logs_list)
+        lines_shown = int(self.logs_display.index("end-1c").split(".")[0])
+        self._logs_has_more = (
+            len(logs_list) >= LOG_PAGE_SIZE and lines_shown + len(logs_list) < MAX_TEXT_LINES
+        )
+        self.logs_older_btn.configure(state="normal" if self._logs_has_more else "disabled")
+        if logs_list:
+            self.logs_display.insert("1.0", self._format_log_lines(logs_list))
+            self.logs_display.see("1.0")
+        if self._logs_has_more:
+            self._io_pool.submit(self._prefetch_logs_page, generation, self._logs_next_skip)
+    
+    def _append_log_line(self, text):
+        """Append one line to the logs view, keeping scrollback bounded"""
+        self.logs_display.insert("end", text)
+        self._trim_text(self.logs_display)
     
     def clear_logs_display(self):
         """Clear logs display"""
+        # Stop paging / late responses that still target the old content
+        self._logs_generation += 1
+        self._logs_prefetched = None
+        self._logs_has_more = False
+        self.logs_older_btn.configure(state="disabled")
         self.logs_display.delete("1.0", "end")
     
     # Gallery methods
     def refresh_gallery(self):
         """Refresh gallery display"""
-        threading.Thread(target=self._refresh_gallery_thread, daemon=True).start()
+        self._schedule_refresh("gallery", self._refresh_gallery_thread)
     
-    def _refresh_gallery_thread(self):
+    def _refresh_gallery_thread(self, generation):
         """Refresh gallery in background"""
         try:
             # Get current tab (images or videos)
@@ -2805,49 +3283,100 @@ class GeminiManagementApp(ctk.CTk):
                 
                 # Sort by modified time (newest first)
                 media_files.sort(key=lambda x: x['modified'], reverse=True)
+                
+                # Decode the first screens of thumbnails here (cached); the rest load as they scroll into view
+                for media in media_files[:GALLERY_COLUMNS * 4]:
+                    try:
+                        load_thumbnail(media['filepath'], media['modified'])
+                    except Exception:
+                        pass
             
             # Update UI
-            self.after(0, lambda: self._update_gallery_display(media_files, current_tab))
+            self.after(0, self._apply_refresh, "gallery", generation, self._update_gallery_display, media_files, current_tab)
             
         except Exception as e:
             self.after(0, lambda: self.update_gallery_status(f"Error loading media: {e}", "red"))
     
     def _update_gallery_display(self, media_files, media_type):
         """Update gallery display with media files"""
+        self._bulk_update(self.gallery_grid, lambda: self._build_gallery_rows(media_files, media_type))
+    
+    def _build_gallery_rows(self, media_files, media_type):
+        """Reset the grid and lay out one placeholder row per GALLERY_COLUMNS items"""
         # Clear existing items
         for widget in self.gallery_grid.winfo_children():
             widget.destroy()
+        self._gallery_rows = []
+        self._gallery_built = {}
+        self._gallery_media = media_files
+        self._gallery_media_type = media_type
         
         if not media_files:
             no_media = ctk.CTkLabel(
                 self.gallery_grid,
                 text=f"No {media_type} found",
-                font=ctk.CTkFont(size=14),
+                font=_font(14),
                 text_color="gray"
             )
             no_media.pack(pady=50)
             self.update_gallery_status(f"No {media_type} found", "gray")
             return
         
-        # Create grid layout
-        columns = 3
-        for idx, media in enumerate(media_files):
-            row = idx // columns
-            col = idx % columns
-            
-            # Create media card
-            card = self.create_media_card(media, media_type)
-            card.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
+        # Lightweight placeholders for every row; cards are created only for visible rows
+        n_rows = -(-len(media_files) // GALLERY_COLUMNS)
+        for row in range(n_rows):
+            row_frame = ctk.CTkFrame(self.gallery_grid, height=GALLERY_ROW_HEIGHT, fg_color="transparent")
+            row_frame.grid(row=row, column=0, sticky="ew")
+            row_frame.grid_propagate(False)
+            row_frame.grid_rowconfigure(0, weight=1)
+            for col in range(GALLERY_COLUMNS):
+                row_frame.grid_columnconfigure(col, weight=1, uniform="gallery")
+            self._gallery_rows.append(row_frame)
         
-        # Configure grid weights
-        for col in range(columns):
-            self.gallery_grid.grid_columnconfigure(col, weight=1)
+        self.gallery_grid._parent_canvas.yview_moveto(0)
+        self.after_idle(self._update_gallery_viewport)
         
         self.update_gallery_status(f"Found {len(media_files)} {media_type}", "green")
     
-    def create_media_card(self, media, media_type):
+    def _on_gallery_scroll(self, first, last):
+        """Canvas yscrollcommand: keep the scrollbar in sync, then re-evaluate visible rows"""
+        self.gallery_grid._scrollbar.set(first, last)
+        if self._gallery_rows and self._gallery_viewport_job is None and self._active_tab == "gallery":
+            self._gallery_viewport_job = self.after(30, self._update_gallery_viewport)
+    
+    def _update_gallery_viewport(self):
+        """Materialize cards for rows in view (+buffer), release rows that scrolled away"""
+        self._gallery_viewport_job = None
+        n_rows = len(self._gallery_rows)
+        if not n_rows:
+            return
+        
+        canvas = self.gallery_grid._parent_canvas
+        top = canvas.yview()[0]
+        visible = canvas.winfo_height() // GALLERY_ROW_HEIGHT + 1
+        first = max(int(top * n_rows) - GALLERY_ROW_BUFFER, 0)
+        last = min(int(top * n_rows) + visible + GALLERY_ROW_BUFFER, n_rows - 1)
+        
+        for row in [r for r in self._gallery_built if r < first or r > last]:
+            for card in self._gallery_built.pop(row):
+                card.destroy()
+        
+        for row in range(first, last + 1):
+            if row in self._gallery_built:
+                continue
+            start = row * GALLERY_COLUMNS
+            cards = [
+                self.create_media_card(media, self._gallery_media_type, parent=self._gallery_rows[row])
+                for media in self._gallery_media[start:start + GALLERY_COLUMNS]
+            ]
+            # Place the whole row in one pass once all its cards exist
+            for col, card in enumerate(cards):
+                card.grid(row=0, column=col, padx=10, pady=10, sticky="nsew")
+            self._gallery_built[row] = cards
+    
+    def create_media_card(self, media, media_type, parent=None):
         """Create a card for media file"""
-        card = ctk.CTkFrame(self.gallery_grid, corner_radius=10, border_width=2)
+        card = ctk.CTkFrame(parent or self.gallery_grid, corner_radius=10, border_width=2)
         card.grid_rowconfigure(1, weight=1)
         card.grid_columnconfigure(0, weight=1)
         
@@ -2856,31 +3385,23 @@ class GeminiManagementApp(ctk.CTk):
         preview_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
         preview_frame.grid_propagate(False)
         
-        if media_type == "images":
-            # Load and display image thumbnail
-            try:
-                img = Image.open(media['filepath'])
-                img.thumbnail((280, 200))
-                photo = ctk.CTkImage(light_image=img, dark_image=img, size=(280, 200))
-                
-                preview_label = ctk.CTkLabel(preview_frame, image=photo, text="")
-                preview_label.image = photo  # Keep reference
-                preview_label.pack(fill="both", expand=True)
-            except Exception as e:
-                preview_label = ctk.CTkLabel(
-                    preview_frame,
-                    text=f"🖼️\nImage",
-                    font=ctk.CTkFont(size=14)
-                )
-                preview_label.pack(fill="both", expand=True)
+        # Placeholder now; the thumbnail (image, or a frame from the video) is decoded in the pool
+        preview_label = ctk.CTkLabel(
+            preview_frame,
+            text=f"🖼️\nImage" if media_type == "images" else f"🎬\nVideo",
+            font=_font(14)
+        )
+        preview_label.pack(fill="both", expand=True)
+        
+        thumb_key = (media['filepath'], media['modified'])
+        photo = self._thumb_cache.get(thumb_key)
+        if photo is not None:
+            self._thumb_cache.move_to_end(thumb_key)
+            preview_label.configure(image=photo, text="")
+            preview_label.image = photo  # Keep reference
         else:
-            # Video placeholder
-            preview_label = ctk.CTkLabel(
-                preview_frame,
-                text=f"🎬\nVideo",
-                font=ctk.CTkFont(size=14)
-            )
-            preview_label.pack(fill="both", expand=True)
+            future = self._thumb_pool.submit(load_thumbnail, *thumb_key)
+            future.add_done_callback(lambda f, label=preview_label, key=thumb_key: self._on_thumb_ready(label, key, f))
         
         # File info
         info_frame = ctk.CTkFrame(card, fg_color="transparent")
@@ -2889,7 +3410,7 @@ class GeminiManagementApp(ctk.CTk):
         filename_label = ctk.CTkLabel(
             info_frame,
             text=media['filename'][:30] + "..." if len(media['filename']) > 30 else media['filename'],
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             anchor="w"
         )
         filename_label.pack(fill="x", pady=(0, 2))
@@ -2911,7 +3432,7 @@ class GeminiManagementApp(ctk.CTk):
         size_label = ctk.CTkLabel(
             info_frame,
             text=f"{size_text} • {time_text}",
-            font=ctk.CTkFont(size=10),
+            font=_font(10),
             text_color="gray",
             anchor="w"
         )
@@ -2925,9 +3446,9 @@ class GeminiManagementApp(ctk.CTk):
         
         # Different button text for videos vs images
         if media_type == "videos":
-            btn_text = f"{ICONS['play']}  Play"
+            btn_text = LABELS['play']
         else:
-            btn_text = f"{ICONS['open']}  Open"
+            btn_text = LABELS['open']
         
         open_btn = ctk.CTkButton(
             btn_frame,
@@ -2941,7 +3462,7 @@ class GeminiManagementApp(ctk.CTk):
         
         folder_btn = ctk.CTkButton(
             btn_frame,
-            text=f"{ICONS['folder']}  Folder",
+            text=LABELS['folder'],
             command=lambda: self.open_media_folder(media['filepath']),
             height=30,
             fg_color="transparent",
@@ -2951,6 +3472,25 @@ class GeminiManagementApp(ctk.CTk):
         
         return card
     
+    def _on_thumb_ready(self, label, key, future):
+        """Pool thread: hand the decoded image to the Tk thread (keep the placeholder on failure)"""
+        if future.exception() is None:
+            self.after(0, self._install_thumb, label, key, future.result())
+    
+    def _install_thumb(self, label, key, img):
+        """Tk thread: wrap the decoded PIL image once (HighDPI-aware CTkImage, pre-sized) and show it"""
+        photo = self._thumb_cache.get(key)
+        if photo is None:
+            photo = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
+            self._thumb_cache[key] = photo
+            if len(self._thumb_cache) > THUMB_WIDGET_CACHE_SIZE:
+                self._thumb_cache.popitem(last=False)
+        # Card may have scrolled away meanwhile; the image stays cached for when it comes back
+        if not label.winfo_exists():
+            return
+        label.configure(image=photo, text="")
+        label.image = photo  # Keep reference
+    
     def on_gallery_tab_change(self, value):
         """Handle gallery tab change"""
         # Variable sudah di-set otomatis oleh CTkSegmentedButton
@@ -3001,6 +3541,7 @@ class GeminiManagementApp(ctk.CTk):
         if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
             self.api_client.logout()
             self.destroy()
+            _font.cache_clear()  # fonts belong to the destroyed Tk root
             # Restart app
             GeminiManagementApp().mainloop()
 
@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 import json
 from typing import Iterator, Dict, Any, Iterable, AsyncIterator
 from itertools import chain
@@ -253,3 +255,55 @@ async def parse_json_array_stream_async(line_iterator: AsyncIterator[str]) -> As
     if brace_level != 0:
         print(f": JSON， {brace_level}，。")
 
+
+_BUFFER_END = object()
+
+
+class _BufferFailure:
+    """Pembungkus exception dari producer agar tidak tertukar dengan item"""
+    __slots__ = ("exc",)
+
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+async def buffered_async_iter(source: AsyncIterator[Any], size: int = 16) -> AsyncIterator[Any]:
+    """
+    Jalankan async iterator sumber di task terpisah dengan antrean terbatas.
+
+    Producer terus membaca (mis. socket + parse JSON) selagi consumer memproses item,
+    sehingga kedua tahap saling tumpang tindih. Exception dari sumber diteruskan ke consumer.
+    Consumer wajib menutup generator ini (aclose) agar task producer dibatalkan.
+
+    Args:
+        source: async iterator sumber
+        size: jumlah item maksimum yang boleh menunggu di antrean
+
+    Yields:
+        Item dari sumber dengan urutan yang sama.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+
+    async def produce():
+        try:
+            async for item in source:
+                await queue.put(item)
+        except Exception as e:
+            await queue.put(_BufferFailure(e))
+            return
+        await queue.put(_BUFFER_END)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _BUFFER_END:
+                return
+            if isinstance(item, _BufferFailure):
+                raise item.exc
+            yield item
+    finally:
+        # tunggu producer benar-benar berhenti sebelum caller menutup response sumber
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer